@@ -0,0 +1 @@
+"""Scripts de benchmark do AG, executados sem interface gráfica (`python -m benchmarks.<nome>`)."""
@@ -0,0 +1,5 @@
+"""Funções compartilhadas pelos scripts de benchmark."""
+
+def best_cost(population):
+    """Custo (distância + penalidades) do melhor indivíduo da população (`Population` ou `ArrayPopulation`)."""
+    return 1 / population.stats.best_fitness - 1
@@ -0,0 +1,79 @@
+"""Compara uma execução com o orçamento inteiro de gerações com a mesma execução sob o `ConvergenceController`.
+
+Uso: `python -m benchmarks.convergence --num-points 50 --generations 2000 --seeds 3 --engine array`
+"""
+
+import argparse
+import json
+import random
+import time
+
+import numpy as np
+
+from benchmarks.common import best_cost
+from convergence import RESTART, STOP, ConvergenceController, restart_from_elite
+from ga_classes import ArrayPopulation, DistanceMatrix, Population
+from point_data import generate_points
+
+def run(engine, distance_matrix, population_size, mutation_rate, generations, seed, controller=None):
+    """Evolui até `generations` (ou até o controlador parar) e retorna custo final, gerações, tempo e reinícios."""
+    random.seed(seed)
+    np.random.seed(seed)
+    rng = np.random.default_rng(seed)
+    if engine == 'array':
+        population = ArrayPopulation(population_size, distance_matrix, rng=rng)
+    else:
+        population = Population(population_size, distance_matrix)
+    start = time.perf_counter()
+    generation = 0
+    while generation < generations:
+        rate = controller.mutation_rate(mutation_rate) if controller is not None else mutation_rate
+        population.evolve(rate, distance_matrix)
+        generation += 1
+        if controller is not None:
+            decision = controller.update(population.stats)
+            if decision == RESTART:
+                population = restart_from_elite(population, distance_matrix, controller.elite_size, rng)
+            elif decision == STOP:
+                break
+    return {
+        'cost': best_cost(population),
+        'generations': generation,
+        'seconds': time.perf_counter() - start,
+        'restarts': controller.restarts if controller is not None else 0,
+    }
+
+def main(argv=None):
+    """Roda as duas variantes em várias sementes e imprime a tabela de resultados."""
+    parser = argparse.ArgumentParser(description="Benchmark da parada antecipada e da mutação adaptativa.")
+    parser.add_argument('--num-points', type=int, default=50)
+    parser.add_argument('--population', type=int, default=50)
+    parser.add_argument('--mutation', type=float, default=0.05)
+    parser.add_argument('--generations', type=int, default=2000)
+    parser.add_argument('--engine', choices=['list', 'array'], default='array')
+    parser.add_argument('--patience', type=int, default=150)
+    parser.add_argument('--restarts', type=int, default=1)
+    parser.add_argument('--seeds', type=int, default=3)
+    parser.add_argument('--output', default=None, help="Arquivo JSON com os resultados.")
+    args = parser.parse_args(argv)
+
+    results = []
+    for seed in range(args.seeds):
+        random.seed(seed)
+        distance_matrix = DistanceMatrix(generate_points(args.num_points))
+        full = run(args.engine, distance_matrix, args.population, args.mutation, args.generations, seed)
+        controller = ConvergenceController(patience=args.patience, max_restarts=args.restarts)
+        early = run(args.engine, distance_matrix, args.population, args.mutation, args.generations, seed, controller)
+        results.append({'seed': seed, 'full': full, 'controlled': early})
+
+    print(f"{'semente':>7} {'custo_cheio':>11} {'tempo_cheio':>11} {'custo_ctrl':>10} {'tempo_ctrl':>10} {'ger_ctrl':>8} {'reinícios':>9}")
+    for r in results:
+        full, early = r['full'], r['controlled']
+        print(f"{r['seed']:>7} {full['cost']:>11.1f} {full['seconds']:>10.2f}s {early['cost']:>10.1f} "
+              f"{early['seconds']:>9.2f}s {early['generations']:>8} {early['restarts']:>9}")
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as f:
+            json.dump(results, f, indent=2)
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,196 @@
+"""Mede os caminhos críticos do AG em uma grade de tamanhos e compara o resultado com uma linha de base em JSON.
+
+Uso: `python -m benchmarks.hot_paths --points 10 50 200 500 --populations 50 200 1000 --output linha_de_base.json`
+e, depois de uma mudança, `python -m benchmarks.hot_paths --baseline linha_de_base.json` (código de saída 1
+se houver regressão).
+"""
+
+import argparse
+import json
+import platform
+import random
+import sys
+import time
+import tracemalloc
+
+import numpy as np
+
+from benchmarks.common import best_cost
+from ga_classes import ArrayPopulation, DistanceMatrix, Population, batch_fitness
+from point_data import generate_points
+
+DEFAULT_POINTS = [10, 50, 200, 500]
+DEFAULT_POPULATIONS = [50, 200, 1000]
+MEMORY_GENERATIONS = 20
+
+def create_case(engine, num_points, population_size, seed):
+    """Gera os pontos e a população inicial de um caso, com todas as sementes fixadas."""
+    random.seed(seed)
+    np.random.seed(seed)
+    distance_matrix = DistanceMatrix(generate_points(num_points))
+    if engine == 'array':
+        return distance_matrix, ArrayPopulation(population_size, distance_matrix, rng=np.random.default_rng(seed))
+    return distance_matrix, Population(population_size, distance_matrix)
+
+def calls_per_second(operation, min_time):
+    """Chama `operation` repetidamente por pelo menos `min_time` segundos (e no mínimo 3 vezes) e retorna chamadas/s."""
+    calls = 0
+    start = time.perf_counter()
+    elapsed = 0.0
+    while calls < 3 or elapsed < min_time:
+        operation()
+        calls += 1
+        elapsed = time.perf_counter() - start
+    return calls / elapsed
+
+def operations(engine, population, distance_matrix):
+    """Monta as operações medidas para uma população; retorna `{nome: (função, avaliações por chamada)}`."""
+    size = len(population) if engine == 'array' else len(population.population)
+    if engine == 'array':
+        parent = population.select_parent_tournament()
+        route = population.routes[parent].copy()
+        return {
+            'calculate_fitness': (lambda: batch_fitness(population.routes, distance_matrix), size),
+            'crossover_ox1': (lambda: population.crossover_ox1(parent, population.select_parent_tournament()), 0),
+            'mutate': (lambda: population.mutate(route, 1.0), 0),
+            'select_parent_tournament': (population.select_parent_tournament, 0),
+            'select_parents_tournament': (lambda: population.select_parents_tournament(2 * (size - 1)), 0),
+            'evolve': (lambda: population.evolve(0.05, distance_matrix), size - 1),
+        }
+    individual = population.population[0]
+    route = list(individual.route)
+    return {
+        'calculate_fitness': (individual.calculate_fitness, 1),
+        'crossover_ox1': (lambda: population.crossover_ox1(individual, population.select_parent_tournament()), 0),
+        'mutate': (lambda: population.mutate(route, 1.0), 0),
+        'select_parent_tournament': (population.select_parent_tournament, 0),
+        'evolve': (lambda: population.evolve(0.05, distance_matrix), size - 1),
+    }
+
+def peak_memory(engine, num_points, population_size, seed):
+    """Pico de memória alocada (bytes, via `tracemalloc`) para criar a instância e evoluir algumas gerações."""
+    tracemalloc.start()
+    try:
+        distance_matrix, population = create_case(engine, num_points, population_size, seed)
+        for _ in range(MEMORY_GENERATIONS):
+            population.evolve(0.05, distance_matrix)
+        return tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+def quality_at_budget(engine, num_points, population_size, seed, budget, runs):
+    """Mediana do melhor custo alcançado em `budget` segundos de relógio, em `runs` execuções com sementes fixas.
+
+    A instância é sempre a mesma (semente `seed`); só a semente da evolução muda entre as execuções.
+    """
+    costs = []
+    for run in range(runs):
+        distance_matrix, population = create_case(engine, num_points, population_size, seed)
+        random.seed(seed + 1 + run)
+        np.random.seed(seed + 1 + run)
+        if engine == 'array':
+            population.rng = np.random.default_rng(seed + 1 + run)
+        deadline = time.perf_counter() + budget
+        while time.perf_counter() < deadline:
+            population.evolve(0.05, distance_matrix)
+        costs.append(best_cost(population))
+    return float(np.median(costs))
+
+def benchmark_case(engine, num_points, population_size, seed, min_time, quality_budget, quality_runs):
+    """Mede as operações, a memória e a qualidade de um caso da grade."""
+    distance_matrix, population = create_case(engine, num_points, population_size, seed)
+    metrics = {}
+    for name, (operation, evaluations) in operations(engine, population, distance_matrix).items():
+        rate = calls_per_second(operation, min_time)
+        metrics[f'{name}_per_second'] = rate
+        if evaluations:
+            metrics[f'{name}_evaluations_per_second'] = rate * evaluations
+    metrics['generations_per_second'] = metrics.pop('evolve_per_second')
+    metrics['peak_memory_bytes'] = peak_memory(engine, num_points, population_size, seed)
+    if quality_budget > 0:
+        metrics['quality_cost'] = quality_at_budget(engine, num_points, population_size, seed, quality_budget, quality_runs)
+    return metrics
+
+def case_key(engine, num_points, population_size):
+    """Chave de um caso no JSON de resultados."""
+    return f"{engine}/n={num_points}/pop={population_size}"
+
+def compare(results, baseline, tolerance=0.25, quality_tolerance=0.05):
+    """Compara os resultados com a linha de base e retorna a lista de regressões encontradas.
+
+    Taxas (`*_per_second`) regridem se caírem mais que `tolerance`; memória regride se crescer mais que
+    `tolerance`; qualidade regride se o custo alcançado no orçamento piorar mais que `quality_tolerance`.
+    """
+    regressions = []
+    for key, metrics in results.items():
+        reference = baseline.get(key)
+        if reference is None:
+            continue
+        for metric, value in metrics.items():
+            if metric not in reference or not reference[metric]:
+                continue
+            ratio = value / reference[metric]
+            if metric.endswith('_per_second'):
+                regressed = ratio < 1 - tolerance
+            elif metric == 'quality_cost':
+                regressed = ratio > 1 + quality_tolerance
+            else:
+                regressed = ratio > 1 + tolerance
+            if regressed:
+                regressions.append(f"{key} {metric}: {reference[metric]:.4g} -> {value:.4g} ({ratio - 1:+.1%})")
+    return regressions
+
+def main(argv=None):
+    """Roda a grade, imprime a tabela, grava o JSON e compara com a linha de base, se houver."""
+    parser = argparse.ArgumentParser(description="Benchmark dos caminhos críticos do AG com linha de base de regressão.")
+    parser.add_argument('--points', type=int, nargs='+', default=DEFAULT_POINTS, help="Quantidades de pontos da grade.")
+    parser.add_argument('--populations', type=int, nargs='+', default=DEFAULT_POPULATIONS, help="Tamanhos de população da grade.")
+    parser.add_argument('--engines', nargs='+', choices=['array', 'list'], default=['array', 'list'])
+    parser.add_argument('--seed', type=int, default=0, help="Semente dos pontos e das populações.")
+    parser.add_argument('--min-time', type=float, default=0.2, help="Tempo mínimo de medição de cada operação, em segundos.")
+    parser.add_argument('--quality-budget', type=float, default=1.0, help="Tempo de relógio da medida de qualidade (0 desativa).")
+    parser.add_argument('--quality-runs', type=int, default=3, help="Execuções da medida de qualidade (vale a mediana).")
+    parser.add_argument('--output', default=None, help="Grava os resultados em JSON (use como linha de base).")
+    parser.add_argument('--baseline', default=None, help="Linha de base em JSON para detectar regressões.")
+    parser.add_argument('--tolerance', type=float, default=0.25, help="Queda de taxa (ou aumento de memória) tolerada.")
+    parser.add_argument('--quality-tolerance', type=float, default=0.05, help="Piora de custo tolerada na medida de qualidade.")
+    args = parser.parse_args(argv)
+
+    results = {}
+    print(f"{'caso':<24} {'ger/s':>9} {'aval/s':>11} {'fitness/s':>11} {'ox1/s':>9} {'mutate/s':>9} "
+          f"{'torneio/s':>10} {'seleção/s':>10} {'pico MB':>8} {'custo':>9}")
+    for engine in args.engines:
+        for num_points in args.points:
+            for population_size in args.populations:
+                key = case_key(engine, num_points, population_size)
+                metrics = benchmark_case(engine, num_points, population_size, args.seed,
+                                         args.min_time, args.quality_budget, args.quality_runs)
+                results[key] = metrics
+                print(f"{key:<24} {metrics['generations_per_second']:>9.1f} {metrics['evolve_evaluations_per_second']:>11.0f} "
+                      f"{metrics['calculate_fitness_evaluations_per_second']:>11.0f} {metrics['crossover_ox1_per_second']:>9.0f} "
+                      f"{metrics['mutate_per_second']:>9.0f} {metrics['select_parent_tournament_per_second']:>10.0f} "
+                      f"{metrics.get('select_parents_tournament_per_second', float('nan')):>10.0f} "
+                      f"{metrics['peak_memory_bytes'] / 1e6:>8.2f} {metrics.get('quality_cost', float('nan')):>9.1f}")
+
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as f:
+            json.dump({
+                'settings': {key: value for key, value in vars(args).items() if key not in ('output', 'baseline')},
+                'machine': {'python': platform.python_version(), 'numpy': np.__version__, 'platform': platform.platform()},
+                'results': results,
+            }, f, indent=2)
+
+    if args.baseline:
+        with open(args.baseline, encoding='utf-8') as f:
+            baseline = json.load(f)['results']
+        regressions = compare(results, baseline, args.tolerance, args.quality_tolerance)
+        if regressions:
+            print(f"\n{len(regressions)} regressão(ões) em relação a {args.baseline}:")
+            for line in regressions:
+                print(f"  {line}")
+            return 1
+        print(f"\nSem regressões em relação a {args.baseline}.")
+    return 0
+
+if __name__ == '__main__':
+    sys.exit(main())
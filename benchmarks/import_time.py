@@ -0,0 +1,68 @@
+"""Mede o tempo de importação de cada módulo com `python -X importtime`, em um processo novo por medição.
+
+Também lista quais dependências pesadas (interface, LLM, multiprocessamento) cada importação carregou, para
+conferir que o núcleo do AG não puxa nenhuma delas.
+
+Uso: `python -m benchmarks.import_time --repeats 5`
+"""
+
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import time
+
+MODULES = ('point_data', 'ga_classes', 'warm_start', 'convergence', 'checkpoint', 'evolution_worker', 'solver',
+           'report', 'helpers', 'ui_elements', 'main')
+
+# Dependências que só a interface, o relatório ou o modelo de ilhas deveriam carregar
+HEAVY = ('pygame', 'openai', 'matplotlib', 'dotenv', 'multiprocessing.shared_memory')
+
+def measure(module, repo):
+    """Importa `module` em um processo novo e retorna (tempo cumulativo do `-X importtime` em ms, parede em ms,
+    dependências pesadas carregadas)."""
+    code = f"import sys, {module}; print(','.join(name for name in {HEAVY!r} if name in sys.modules))"
+    env = dict(os.environ, SDL_VIDEODRIVER='dummy', PYGAME_HIDE_SUPPORT_PROMPT='1')
+    start = time.perf_counter()
+    result = subprocess.run([sys.executable, '-X', 'importtime', '-c', code], cwd=repo, env=env,
+                            capture_output=True, text=True, check=True)
+    wall = (time.perf_counter() - start) * 1000
+    cumulative = 0
+    for line in result.stderr.splitlines():
+        # A linha do próprio módulo é a de nível zero: "import time: self | cumulative | nome"
+        fields = line.split('|')
+        if len(fields) == 3 and fields[2].rstrip() == f' {module}':
+            cumulative = int(fields[1]) / 1000
+    loaded = [name for name in result.stdout.strip().split(',') if name]
+    return cumulative, wall, loaded
+
+def main(argv=None):
+    """Mede cada módulo várias vezes e imprime a mediana."""
+    parser = argparse.ArgumentParser(description="Tempo de importação dos módulos (python -X importtime).")
+    parser.add_argument('--repeats', type=int, default=5)
+    parser.add_argument('--modules', nargs='*', default=MODULES)
+    parser.add_argument('--output', default=None, help="Arquivo JSON com os resultados.")
+    args = parser.parse_args(argv)
+
+    repo = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    results = []
+    for module in args.modules:
+        runs = [measure(module, repo) for _ in range(args.repeats)]
+        results.append({
+            'module': module,
+            'import_ms': statistics.median(run[0] for run in runs),
+            'process_ms': statistics.median(run[1] for run in runs),
+            'heavy': runs[0][2],
+        })
+
+    print(f"{'módulo':>16} {'importação':>10} {'processo':>9}  dependências pesadas")
+    for r in results:
+        print(f"{r['module']:>16} {r['import_ms']:>8.1f}ms {r['process_ms']:>7.1f}ms  {', '.join(r['heavy']) or '-'}")
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as f:
+            json.dump(results, f, indent=2)
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,83 @@
+"""Compara o AG puro com o AG memético (busca local 2-opt/Or-opt) em tempo até atingir uma distância-alvo.
+
+Uso: `python -m benchmarks.local_search --num-points 200 --time-budget 10 --seeds 3`
+"""
+
+import argparse
+import json
+import random
+import time
+
+import numpy as np
+
+from benchmarks.common import best_cost
+from ga_classes import ArrayPopulation, DistanceMatrix
+from local_search import LocalSearch
+from point_data import generate_points
+
+def trace_run(distance_matrix, population_size, mutation_rate, time_budget, seed, local_search_options=None):
+    """Evolui por `time_budget` segundos e retorna a série (tempo, melhor custo) a cada geração."""
+    rng = np.random.default_rng(seed)
+    local_search = None
+    if local_search_options is not None:
+        local_search = LocalSearch(distance_matrix, rng=rng, **local_search_options)
+    start = time.perf_counter()
+    population = ArrayPopulation(population_size, distance_matrix, rng=rng)
+    trace = [(time.perf_counter() - start, best_cost(population))]
+    while trace[-1][0] < time_budget:
+        population.evolve(mutation_rate, local_search=local_search)
+        trace.append((time.perf_counter() - start, best_cost(population)))
+    return trace
+
+def time_to_target(trace, target):
+    """Primeiro instante em que o melhor custo atingiu `target` (ou `None` se não atingiu)."""
+    for elapsed, cost in trace:
+        if cost <= target:
+            return elapsed
+    return None
+
+def main(argv=None):
+    """Roda as duas variantes em várias sementes e imprime a tabela de resultados."""
+    parser = argparse.ArgumentParser(description="Benchmark do AG puro contra o AG memético.")
+    parser.add_argument('--num-points', type=int, default=200)
+    parser.add_argument('--population', type=int, default=100)
+    parser.add_argument('--mutation', type=float, default=0.05)
+    parser.add_argument('--time-budget', type=float, default=10.0, help="Tempo de cada execução em segundos.")
+    parser.add_argument('--seeds', type=int, default=3)
+    parser.add_argument('--ls-neighbors', type=int, default=8)
+    parser.add_argument('--ls-moves', type=int, default=200)
+    parser.add_argument('--ls-offspring', type=float, default=0.0)
+    parser.add_argument('--output', default=None, help="Arquivo JSON com os resultados.")
+    args = parser.parse_args(argv)
+
+    local_search_options = {'neighbors': args.ls_neighbors, 'max_moves': args.ls_moves, 'offspring_fraction': args.ls_offspring}
+    results = []
+    for seed in range(args.seeds):
+        random.seed(seed)
+        distance_matrix = DistanceMatrix(generate_points(args.num_points))
+        plain = trace_run(distance_matrix, args.population, args.mutation, args.time_budget, seed)
+        memetic = trace_run(distance_matrix, args.population, args.mutation, args.time_budget, seed, local_search_options)
+        # O alvo é a melhor rota que o AG puro alcança no orçamento inteiro
+        target = plain[-1][1]
+        results.append({
+            'seed': seed,
+            'target_cost': target,
+            'plain_final_cost': plain[-1][1],
+            'memetic_final_cost': memetic[-1][1],
+            'plain_time_to_target': time_to_target(plain, target),
+            'memetic_time_to_target': time_to_target(memetic, target),
+            'plain_generations': len(plain) - 1,
+            'memetic_generations': len(memetic) - 1,
+        })
+
+    print(f"{'semente':>7} {'alvo':>10} {'t_puro':>8} {'t_memético':>10} {'final_puro':>11} {'final_memético':>14}")
+    for r in results:
+        memetic_time = f"{r['memetic_time_to_target']:.2f}" if r['memetic_time_to_target'] is not None else '-'
+        print(f"{r['seed']:>7} {r['target_cost']:>10.1f} {r['plain_time_to_target']:>8.2f} {memetic_time:>10} "
+              f"{r['plain_final_cost']:>11.1f} {r['memetic_final_cost']:>14.1f}")
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as f:
+            json.dump(results, f, indent=2)
+
+if __name__ == '__main__':
+    main()
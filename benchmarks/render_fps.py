@@ -0,0 +1,59 @@
+"""Mede os quadros por segundo de `print_screen` com o driver de vídeo `dummy` do SDL (sem janela).
+
+Uso: `python -m benchmarks.render_fps --frames 300`
+"""
+
+import argparse
+import os
+
+os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+
+import main
+from evolution_worker import take_snapshot
+from ga_classes import DistanceMatrix, Fleet, Population
+from point_data import generate_points
+from render_cache import FrameTimer
+
+def measure(frames, num_points, population_size, running_ga, full_redraw):
+    """Renderiza `frames` quadros e retorna o FPS médio; `full_redraw` desativa as regiões sujas.
+
+    A frota segue a configuração da interface (`GA_SPLIT`, `GA_CAPACITY`, `GA_VEHICLES`).
+    """
+    points = generate_points(num_points)
+    fleet = Fleet(main.CAPACITY, main.VEHICLES or None) if main.SPLIT else None
+    distance_matrix = DistanceMatrix(points, fleet=fleet)
+    population = Population(population_size, distance_matrix)
+    history = []
+    generation = 1
+    timer = FrameTimer(window=frames)
+    screen = main.init_display()
+    main.dirty_regions.invalidate()
+    for _ in range(frames):
+        if running_ga:
+            population.evolve(0.05, distance_matrix)
+            history.append(population.get_fittest().fitness)
+            generation += 1
+        if full_redraw:
+            main.dirty_regions.invalidate()
+        snapshot = take_snapshot(points, population, generation, history, running_ga)
+        main.print_screen(screen, snapshot, 2000, num_points, population_size, 0.05)
+        timer.tick()
+    return timer.fps
+
+def main_benchmark(argv=None):
+    """Compara o FPS com e sem as regiões sujas, com o AG rodando e pausado."""
+    parser = argparse.ArgumentParser(description="FPS da interface com o driver dummy do SDL.")
+    parser.add_argument('--frames', type=int, default=300)
+    parser.add_argument('--num-points', type=int, default=200)
+    parser.add_argument('--population', type=int, default=50)
+    args = parser.parse_args(argv)
+
+    for running_ga in (False, True):
+        for full_redraw in (True, False):
+            fps = measure(args.frames, args.num_points, args.population, running_ga, full_redraw)
+            state = "rodando" if running_ga else "pausado"
+            mode = "tela inteira" if full_redraw else "regiões sujas"
+            print(f"AG {state:8} | {mode:14} | {fps:8.1f} FPS")
+
+if __name__ == '__main__':
+    main_benchmark()
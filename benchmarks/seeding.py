@@ -0,0 +1,94 @@
+"""Compara a população inicial aleatória com a semeada por `seeding.py` (custo inicial, tempo até o alvo) e mede o
+tempo de construção das rotas em instâncias grandes.
+
+Uso: `python -m benchmarks.seeding --num-points 200 --generations 1000 --seeds 3 --scale 1000 2000 5000`
+"""
+
+import argparse
+import json
+import random
+import time
+
+import numpy as np
+
+from benchmarks.common import best_cost
+from ga_classes import DistanceMatrix
+from point_data import generate_points
+from seeding import INITIALIZERS, seed_routes
+from solver import create_population
+
+def trace(engine, distance_matrix, population_size, mutation_rate, generations, seed, seeding):
+    """Cria a população (contando o tempo de construção) e evolui; retorna custo inicial e `(segundos, custo)`."""
+    random.seed(seed)
+    np.random.seed(seed)
+    rng = np.random.default_rng(seed)
+    start = time.perf_counter()
+    population = create_population(engine, population_size, distance_matrix, rng, seeding)
+    costs = [(time.perf_counter() - start, best_cost(population))]
+    for _ in range(generations):
+        population.evolve(mutation_rate, distance_matrix)
+        costs.append((time.perf_counter() - start, best_cost(population)))
+    return costs
+
+def seconds_to_target(costs, target):
+    """Primeiro instante (desde o início da construção) em que o melhor custo atingiu `target`."""
+    for seconds, cost in costs:
+        if cost <= target:
+            return seconds
+    return None
+
+def main(argv=None):
+    """Roda as duas inicializações em várias sementes e mede a construção nas instâncias de `--scale`."""
+    parser = argparse.ArgumentParser(description="Benchmark da população inicial semeada contra a aleatória.")
+    parser.add_argument('--num-points', type=int, default=200)
+    parser.add_argument('--population', type=int, default=100)
+    parser.add_argument('--mutation', type=float, default=0.05)
+    parser.add_argument('--generations', type=int, default=1000)
+    parser.add_argument('--engine', choices=['list', 'array', 'steady'], default='array')
+    parser.add_argument('--seeds', type=int, default=3)
+    parser.add_argument('--scale', type=int, nargs='*', default=[1000, 2000, 5000],
+                        help="Quantidades de pontos em que só o tempo de construção é medido.")
+    parser.add_argument('--output', default=None, help="Arquivo JSON com os resultados.")
+    args = parser.parse_args(argv)
+
+    results = []
+    for seed in range(args.seeds):
+        random.seed(seed)
+        distance_matrix = DistanceMatrix(generate_points(args.num_points))
+        runs = {
+            label: trace(args.engine, distance_matrix, args.population, args.mutation, args.generations, seed, seeding)
+            for label, seeding in (('random', None), ('seeded', INITIALIZERS))
+        }
+        # O alvo é a melhor rota que a população aleatória alcança no orçamento inteiro
+        target = runs['random'][-1][1]
+        results.append({
+            'seed': seed,
+            'target_cost': target,
+            **{f'{label}_initial_cost': costs[0][1] for label, costs in runs.items()},
+            **{f'{label}_final_cost': costs[-1][1] for label, costs in runs.items()},
+            **{f'{label}_seconds_to_target': seconds_to_target(costs, target) for label, costs in runs.items()},
+        })
+
+    print(f"{'semente':>7} {'alvo':>10} {'ini_aleat':>10} {'ini_semead':>10} {'fim_semead':>10} {'t_aleat':>8} {'t_semead':>8}")
+    for r in results:
+        seeded_seconds = r['seeded_seconds_to_target']
+        print(f"{r['seed']:>7} {r['target_cost']:>10.1f} {r['random_initial_cost']:>10.1f} {r['seeded_initial_cost']:>10.1f} "
+              f"{r['seeded_final_cost']:>10.1f} {r['random_seconds_to_target']:>7.2f}s "
+              f"{f'{seeded_seconds:.3f}s' if seeded_seconds is not None else '-':>8}")
+
+    scale = []
+    for num_points in args.scale:
+        random.seed(0)
+        distance_matrix = DistanceMatrix(generate_points(num_points), dtype=np.float32)
+        start = time.perf_counter()
+        seed_routes(distance_matrix, args.population, rng=np.random.default_rng(0))
+        scale.append({'num_points': num_points, 'seconds': time.perf_counter() - start})
+    for entry in scale:
+        print(f"construção de {args.population} rotas com {entry['num_points']} pontos: {entry['seconds']:.2f}s")
+
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as f:
+            json.dump({'runs': results, 'scale': scale}, f, indent=2)
+
+if __name__ == '__main__':
+    main()
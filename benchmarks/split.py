@@ -0,0 +1,67 @@
+"""Mede o custo da divisão da rota gigante em viagens (`fleet.split_tour`) e o impacto da frota no AG.
+
+A primeira tabela mostra o tempo por rota e por parada em instâncias crescentes (o custo por parada deve ficar
+constante, já que a divisão é linear). A segunda compara avaliações por segundo de `batch_costs` com e sem frota.
+
+Uso: `python -m benchmarks.split --sizes 50 200 1000 5000 --population 100 --repeats 20`
+"""
+
+import argparse
+import json
+import random
+import time
+
+import numpy as np
+
+from ga_classes import DistanceMatrix, Fleet, batch_costs
+from point_data import generate_points
+
+def time_call(function, repeats):
+    """Menor tempo (em segundos) de `repeats` chamadas de `function`."""
+    best = float('inf')
+    for _ in range(repeats):
+        start = time.perf_counter()
+        function()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+def main(argv=None):
+    """Mede a divisão de uma rota e a avaliação da população inteira em cada tamanho de `--sizes`."""
+    parser = argparse.ArgumentParser(description="Benchmark da divisão da rota gigante em viagens.")
+    parser.add_argument('--sizes', type=int, nargs='+', default=[50, 200, 1000, 5000])
+    parser.add_argument('--population', type=int, default=100)
+    parser.add_argument('--capacity', type=float, default=50)
+    parser.add_argument('--repeats', type=int, default=20)
+    parser.add_argument('--output', default=None, help="Arquivo JSON com os resultados.")
+    args = parser.parse_args(argv)
+
+    results = []
+    for num_points in args.sizes:
+        random.seed(0)
+        points = generate_points(num_points)
+        rng = np.random.default_rng(0)
+        routes = rng.permuted(np.tile(np.arange(num_points), (args.population, 1)), axis=1)
+        plain = DistanceMatrix(points, dtype=np.float32)
+        split = DistanceMatrix(points, dtype=np.float32, fleet=Fleet(args.capacity))
+        split_seconds = time_call(lambda: split.split(routes[0]), args.repeats)
+        plain_seconds = time_call(lambda: batch_costs(routes, plain), max(args.repeats // 4, 1))
+        fleet_seconds = time_call(lambda: batch_costs(routes, split), max(args.repeats // 4, 1))
+        results.append({
+            'num_points': num_points,
+            'split_microseconds': split_seconds * 1e6,
+            'microseconds_per_stop': split_seconds * 1e6 / num_points,
+            'trips': len(split.split(routes[0]).starts),
+            'evaluations_per_second_single': args.population / plain_seconds,
+            'evaluations_per_second_fleet': args.population / fleet_seconds,
+        })
+
+    print(f"{'pontos':>7} {'viagens':>8} {'us/rota':>10} {'us/parada':>10} {'aval/s_única':>13} {'aval/s_frota':>13}")
+    for r in results:
+        print(f"{r['num_points']:>7} {r['trips']:>8} {r['split_microseconds']:>10.1f} {r['microseconds_per_stop']:>10.3f} "
+              f"{r['evaluations_per_second_single']:>13.0f} {r['evaluations_per_second_fleet']:>13.0f}")
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as f:
+            json.dump(results, f, indent=2)
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,76 @@
+"""Compara o modo geracional (`Population`) com o regime permanente (`SteadyStatePopulation`): avaliações por
+segundo, pico de memória residente (RSS), coletas do coletor de lixo e custo final.
+
+Cada modo roda em um processo novo, para que o pico de RSS de um não contamine o do outro.
+
+Uso: `python -m benchmarks.steady_state --num-points 200 --population 200 --generations 500 --seeds 3`
+"""
+
+import argparse
+import gc
+import json
+import multiprocessing
+import random
+import resource
+import time
+
+import numpy as np
+
+from ga_classes import DistanceMatrix, Population, SteadyStatePopulation
+from point_data import generate_points
+
+MODES = {'geracional': Population, 'permanente': SteadyStatePopulation}
+
+def run_mode(mode, num_points, population_size, mutation_rate, generations, seed):
+    """Evolui uma população no modo `mode` e retorna avaliações/s, RSS, coletas do GC e custo final."""
+    random.seed(seed)
+    np.random.seed(seed)
+    distance_matrix = DistanceMatrix(generate_points(num_points))
+    population = MODES[mode](population_size, distance_matrix)
+    # ru_maxrss é o pico do processo (em KiB no Linux); a base inclui o interpretador, o NumPy e a população inicial
+    base_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    collections = sum(generation['collections'] for generation in gc.get_stats())
+    start = time.perf_counter()
+    for _ in range(generations):
+        population.evolve(mutation_rate, distance_matrix)
+    elapsed = time.perf_counter() - start
+    peak_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return {
+        'mode': mode,
+        'seed': seed,
+        'evaluations_per_second': generations * (population_size - 1) / elapsed,
+        'peak_rss_kib': peak_rss,
+        'rss_growth_kib': peak_rss - base_rss,
+        'gc_collections': sum(generation['collections'] for generation in gc.get_stats()) - collections,
+        'cost': 1 / population.stats.best_fitness - 1,
+    }
+
+def main(argv=None):
+    """Roda os dois modos em várias sementes, cada execução em um processo novo, e imprime a tabela."""
+    parser = argparse.ArgumentParser(description="Benchmark do modo geracional contra o regime permanente.")
+    parser.add_argument('--num-points', type=int, default=200)
+    parser.add_argument('--population', type=int, default=200)
+    parser.add_argument('--mutation', type=float, default=0.05)
+    parser.add_argument('--generations', type=int, default=500)
+    parser.add_argument('--seeds', type=int, default=3)
+    parser.add_argument('--output', default=None, help="Arquivo JSON com os resultados.")
+    args = parser.parse_args(argv)
+
+    context = multiprocessing.get_context('spawn')
+    results = []
+    for seed in range(args.seeds):
+        for mode in MODES:
+            with context.Pool(1) as pool:
+                results.append(pool.apply(run_mode, (mode, args.num_points, args.population, args.mutation,
+                                                     args.generations, seed)))
+
+    print(f"{'semente':>7} {'modo':>10} {'aval/s':>9} {'pico_RSS':>9} {'cresc_RSS':>9} {'coletas_GC':>10} {'custo':>10}")
+    for r in results:
+        print(f"{r['seed']:>7} {r['mode']:>10} {r['evaluations_per_second']:>9.0f} {r['peak_rss_kib'] / 1024:>7.1f}MB "
+              f"{r['rss_growth_kib'] / 1024:>7.1f}MB {r['gc_collections']:>10} {r['cost']:>10.1f}")
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as f:
+            json.dump(results, f, indent=2)
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,93 @@
+"""Compara a reotimização incremental (warm start) com recomeçar do zero depois de uma pequena edição nos pontos.
+
+Uso: `python -m benchmarks.warm_start --num-points 100 --change 5 --generations 1000 --seeds 3`
+"""
+
+import argparse
+import json
+import random
+
+import numpy as np
+
+from benchmarks.common import best_cost
+from ga_classes import ArrayPopulation, DistanceMatrix
+from point_data import generate_points
+from warm_start import add_points, remove_points
+
+def trace(population, mutation_rate, generations):
+    """Evolui por `generations` gerações e retorna o melhor custo antes da primeira e depois de cada uma."""
+    costs = [best_cost(population)]
+    for _ in range(generations):
+        population.evolve(mutation_rate)
+        costs.append(best_cost(population))
+    return costs
+
+def generations_to_target(costs, target):
+    """Primeira geração em que o melhor custo atingiu `target` (ou `None` se não atingiu)."""
+    for generation, cost in enumerate(costs):
+        if cost <= target:
+            return generation
+    return None
+
+def run_edit(edit, num_points, change, population_size, mutation_rate, generations, seed):
+    """Evolui uma instância, aplica a edição (`add` ou `remove`) e compara o warm start com um recomeço do zero."""
+    random.seed(seed)
+    rng = np.random.default_rng(seed)
+    points = generate_points(num_points)
+    population = ArrayPopulation(population_size, DistanceMatrix(points), rng=rng)
+    trace(population, mutation_rate, generations)
+
+    if edit == 'add':
+        points = points.concat(generate_points(change))
+        distance_matrix = DistanceMatrix(points)
+        warm = add_points(population, distance_matrix, change)
+    else:
+        removed = sorted(rng.choice(num_points, change, replace=False).tolist())
+        points = points.delete(removed)
+        distance_matrix = DistanceMatrix(points)
+        warm = remove_points(population, distance_matrix, removed)
+    cold = ArrayPopulation(population_size, distance_matrix, rng=np.random.default_rng(seed + 1))
+
+    warm_costs = trace(warm, mutation_rate, generations)
+    cold_costs = trace(cold, mutation_rate, generations)
+    # O alvo é a melhor rota que o recomeço do zero alcança no orçamento inteiro
+    target = cold_costs[-1]
+    return {
+        'edit': edit,
+        'seed': seed,
+        'target_cost': target,
+        'warm_initial_cost': warm_costs[0],
+        'warm_final_cost': warm_costs[-1],
+        'warm_generations_to_target': generations_to_target(warm_costs, target),
+        'cold_generations_to_target': generations_to_target(cold_costs, target),
+    }
+
+def main(argv=None):
+    """Roda as duas edições em várias sementes e imprime a tabela de resultados."""
+    parser = argparse.ArgumentParser(description="Benchmark da reotimização incremental contra o recomeço do zero.")
+    parser.add_argument('--num-points', type=int, default=100)
+    parser.add_argument('--change', type=int, default=5, help="Quantidade de pontos acrescentados ou removidos.")
+    parser.add_argument('--population', type=int, default=100)
+    parser.add_argument('--mutation', type=float, default=0.05)
+    parser.add_argument('--generations', type=int, default=1000, help="Gerações antes e depois da edição.")
+    parser.add_argument('--seeds', type=int, default=3)
+    parser.add_argument('--output', default=None, help="Arquivo JSON com os resultados.")
+    args = parser.parse_args(argv)
+
+    results = [
+        run_edit(edit, args.num_points, args.change, args.population, args.mutation, args.generations, seed)
+        for edit in ('add', 'remove') for seed in range(args.seeds)
+    ]
+
+    print(f"{'edição':>7} {'semente':>7} {'alvo':>10} {'warm_inicial':>12} {'warm_final':>10} {'ger_warm':>8} {'ger_zero':>8}")
+    for r in results:
+        warm_generations = r['warm_generations_to_target']
+        print(f"{r['edit']:>7} {r['seed']:>7} {r['target_cost']:>10.1f} {r['warm_initial_cost']:>12.1f} "
+              f"{r['warm_final_cost']:>10.1f} {warm_generations if warm_generations is not None else '-':>8} "
+              f"{r['cold_generations_to_target']:>8}")
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as f:
+            json.dump(results, f, indent=2)
+
+if __name__ == '__main__':
+    main()
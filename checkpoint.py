@@ -0,0 +1,126 @@
+"""Gravação e retomada do estado completo de uma execução do AG em um arquivo `.npz` compacto."""
+
+import json
+import os
+import random
+import warnings
+from collections import namedtuple
+
+import numpy as np
+
+from ga_classes import ArrayPopulation, Fleet, Population, SteadyStatePopulation, population_arrays
+from point_data import PointStore
+
+CHECKPOINT_VERSION = 1
+
+Checkpoint = namedtuple('Checkpoint', [
+    'points', 'routes', 'route_lengths', 'capacity_penalties', 'priority_penalties', 'generation',
+    'best_fitness_history', 'average_fitness_history', 'random_state', 'numpy_state', 'generator_state', 'metadata',
+])
+
+def fleet_config(distance_matrix):
+    """Frota da matriz como lista serializável em JSON (`[capacidade, veículos, [x, y]]`), ou None sem frota."""
+    fleet = distance_matrix.fleet
+    if fleet is None:
+        return None
+    return [fleet.capacity, fleet.vehicles, list(fleet.depot)]
+
+def checkpoint_fleet(checkpoint, fleet):
+    """Frota para retomar `checkpoint`: `fleet` com o depósito gravado, se `fleet` não fixar um depósito.
+
+    O depósito padrão é o centro da área dos pontos, que muda se a área não for a mesma da execução gravada;
+    reaproveitar o depósito gravado mantém as viagens (e os custos em cache) da execução original.
+    """
+    saved = checkpoint.metadata.get('fleet')
+    if fleet is None or fleet.depot is not None or saved is None:
+        return fleet
+    return Fleet(fleet.capacity, fleet.vehicles, tuple(saved[2]))
+
+def save_checkpoint(path, population, distance_matrix, generation, best_fitness_history,
+                    average_fitness_history=(), points=None, **metadata):
+    """Grava pontos, rotas, custos em cache, geração, históricos e estado dos geradores aleatórios em `path`.
+
+    O arquivo é um `.npz` comprimido e é gravado de forma atômica (arquivo temporário + rename), então uma
+    interrupção no meio da gravação não corrompe o checkpoint anterior. `metadata` guarda parâmetros extras
+    (taxa de mutação, número de gerações, ...) em JSON, junto com a frota da matriz (`fleet_config`). Com `points`
+    (o `PointStore` da matriz), a área usada na projeção do mapa também é gravada.
+    """
+    metadata['fleet'] = fleet_config(distance_matrix)
+    routes, route_lengths, capacity_penalties, priority_penalties = population_arrays(population)
+    version, internal_state, gauss = random.getstate()
+    numpy_state = np.random.get_state()
+    generator = population.rng if isinstance(population, ArrayPopulation) else None
+
+    temporary = f"{path}.tmp"
+    with open(temporary, 'wb') as f:
+        np.savez_compressed(
+            f,
+            version=CHECKPOINT_VERSION,
+            coords=distance_matrix.coords,
+            priorities=distance_matrix.priorities,
+            volumes=distance_matrix.volumes,
+            bounds=np.asarray(points.bounds if points is not None else (), dtype=np.float64),
+            routes=routes,
+            route_lengths=route_lengths,
+            capacity_penalties=capacity_penalties,
+            priority_penalties=priority_penalties,
+            generation=generation,
+            best_fitness_history=np.asarray(best_fitness_history, dtype=np.float64),
+            average_fitness_history=np.asarray(average_fitness_history, dtype=np.float64),
+            random_state=np.array(json.dumps([version, internal_state, gauss])),
+            numpy_keys=numpy_state[1],
+            numpy_params=np.array([numpy_state[2], numpy_state[3], numpy_state[4]], dtype=np.float64),
+            generator_state=np.array(json.dumps(generator.bit_generator.state) if generator is not None else ''),
+            metadata=np.array(json.dumps(metadata)),
+        )
+    os.replace(temporary, path)
+
+def load_checkpoint(path):
+    """Lê um checkpoint gravado por `save_checkpoint` e retorna um `Checkpoint`."""
+    with np.load(path) as data:
+        version = int(data['version'])
+        if version != CHECKPOINT_VERSION:
+            raise ValueError(f"Versão de checkpoint não suportada: {version}")
+        random_version, internal_state, gauss = json.loads(str(data['random_state']))
+        position, has_gauss, cached_gaussian = data['numpy_params'].tolist()
+        generator_state = str(data['generator_state'])
+        bounds = tuple(data['bounds'].tolist()) if 'bounds' in data.files and data['bounds'].size else None
+        return Checkpoint(
+            points=PointStore.from_arrays(data['coords'], data['priorities'], data['volumes'], bounds=bounds),
+            routes=data['routes'],
+            route_lengths=data['route_lengths'],
+            capacity_penalties=data['capacity_penalties'],
+            priority_penalties=data['priority_penalties'],
+            generation=int(data['generation']),
+            best_fitness_history=data['best_fitness_history'].tolist(),
+            average_fitness_history=data['average_fitness_history'].tolist(),
+            random_state=(random_version, tuple(internal_state), gauss),
+            numpy_state=('MT19937', data['numpy_keys'], int(position), int(has_gauss), cached_gaussian),
+            generator_state=json.loads(generator_state) if generator_state else None,
+            metadata=json.loads(str(data['metadata'])),
+        )
+
+def restore_population(checkpoint, distance_matrix, engine='list', rng=None):
+    """Recria a população do checkpoint (sem recalcular a aptidão) e restaura o estado dos geradores aleatórios.
+
+    Com `engine='array'`, o gerador da `ArrayPopulation` volta ao estado gravado, se o checkpoint tiver um;
+    `engine='steady'` recria uma `SteadyStatePopulation`. Se a frota de `distance_matrix` não for a da execução
+    gravada, os custos gravados não valem mais: a aptidão é recalculada, com um aviso. Para retomar com a mesma
+    frota, monte a matriz com `checkpoint_fleet`.
+    """
+    random.setstate(checkpoint.random_state)
+    np.random.set_state(checkpoint.numpy_state)
+    costs = (checkpoint.route_lengths, checkpoint.capacity_penalties, checkpoint.priority_penalties)
+    if checkpoint.metadata.get('fleet') != fleet_config(distance_matrix):
+        warnings.warn(f"Frota diferente da gravada no checkpoint ({checkpoint.metadata.get('fleet')} -> "
+                      f"{fleet_config(distance_matrix)}); a aptidão será recalculada.")
+        costs = None
+    if engine == 'array':
+        if rng is None:
+            rng = np.random.default_rng()
+            if checkpoint.generator_state is not None and rng.bit_generator.state['bit_generator'] == checkpoint.generator_state['bit_generator']:
+                rng.bit_generator.state = checkpoint.generator_state
+        return ArrayPopulation.from_routes(checkpoint.routes, distance_matrix, costs=costs, rng=rng)
+    if engine == 'steady':
+        return SteadyStatePopulation.from_routes(checkpoint.routes, distance_matrix, costs=costs)
+    return Population.from_routes(checkpoint.routes, distance_matrix, costs=costs)
@@ -0,0 +1,79 @@
+"""Detecção de convergência, parada antecipada, reinício a partir da elite e taxa de mutação adaptativa."""
+
+import numpy as np
+
+from ga_classes import fitness_from_costs, population_arrays
+from warm_start import rebuild_population
+
+# Decisões de `ConvergenceController.update`
+CONTINUE = 'continue'
+RESTART = 'restart'
+STOP = 'stop'
+
+class ConvergenceController:
+    """Acompanha a estagnação e a diversidade da população, geração a geração, a partir do `PopulationStats`.
+
+    As métricas são incrementais (um contador de gerações sem melhora e uma média móvel exponencial da
+    diversidade), então `update` custa O(1) por geração. Depois de `patience` gerações sem que a melhor aptidão
+    suba mais que `min_improvement` (relativo), o controlador pede um reinício a partir da elite, até
+    `max_restarts` vezes, e depois a parada. Enquanto a diversidade média estiver abaixo de `diversity_floor`,
+    `mutation_rate` sobe a taxa escolhida pelo usuário em direção a `max_mutation_rate`.
+    """
+    def __init__(self, patience=150, min_improvement=1e-3, diversity_floor=0.05, max_mutation_rate=0.5,
+                 max_restarts=1, elite_size=2, smoothing=0.1):
+        """Guarda os parâmetros e zera o estado."""
+        self.patience = patience
+        self.min_improvement = min_improvement
+        self.diversity_floor = diversity_floor
+        self.max_mutation_rate = max_mutation_rate
+        self.max_restarts = max_restarts
+        self.elite_size = elite_size
+        self.smoothing = smoothing
+        self.reset()
+
+    def reset(self):
+        """Zera o estado (nova população, novos pontos ou retomada de um checkpoint)."""
+        self.reference_fitness = None
+        self.stagnant_generations = 0
+        self.restarts = 0
+        self.diversity = None
+        self.converged = False
+
+    def mutation_rate(self, base_rate):
+        """Taxa de mutação efetiva: `base_rate` com diversidade saudável, subindo linearmente conforme ela colapsa."""
+        if self.diversity is None or self.diversity >= self.diversity_floor or base_rate >= self.max_mutation_rate:
+            return base_rate
+        collapse = 1 - self.diversity / self.diversity_floor
+        return base_rate + (self.max_mutation_rate - base_rate) * collapse
+
+    def update(self, stats):
+        """Registra o `PopulationStats` de uma geração e retorna `CONTINUE`, `RESTART` ou `STOP`."""
+        if self.diversity is None:
+            self.diversity = stats.diversity
+        else:
+            self.diversity += self.smoothing * (stats.diversity - self.diversity)
+
+        # Melhoras menores que `min_improvement` acumulam sobre a referência até passarem do limite
+        if self.reference_fitness is None or stats.best_fitness > self.reference_fitness * (1 + self.min_improvement):
+            self.reference_fitness = stats.best_fitness
+            self.stagnant_generations = 0
+            return CONTINUE
+        self.stagnant_generations += 1
+        if self.stagnant_generations < self.patience:
+            return CONTINUE
+        self.stagnant_generations = 0
+        if self.restarts < self.max_restarts:
+            self.restarts += 1
+            # O reinício devolve a diversidade; a média móvel recomeça da próxima geração
+            self.diversity = None
+            return RESTART
+        self.converged = True
+        return STOP
+
+def restart_from_elite(population, distance_matrix, elite_size=2, rng=None):
+    """Recria a população mantendo os `elite_size` mais aptos e completando com permutações aleatórias."""
+    rng = np.random.default_rng() if rng is None else rng
+    routes, lengths, capacity, priority = population_arrays(population)
+    elite = np.argsort(-fitness_from_costs(lengths, capacity, priority), kind='stable')[:elite_size]
+    fresh = rng.permuted(np.tile(np.arange(routes.shape[1], dtype=routes.dtype), (len(routes) - len(elite), 1)), axis=1)
+    return rebuild_population(population, np.concatenate([routes[elite], fresh]), distance_matrix)
@@ -0,0 +1,265 @@
+"""Worker em segundo plano que evolui a população e publica snapshots imutáveis para a interface."""
+
+import queue
+import threading
+import time
+from collections import namedtuple
+
+from checkpoint import checkpoint_fleet, restore_population, save_checkpoint
+from convergence import RESTART, STOP, restart_from_elite
+from ga_classes import DistanceMatrix, Population
+from point_data import generate_points
+from profiling import Profiler
+from seeding import seed_routes
+from warm_start import add_points, remove_points, resize_population
+
+Snapshot = namedtuple('Snapshot', [
+    'points', 'generation', 'best_individual', 'second_best_route',
+    'average_fitness', 'stats', 'best_fitness_history', 'running', 'converged', 'effective_mutation_rate',
+    'best_trips', 'depot',
+])
+
+def take_snapshot(points, population, generation, best_fitness_history, running, converged=False,
+                  effective_mutation_rate=None):
+    """Congela o estado atual da população em um `Snapshot` que a interface pode ler sem travas."""
+    stats = population.stats
+    best = population.get_fittest()
+    second_best = population.get_second_fittest()
+    fleet = best.distance_matrix.fleet
+    return Snapshot(
+        points=points,
+        generation=generation,
+        best_individual=best,
+        second_best_route=tuple(second_best.route) if second_best else None,
+        average_fitness=stats.mean_fitness,
+        stats=stats,
+        best_fitness_history=tuple(best_fitness_history),
+        running=running,
+        converged=converged,
+        effective_mutation_rate=effective_mutation_rate,
+        best_trips=tuple(tuple(trip) for trip in best.distance_matrix.trips(best.route)) if fleet is not None else None,
+        depot=fleet.depot if fleet is not None else None,
+    )
+
+class EvolutionWorker(threading.Thread):
+    """Executa `Population.evolve` em uma thread própria, quantas gerações couberem no orçamento de cada fatia.
+
+    A interface envia comandos pela fila (`send`) e lê sempre o snapshot mais recente em `self.snapshot`.
+    Comandos aceitos: `toggle`, `reset`, `set_points`, `set_population_size`, `set_mutation_rate`,
+    `set_num_generations`, `set_profiling`, `save_checkpoint`, `load_checkpoint`, `resize_points`, `add_points`,
+    `remove_points` e `stop`. As opções do construtor estão em `doc/evolution_worker.md`.
+    """
+    def __init__(self, points, population_size, mutation_rate, num_generations, time_budget=1 / 60, profiler=None,
+                 checkpoint_path=None, checkpoint_interval=0, warm_start=True, convergence=None, seeding=None,
+                 random_fraction=0.5, fleet=None):
+        """Cria a população inicial e publica o primeiro snapshot antes de a thread começar."""
+        super().__init__(daemon=True)
+        self.commands = queue.Queue()
+        self.time_budget = time_budget
+        # Mede as fases de cada geração; a interface lê as médias para o overlay de desempenho
+        self.profiler = Profiler() if profiler is None else profiler
+        self.checkpoint_path = checkpoint_path
+        self.checkpoint_interval = checkpoint_interval
+        self.warm_start = warm_start
+        self.convergence = convergence
+        self.seeding = seeding
+        self.random_fraction = random_fraction
+        self.fleet = fleet
+        self.population_size = int(population_size)
+        self.mutation_rate = mutation_rate
+        self.num_generations = int(num_generations)
+        self.running_ga = False
+        self._set_points(points)
+
+    def send(self, command, value=None):
+        """Envia um comando para a thread de evolução."""
+        self.commands.put((command, value))
+
+    def stop(self):
+        """Pede o encerramento da thread e espera que ela termine."""
+        self.send('stop')
+        if self.is_alive():
+            self.join()
+        self.profiler.close()
+
+    def _set_points(self, points):
+        """Troca o conjunto de pontos, recalculando a matriz de distâncias e reiniciando a população."""
+        self.points = points
+        self.distance_matrix = DistanceMatrix(points, fleet=self.fleet)
+        self._reset()
+
+    def _reset(self):
+        """Recria a população, zera a geração e o histórico e pausa o AG."""
+        self.running_ga = False
+        if self.seeding:
+            routes = seed_routes(self.distance_matrix, self.population_size, self.seeding, self.random_fraction)
+            self.population = Population.from_routes(routes, self.distance_matrix)
+        else:
+            self.population = Population(size=self.population_size, distance_matrix=self.distance_matrix)
+        self.generation = 0
+        self.best_fitness_history = []
+        self._reset_convergence()
+        self.profiler.reset()
+        self._publish()
+
+    def _restart_counters(self):
+        """Zera a geração e o histórico depois de uma edição incremental, mantendo a população e o estado do AG."""
+        self.generation = 0
+        self.best_fitness_history = []
+        self._reset_convergence()
+        self.profiler.reset()
+
+    def _reset_convergence(self):
+        """Zera o controlador de convergência, se houver."""
+        self.converged = False
+        if self.convergence is not None:
+            self.convergence.reset()
+
+    def _effective_mutation_rate(self):
+        """Taxa de mutação da próxima geração (a do slider, adaptada pelo controlador de convergência)."""
+        if self.convergence is None:
+            return self.mutation_rate
+        return self.convergence.mutation_rate(self.mutation_rate)
+
+    def _add_points(self, new_points):
+        """Acrescenta pontos ao fim da lista e os insere nas rotas existentes por inserção mais barata."""
+        if not len(new_points):
+            return
+        self.points = self.points.concat(new_points)
+        self.distance_matrix = DistanceMatrix(self.points, fleet=self.fleet)
+        self.population = add_points(self.population, self.distance_matrix, len(new_points))
+        self._restart_counters()
+
+    def _remove_points(self, indices):
+        """Retira os pontos `indices` da lista e de todas as rotas, mantendo a ordem das paradas restantes."""
+        removed = set(int(index) for index in indices)
+        if not removed or len(self.points) - len(removed) < 2:
+            return
+        self.points = self.points.delete(sorted(removed))
+        self.distance_matrix = DistanceMatrix(self.points, fleet=self.fleet)
+        self.population = remove_points(self.population, self.distance_matrix, sorted(removed))
+        self._restart_counters()
+
+    def _resize_points(self, count):
+        """Ajusta a quantidade de pontos: gera pontos novos ou retira os últimos, sem descartar a população."""
+        count = int(count)
+        current = len(self.points)
+        if count > current:
+            self._add_points(generate_points(count - current))
+        elif count < current:
+            self._remove_points(range(count, current))
+
+    def _save_checkpoint(self, path=None):
+        """Grava o estado atual em `path` (padrão `checkpoint_path`), se houver caminho e gerações evoluídas."""
+        path = path or self.checkpoint_path
+        if not path or self.generation == 0:
+            return
+        with self.profiler.phase('checkpoint'):
+            save_checkpoint(path, self.population, self.distance_matrix, self.generation,
+                            self.best_fitness_history, points=self.points, mutation_rate=self.mutation_rate,
+                            num_generations=self.num_generations)
+
+    def _load_checkpoint(self, checkpoint):
+        """Substitui o estado atual pelo de um `checkpoint.Checkpoint` já lido, com o AG pausado."""
+        self.running_ga = False
+        self.points = checkpoint.points
+        self.distance_matrix = DistanceMatrix(checkpoint.points, fleet=checkpoint_fleet(checkpoint, self.fleet))
+        self.population = restore_population(checkpoint, self.distance_matrix)
+        self.population_size = len(checkpoint.routes)
+        self.generation = checkpoint.generation
+        self.best_fitness_history = list(checkpoint.best_fitness_history)
+        self.mutation_rate = checkpoint.metadata.get('mutation_rate', self.mutation_rate)
+        self.num_generations = int(checkpoint.metadata.get('num_generations', self.num_generations))
+        self._reset_convergence()
+        self.profiler.reset()
+
+    def _publish(self):
+        """Publica um novo snapshot (a troca de referência é atômica para a thread da interface)."""
+        with self.profiler.phase('snapshot'):
+            self.snapshot = take_snapshot(self.points, self.population, self.generation, self.best_fitness_history,
+                                          self.running_ga, self.converged, self._effective_mutation_rate())
+
+    def _handle(self, command, value):
+        """Aplica um comando recebido da interface; retorna False quando a thread deve parar."""
+        if command == 'stop':
+            self._save_checkpoint()
+            return False
+        if command in ('reset', 'set_points') or (command == 'set_population_size' and not self.warm_start):
+            # Guarda a população evoluída antes de descartá-la
+            self._save_checkpoint()
+        if command == 'toggle':
+            self.running_ga = not self.running_ga
+            if self.running_ga and self.converged:
+                self._reset_convergence()
+        elif command == 'reset':
+            self._reset()
+        elif command == 'set_points':
+            self._set_points(value)
+        elif command == 'set_population_size':
+            self.population_size = int(value)
+            if self.warm_start:
+                self.population = resize_population(self.population, self.population_size, self.distance_matrix)
+                self._restart_counters()
+            else:
+                self._reset()
+        elif command == 'resize_points':
+            self._resize_points(value)
+        elif command == 'add_points':
+            self._add_points(value)
+        elif command == 'remove_points':
+            self._remove_points(value)
+        elif command == 'save_checkpoint':
+            self._save_checkpoint(value)
+        elif command == 'load_checkpoint':
+            self._load_checkpoint(value)
+        elif command == 'set_mutation_rate':
+            self.mutation_rate = value
+        elif command == 'set_num_generations':
+            self.num_generations = int(value)
+        elif command == 'set_profiling':
+            self.profiler.enabled = bool(value)
+            self.profiler.reset()
+        self._publish()
+        return True
+
+    def _evolving(self):
+        """Indica se ainda há gerações a executar."""
+        return self.running_ga and not self.converged and self.generation < self.num_generations
+
+    def run(self):
+        """Loop da thread: processa comandos e evolui em fatias de `time_budget` segundos."""
+        while True:
+            try:
+                # Pausado, a thread dorme na fila; evoluindo, só olha a fila entre as fatias
+                command, value = self.commands.get(block=not self._evolving(), timeout=None)
+                if not self._handle(command, value):
+                    return
+                continue
+            except queue.Empty:
+                pass
+
+            deadline = time.perf_counter() + self.time_budget
+            profiler = self.profiler
+            while self._evolving() and time.perf_counter() < deadline:
+                mutation_rate = self._effective_mutation_rate()
+                self.population.evolve(mutation_rate, self.distance_matrix, profiler=profiler)
+                with profiler.phase('statistics'):
+                    stats = self.population.stats
+                    self.best_fitness_history.append(stats.best_fitness)
+                self.generation += 1
+                if self.convergence is not None:
+                    decision = self.convergence.update(stats)
+                    if decision == RESTART:
+                        self.population = restart_from_elite(self.population, self.distance_matrix,
+                                                             self.convergence.elite_size)
+                    elif decision == STOP:
+                        self.converged = True
+                        self.running_ga = False
+                        self._save_checkpoint()
+                if self.checkpoint_interval and self.generation % self.checkpoint_interval == 0:
+                    self._save_checkpoint()
+                if profiler.enabled:
+                    profiler.tick(generation=self.generation, best_fitness=self.best_fitness_history[-1],
+                                  average_fitness=stats.mean_fitness, fitness_std=stats.std_fitness,
+                                  diversity=stats.diversity, mutation_rate=mutation_rate)
+            self._publish()
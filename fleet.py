@@ -0,0 +1,95 @@
+"""Divisão da rota gigante em viagens de veículos com capacidade limitada (split linear sobre somas acumuladas).
+
+O AG continua evoluindo uma permutação de todos os pontos (a rota gigante). Na avaliação, a permutação é cortada
+em viagens consecutivas que saem do depósito e voltam a ele, sem passar da capacidade do veículo, escolhendo os
+cortes que minimizam a distância total. A escolha é um caminho mínimo sobre as posições da rota, resolvido em O(n)
+com uma fila monotônica.
+"""
+
+from collections import namedtuple
+
+import numpy as np
+
+# Resultado da divisão: distância total das viagens, posição (na rota gigante) do início de cada viagem e volume
+# que excede a capacidade (só uma parada com volume acima da capacidade pode exceder)
+TourSplit = namedtuple('TourSplit', ['length', 'starts', 'overload'])
+
+def tour_prefixes(routes, matrix, depot_distances, volumes):
+    """Somas acumuladas de rotas `(count, n)`: distância ao longo da rota, volume e distância de cada parada ao depósito.
+
+    `along[k]` é a distância da posição 0 até a posição `k` seguindo a rota (sem fechar o ciclo), `loads[k]` é o
+    volume das posições `0..k-1` e `depot[k]` é a distância da parada da posição `k` ao depósito. Tudo é calculado
+    de uma vez para todas as linhas.
+    """
+    routes = np.asarray(routes)
+    routes = routes.reshape(-1, routes.shape[-1])
+    count, n = routes.shape
+    along = np.zeros((count, n), dtype=np.float64)
+    np.cumsum(matrix[routes[:, :-1], routes[:, 1:]], axis=1, dtype=np.float64, out=along[:, 1:])
+    loads = np.zeros((count, n + 1), dtype=np.float64)
+    np.cumsum(volumes[routes], axis=1, dtype=np.float64, out=loads[:, 1:])
+    return along, loads, depot_distances[routes].astype(np.float64)
+
+def split_prefixes(along, loads, depot, capacity):
+    """Divide uma rota em viagens a partir das suas somas acumuladas (listas de `tour_prefixes`), em O(n).
+
+    `cost[j]` é a menor distância para atender as `j` primeiras paradas. A viagem que atende as posições `i..j-1`
+    custa `depot[i] + along[j-1] - along[i] + depot[j-1]`, então `cost[j] = min(key[i]) + along[j-1] + depot[j-1]`
+    com `key[i] = cost[i] + depot[i] - along[i]`, sobre os `i` cuja carga cabe no veículo. Como a carga só cresce
+    com `j`, esses `i` formam uma janela que só anda para a frente, e o mínimo da janela sai de uma fila monotônica
+    (cada posição entra e sai uma vez). Uma parada sozinha sempre forma uma viagem, mesmo acima da capacidade; o
+    excesso volta em `overload`.
+    """
+    n = len(depot)
+    cost = [0.0] * (n + 1)
+    previous = [0] * (n + 1)
+    keys = [0.0] * n
+    # Índices com chaves crescentes em window[head:tail]
+    window = [0] * n
+    head = tail = 0
+    first = 0
+    for j in range(1, n + 1):
+        i = j - 1
+        key = cost[i] + depot[i] - along[i]
+        keys[i] = key
+        while tail > head and keys[window[tail - 1]] >= key:
+            tail -= 1
+        window[tail] = i
+        tail += 1
+        # Primeira posição cuja viagem até j-1 ainda cabe no veículo
+        limit = loads[j] - capacity
+        while first < i and loads[first] < limit:
+            first += 1
+        while window[head] < first:
+            head += 1
+        best = window[head]
+        cost[j] = keys[best] + along[i] + depot[i]
+        previous[j] = best
+
+    starts = []
+    j = n
+    while j > 0:
+        j = previous[j]
+        starts.append(j)
+    starts.reverse()
+    overload = 0.0
+    for start, end in zip(starts, starts[1:] + [n]):
+        excess = loads[end] - loads[start] - capacity
+        if excess > 0:
+            overload += excess
+    return TourSplit(cost[n], starts, overload)
+
+def split_tour(route, matrix, depot_distances, volumes, capacity):
+    """Divide uma rota gigante nas viagens de menor distância total que respeitam `capacity` (veja `split_prefixes`)."""
+    along, loads, depot = tour_prefixes(route, matrix, depot_distances, volumes)
+    return split_prefixes(along[0].tolist(), loads[0].tolist(), depot[0].tolist(), capacity)
+
+def split_tours(routes, matrix, depot_distances, volumes, capacity):
+    """Divide todas as rotas `(count, n)`, com as somas acumuladas calculadas em lote; retorna um `TourSplit` por linha."""
+    along, loads, depot = tour_prefixes(routes, matrix, depot_distances, volumes)
+    return [split_prefixes(*row, capacity) for row in zip(along.tolist(), loads.tolist(), depot.tolist())]
+
+def tour_trips(route, starts):
+    """Corta a rota gigante nas posições `starts` e retorna as viagens (listas de índices de pontos), na ordem."""
+    route = [int(point) for point in route]
+    return [route[start:end] for start, end in zip(starts, list(starts[1:]) + [len(route)])]
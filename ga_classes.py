@@ -1,43 +1,289 @@
 import random
+from collections import namedtuple
 import numpy as np
 from math import sqrt
+from fleet import split_tour, split_tours, tour_trips
+from point_data import PointStore
+from profiling import NULL_PROFILER
+
+MAX_CAPACITY = 50
+CAPACITY_PENALTY_FACTOR = 100
+PRIORITY_PENALTY_FACTOR = 1000
+PRIORITY_MAX_POSITION = 5
+VEHICLE_PENALTY_FACTOR = 1000
+
+# Frota da divisão em viagens: capacidade de cada veículo, número de veículos (None: ilimitado) e posição do
+# depósito (None: centro da área dos pontos)
+Fleet = namedtuple('Fleet', ['capacity', 'vehicles', 'depot'], defaults=(MAX_CAPACITY, None, None))
+
+class DistanceMatrix:
+    """Matriz de distâncias pré-calculada para um conjunto de pontos, compartilhada por todos os indivíduos."""
+    def __init__(self, points, dtype=np.float64, block_size=256, fleet=None):
+        """Constrói a matriz uma única vez a partir dos pontos (use `dtype=np.float32` para instâncias grandes)."""
+        if not isinstance(points, PointStore):
+            points = PointStore.from_records(points)
+        self.coords = np.array(points.coords, dtype=np.float64)
+        self.priorities = points.priorities.astype(np.int8)
+        self.volumes = points.volumes.astype(np.float64)
+        self.has_priority = bool((self.priorities == 1).any())
+
+        # Calcula em blocos de linhas para não alocar o tensor (n, n, 2) inteiro de uma vez
+        n = len(self.coords)
+        self.matrix = np.empty((n, n), dtype=dtype)
+        for start in range(0, n, block_size):
+            block = self.coords[start:start + block_size]
+            self.matrix[start:start + block_size] = np.hypot(
+                block[:, None, 0] - self.coords[None, :, 0],
+                block[:, None, 1] - self.coords[None, :, 1],
+            )
+
+        self.fleet = None
+        if fleet is not None:
+            depot = fleet.depot if fleet.depot is not None else points.depot
+            if depot is None:
+                x_min, y_min, x_max, y_max = points.bounds
+                depot = ((x_min + x_max) / 2, (y_min + y_max) / 2)
+            self.fleet = fleet._replace(depot=(float(depot[0]), float(depot[1])))
+            depot_x, depot_y = self.fleet.depot
+            self.depot_distances = np.hypot(self.coords[:, 0] - depot_x, self.coords[:, 1] - depot_y)
+
+    @classmethod
+    def from_arrays(cls, coords, priorities, volumes, matrix):
+        """Monta a matriz a partir de arrays já calculados (por exemplo, em memória compartilhada), sem recalcular."""
+        distance_matrix = cls.__new__(cls)
+        distance_matrix.coords = coords
+        distance_matrix.priorities = priorities
+        distance_matrix.volumes = volumes
+        distance_matrix.matrix = matrix
+        distance_matrix.has_priority = bool((priorities == 1).any())
+        distance_matrix.fleet = None
+        return distance_matrix
+
+    def __len__(self):
+        """Retorna o número de pontos cobertos pela matriz."""
+        return len(self.matrix)
+
+    def route_length(self, route):
+        """Calcula o comprimento da rota fechada com um único gather-and-sum sobre a matriz."""
+        route = np.asarray(route)
+        return float(self.matrix[route, np.roll(route, -1)].sum(dtype=np.float64))
+
+    def split(self, route):
+        """Divide a rota gigante nas viagens da frota (um `fleet.TourSplit`); exige `fleet`."""
+        return split_tour(route, self.matrix, self.depot_distances, self.volumes, self.fleet.capacity)
+
+    def trips(self, route):
+        """Viagens da rota, uma lista de índices por veículo; sem frota, a rota inteira é uma viagem só."""
+        if self.fleet is None:
+            return [[int(point) for point in route]]
+        return tour_trips(route, self.split(route).starts)
+
+    def travel_length(self, route):
+        """Distância percorrida: a soma das viagens com frota, ou o ciclo fechado da rota sem ela."""
+        if self.fleet is None:
+            return self.route_length(route)
+        return float(self.split(route).length)
+
+def fleet_penalty(split, fleet):
+    """Penalidade de capacidade de uma rota dividida: volume acima da capacidade e viagens além da frota."""
+    extra_trips = max(len(split.starts) - fleet.vehicles, 0) if fleet.vehicles else 0
+    return split.overload * CAPACITY_PENALTY_FACTOR + extra_trips * VEHICLE_PENALTY_FACTOR
+
+def fitness_from_costs(route_length, capacity_penalty, priority_penalty):
+    """Converte os componentes de custo (escalares ou vetores) na aptidão usada pelo AG."""
+    return 1 / (route_length + capacity_penalty + priority_penalty + 1)
+
+def priority_penalty(route, distance_matrix):
+    """Penaliza a rota se existir ponto prioritário e nenhum deles estiver nas primeiras posições."""
+    if not distance_matrix.has_priority:
+        return 0
+    head = np.asarray(route[:PRIORITY_MAX_POSITION + 1])
+    return 0 if (distance_matrix.priorities[head] == 1).any() else PRIORITY_PENALTY_FACTOR
+
+def batch_priority_penalties(routes, distance_matrix):
+    """Versão vetorizada de `priority_penalty`, que só lê as primeiras posições de cada rota."""
+    # O primeiro ponto prioritário passa da posição limite se nenhum deles aparece no início da rota
+    head = routes[:, :PRIORITY_MAX_POSITION + 1]
+    late_priority = distance_matrix.has_priority & ~(distance_matrix.priorities[head] == 1).any(axis=1)
+    return late_priority * PRIORITY_PENALTY_FACTOR
+
+def batch_costs(routes, distance_matrix):
+    """Calcula distância, penalidade de capacidade e penalidade de prioridade de todas as rotas `(pop_size, n)`."""
+    fleet = distance_matrix.fleet
+    if fleet is not None:
+        splits = split_tours(routes, distance_matrix.matrix, distance_matrix.depot_distances, distance_matrix.volumes,
+                             fleet.capacity)
+        route_lengths = np.array([split.length for split in splits], dtype=np.float64)
+        capacity_penalties = np.array([fleet_penalty(split, fleet) for split in splits], dtype=np.float64)
+    else:
+        route_lengths = distance_matrix.matrix[routes, np.roll(routes, -1, axis=1)].sum(axis=1, dtype=np.float64)
+        current_volume = distance_matrix.volumes[routes].sum(axis=1)
+        capacity_penalties = np.maximum(current_volume - MAX_CAPACITY, 0) * CAPACITY_PENALTY_FACTOR
+
+    priority_penalties = batch_priority_penalties(routes, distance_matrix)
+    return route_lengths, capacity_penalties, priority_penalties
+
+def batch_fitness(routes, distance_matrix):
+    """Calcula a aptidão de todas as rotas `(pop_size, n)` de uma geração em uma única passada vetorizada."""
+    return fitness_from_costs(*batch_costs(routes, distance_matrix))
+
+def swapped_edge_lengths(routes, rows, idx1, idx2, matrix):
+    """Soma, para cada troca `(rows[k], idx1[k], idx2[k])`, o comprimento das (até quatro) arestas que ela altera."""
+    n = routes.shape[1]
+    starts = np.sort(np.stack([idx1 - 1, idx1, idx2 - 1, idx2], axis=1) % n, axis=1)
+    # Em trocas adjacentes a mesma aresta aparece duas vezes e só pode ser contada uma vez
+    unique = np.ones(starts.shape, dtype=bool)
+    unique[:, 1:] = starts[:, 1:] != starts[:, :-1]
+    tails = routes[rows[:, None], starts]
+    heads = routes[rows[:, None], (starts + 1) % n]
+    return np.where(unique, matrix[tails, heads], 0).sum(axis=1, dtype=np.float64)
+
+def ox1(parent1, parent2, start_pos, end_pos):
+    """Crossover OX1 em O(n): copia `parent1[start_pos:end_pos+1]` e preenche o resto na ordem de `parent2`."""
+    parent1 = np.asarray(parent1)
+    parent2 = np.asarray(parent2)
+    n = len(parent1)
+    child_route = np.empty(n, dtype=parent1.dtype)
+    child_route[start_pos:end_pos+1] = parent1[start_pos:end_pos+1]
+    # Máscaras de genes já visitados e de posições livres substituem o `gene not in child_route`
+    taken = np.zeros(n, dtype=bool)
+    taken[parent1[start_pos:end_pos+1]] = True
+    free_slots = np.ones(n, dtype=bool)
+    free_slots[start_pos:end_pos+1] = False
+    child_route[free_slots] = parent2[~taken[parent2]]
+    return child_route
+
+def ox1_batch(parents1, parents2, start_pos, end_pos):
+    """Aplica o OX1 a todos os pares `(parents1[k], parents2[k])` de uma vez, com cortes `start_pos[k]..end_pos[k]`."""
+    count, n = parents1.shape
+    positions = np.arange(n)
+    in_segment = (positions >= start_pos[:, None]) & (positions <= end_pos[:, None])
+    rows = np.arange(count)[:, None]
+    taken = np.zeros((count, n), dtype=bool)
+    taken[rows, parents1] = in_segment
+    children = np.where(in_segment, parents1, 0).astype(parents1.dtype)
+    # Cada linha tem o mesmo número de posições livres e de genes restantes, e a indexação booleana é por linha
+    children[~in_segment] = parents2[~taken[rows, parents2]]
+    return children
+
+def draw_cut_points(rng, count, n):
+    """Sorteia `count` pares de cortes inclusivos e ordenados, como os dois `randint` do OX1."""
+    cuts = np.sort(rng.integers(0, n, size=(count, 2)), axis=1)
+    return cuts[:, 0], cuts[:, 1]
+
+def draw_swaps(rng, count, n, mutation_rate):
+    """Sorteia quais das `count` linhas sofrem mutação de troca e as duas posições distintas de cada uma."""
+    rows = np.flatnonzero(rng.random(count) < mutation_rate)
+    if n < 2:
+        rows = rows[:0]
+    # Duas posições distintas, com a mesma distribuição de `random.sample(range(n), 2)`
+    idx1 = rng.integers(0, n, size=len(rows))
+    idx2 = rng.integers(0, max(n - 1, 1), size=len(rows))
+    idx2 += idx2 >= idx1
+    return rows, idx1, idx2
+
+def apply_swaps(routes, rows, idx1, idx2):
+    """Troca, no próprio array, as posições `idx1[k]` e `idx2[k]` da linha `rows[k]`."""
+    routes[rows, idx1], routes[rows, idx2] = routes[rows, idx2], routes[rows, idx1]
+
+def swap_mutation_batch(routes, mutation_rate, rng):
+    """Aplica a mutação de troca, no próprio array, a cada linha sorteada com probabilidade `mutation_rate`."""
+    rows, idx1, idx2 = draw_swaps(rng, routes.shape[0], routes.shape[1], mutation_rate)
+    apply_swaps(routes, rows, idx1, idx2)
+    return rows, idx1, idx2
+
+# Resumo de uma geração: posições e aptidões dos dois melhores, média e desvio padrão da aptidão e diversidade
+PopulationStats = namedtuple('PopulationStats', [
+    'best_index', 'second_index', 'best_fitness', 'second_fitness', 'mean_fitness', 'std_fitness', 'diversity',
+])
+
+def edge_diversity(routes, best_row):
+    """Fração média das arestas (sem direção) das rotas `(pop_size, n)` que não aparecem na rota `best_row`."""
+    routes = np.asarray(routes)
+    n = routes.shape[1]
+    if n < 3:
+        return 0.0
+    best = routes[best_row]
+    successor = np.empty(n, dtype=routes.dtype)
+    predecessor = np.empty(n, dtype=routes.dtype)
+    successor[best] = np.roll(best, -1)
+    predecessor[best] = np.roll(best, 1)
+    # Arestas internas de cada linha e, à parte, a aresta que fecha o ciclo (evita copiar as rotas com np.roll)
+    current, following = routes[:, :-1], routes[:, 1:]
+    shared = np.count_nonzero((np.take(successor, current) == following) | (np.take(predecessor, current) == following))
+    last, first = routes[:, -1], routes[:, 0]
+    shared += np.count_nonzero((successor[last] == first) | (predecessor[last] == first))
+    return 1 - shared / routes.size
+
+def population_stats(fitness, routes):
+    """Calcula o `PopulationStats` de uma geração a partir do vetor de aptidão e das rotas."""
+    fitness = np.asarray(fitness)
+    best = int(fitness.argmax())
+    second = None
+    if len(fitness) > 1:
+        others = fitness.copy()
+        others[best] = -np.inf
+        second = int(others.argmax())
+    return PopulationStats(
+        best_index=best,
+        second_index=second,
+        best_fitness=float(fitness[best]),
+        second_fitness=float(fitness[second]) if second is not None else None,
+        mean_fitness=float(fitness.mean()),
+        std_fitness=float(fitness.std()),
+        diversity=edge_diversity(routes, best),
+    )
 
 class Individual:
     """Representa uma única rota (solução) na população do AG."""
-    def __init__(self, route, points):
-        """Inicializa um indivíduo com uma rota e calcula sua aptidão."""
+    # Sem `__dict__` por indivíduo: populações grandes ocupam menos memória e cada objeto é mais barato de criar
+    __slots__ = ('route', 'distance_matrix', 'fitness', 'route_length', 'capacity_penalty', 'priority_penalty')
+
+    def __init__(self, route, distance_matrix, costs=None):
+        """Inicializa um indivíduo com uma rota e calcula sua aptidão (ou reaproveita os custos já conhecidos)."""
         self.route = route
-        self.points = points
-        self.fitness = self.calculate_fitness()
+        self.distance_matrix = distance_matrix
+        if costs is None:
+            self.fitness = self.calculate_fitness()
+        else:
+            self.route_length, self.capacity_penalty, self.priority_penalty = costs
+            self.fitness = fitness_from_costs(*costs)
 
     def calculate_fitness(self):
-        """Calcula a aptidão da rota com base na distância e penalidades."""
-        total_distance = 0
-        max_capacity = 50 
-        current_volume = 0
-        priority_penalty_factor = 1000
-        penalty = 0
-
-        for i in range(len(self.route) - 1):
-            point_a_data = self.points[self.route[i]]
-            point_b_data = self.points[self.route[i+1]]
-            total_distance += self.get_distance(point_a_data['coords'], point_b_data['coords'])
-            current_volume += point_a_data['volume']
-            
-        total_distance += self.get_distance(self.points[self.route[-1]]['coords'], self.points[self.route[0]]['coords'])
-        current_volume += self.points[self.route[-1]]['volume']
-
-        if current_volume > max_capacity:
-            penalty += (current_volume - max_capacity) * 100
-
-        for i, gene_index in enumerate(self.route):
-            if self.points[gene_index]['priority'] == 1:
-                if i > 5:
-                    penalty += priority_penalty_factor
-                break
-
-        total_cost = total_distance + penalty
-        return 1 / (total_cost + 1)
+        """Calcula a aptidão da rota com base na distância e penalidades, guardando cada componente do custo."""
+        route = np.asarray(self.route)
+        fleet = self.distance_matrix.fleet
+        if fleet is not None:
+            split = self.distance_matrix.split(route)
+            self.route_length = float(split.length)
+            self.capacity_penalty = fleet_penalty(split, fleet)
+        else:
+            self.route_length = self.distance_matrix.route_length(route)
+            current_volume = self.distance_matrix.volumes[route].sum()
+            self.capacity_penalty = max(current_volume - MAX_CAPACITY, 0) * CAPACITY_PENALTY_FACTOR
+        self.priority_penalty = priority_penalty(route, self.distance_matrix)
+
+        return fitness_from_costs(self.route_length, self.capacity_penalty, self.priority_penalty)
+
+    def swap(self, idx1, idx2):
+        """Troca duas posições da rota e atualiza a aptidão em O(1), recalculando só as arestas afetadas."""
+        route = self.route
+        if self.distance_matrix.fleet is not None:
+            route[idx1], route[idx2] = route[idx2], route[idx1]
+            self.fitness = self.calculate_fitness()
+            return
+        n = len(route)
+        matrix = self.distance_matrix.matrix
+        edges = {(idx1 - 1) % n, idx1, (idx2 - 1) % n, idx2}
+        before = sum(matrix[route[k], route[(k + 1) % n]] for k in edges)
+        route[idx1], route[idx2] = route[idx2], route[idx1]
+        after = sum(matrix[route[k], route[(k + 1) % n]] for k in edges)
+        self.route_length += float(after - before)
+
+        # O volume total não muda; a penalidade de prioridade só muda se a troca mexer no início da rota
+        if min(idx1, idx2) <= PRIORITY_MAX_POSITION:
+            self.priority_penalty = priority_penalty(route, self.distance_matrix)
+        self.fitness = fitness_from_costs(self.route_length, self.capacity_penalty, self.priority_penalty)
 
     @staticmethod
     def get_distance(point1, point2):
@@ -46,33 +292,48 @@ class Individual:
 
 class Population:
     """Gerencia a coleção de indivíduos (rotas) e o processo evolutivo."""
-    def __init__(self, size, points):
+    def __init__(self, size, distance_matrix):
         """Cria uma população inicial de rotas aleatórias."""
+        self._stats = None
         self.population = []
         for _ in range(size):
-            route = list(np.random.permutation(len(points)))
-            self.population.append(Individual(route, points))
+            route = list(np.random.permutation(len(distance_matrix)))
+            self.population.append(Individual(route, distance_matrix))
+
+    @classmethod
+    def from_routes(cls, routes, distance_matrix, costs=None):
+        """Monta uma população a partir de rotas existentes (por exemplo, de um checkpoint)."""
+        population = cls.__new__(cls)
+        population._stats = None
+        population.population = []
+        for index, route in enumerate(routes):
+            route = [int(city) for city in route]
+            individual_costs = None if costs is None else tuple(float(component[index]) for component in costs)
+            population.population.append(Individual(route, distance_matrix, costs=individual_costs))
+        return population
+
+    @property
+    def stats(self):
+        """`PopulationStats` da geração atual, calculado na primeira leitura depois de `evolve` e reaproveitado."""
+        if self._stats is None:
+            fitness = np.fromiter((individual.fitness for individual in self.population), dtype=np.float64,
+                                  count=len(self.population))
+            routes = np.array([individual.route for individual in self.population], dtype=np.int64)
+            self._stats = population_stats(fitness, routes)
+        return self._stats
 
     def get_fittest(self):
         """Retorna o indivíduo mais apto (melhor rota) da população."""
-        best_individual = self.population[0]
-        for individual in self.population:
-            if individual.fitness > best_individual.fitness:
-                best_individual = individual
-        return best_individual
+        return self.population[self.stats.best_index]
 
     def get_second_fittest(self):
         """Encontra o segundo indivíduo mais apto da população."""
-        if len(self.population) < 2:
-            return None
-        
-        sorted_population = sorted(self.population, key=lambda x: x.fitness, reverse=True)
-        return sorted_population[1]
+        second = self.stats.second_index
+        return self.population[second] if second is not None else None
 
     def get_average_fitness(self):
-        """Calcula a aptidão média de toda a população."""
-        total_fitness = sum(ind.fitness for ind in self.population)
-        return total_fitness / len(self.population)
+        """Retorna a aptidão média de toda a população."""
+        return self.stats.mean_fitness
 
     def select_parent_tournament(self, pool_size=5):
         """Seleciona um indivíduo para reprodução usando seleção por torneio."""
@@ -88,7 +349,11 @@ class Population:
         if start_pos > end_pos:
             start_pos, end_pos = end_pos, start_pos
         child_route[start_pos:end_pos+1] = parent1.route[start_pos:end_pos+1]
-        parent2_genes = [gene for gene in parent2.route if gene not in child_route]
+        # Marca os genes copiados para que o filtro do parent2 seja O(n) em vez de O(n²)
+        taken = [False] * len(parent1.route)
+        for gene in parent1.route[start_pos:end_pos+1]:
+            taken[gene] = True
+        parent2_genes = [gene for gene in parent2.route if not taken[gene]]
         child_route_filled = []
         p2_idx = 0
         for gene in child_route:
@@ -106,15 +371,294 @@ class Population:
             route[idx1], route[idx2] = route[idx2], route[idx1]
         return route
 
-    def evolve(self, mutation_rate, points):
-        """Evolui a população para a próxima geração usando elitismo, crossover e mutação."""
+    def evolve(self, mutation_rate, distance_matrix, local_search=None, profiler=NULL_PROFILER, pool_size=5):
+        """Evolui a população para a próxima geração usando elitismo, crossover, mutação e busca local."""
         new_population = []
-        elite = self.get_fittest()
-        new_population.append(Individual(elite.route, points))
+        # A rota da elite não muda, então o mesmo objeto (e sua aptidão em cache) segue para a próxima geração
+        with profiler.phase('elite'):
+            elite = max(self.population, key=lambda individual: individual.fitness)
+        new_population.append(elite)
         while len(new_population) < len(self.population):
-            parent1 = self.select_parent_tournament()
-            parent2 = self.select_parent_tournament()
-            child_route = self.crossover_ox1(parent1, parent2)
-            child_route = self.mutate(child_route, mutation_rate)
-            new_population.append(Individual(child_route, points))
-        self.population = new_population
\ No newline at end of file
+            with profiler.phase('selection'):
+                parent1 = self.select_parent_tournament(pool_size)
+                parent2 = self.select_parent_tournament(pool_size)
+            with profiler.phase('crossover'):
+                child_route = self.crossover_ox1(parent1, parent2)
+            with profiler.phase('fitness'):
+                child = Individual(child_route, distance_matrix)
+            with profiler.phase('mutation'):
+                if random.random() < mutation_rate:
+                    child.swap(*random.sample(range(len(child.route)), 2))
+            new_population.append(child)
+        profiler.count('evaluations', len(new_population) - 1)
+        self.population = new_population
+        if local_search is not None:
+            with profiler.phase('local_search'):
+                local_search.apply_to_individuals(self.population)
+        self._stats = None
+
+class SteadyStatePopulation(Population):
+    """Variante de regime permanente da `Population`: cada filho substitui no lugar o pior indivíduo, se for melhor."""
+    def __init__(self, size, distance_matrix):
+        """Cria a população inicial como a `Population` e prepara os buffers reaproveitados."""
+        super().__init__(size, distance_matrix)
+        self._init_buffers(distance_matrix)
+
+    @classmethod
+    def from_routes(cls, routes, distance_matrix, costs=None):
+        """Monta a população a partir de rotas existentes (como em `Population.from_routes`)."""
+        population = super().from_routes(routes, distance_matrix, costs)
+        population._init_buffers(distance_matrix)
+        return population
+
+    def _init_buffers(self, distance_matrix):
+        """Cria o indivíduo reserva, as marcas do crossover, os buffers da avaliação e o vetor de aptidão."""
+        n = len(distance_matrix)
+        self.distance_matrix = distance_matrix
+        self._spare = Individual(list(range(n)), distance_matrix)
+        self._taken = bytearray(n)
+        self._route_buffer = np.empty(n, dtype=np.intp)
+        self._edge_buffer = np.empty(n, dtype=np.intp)
+        self._length_buffer = np.empty(n, dtype=distance_matrix.matrix.dtype)
+        # Toda rota visita todos os pontos, então o volume (e a penalidade de capacidade) é o mesmo para qualquer filho
+        self._capacity_penalty = max(float(distance_matrix.volumes.sum()) - MAX_CAPACITY, 0) * CAPACITY_PENALTY_FACTOR
+        self._priority_points = set(np.flatnonzero(distance_matrix.priorities == 1).tolist())
+        self.fitness = np.fromiter((individual.fitness for individual in self.population), dtype=np.float64,
+                                   count=len(self.population))
+
+    def evaluate_into(self, individual):
+        """Avalia a rota de `individual` nos buffers da população, sem alocar arrays, e atualiza seus custos."""
+        if self.distance_matrix.fleet is not None:
+            individual.fitness = individual.calculate_fitness()
+            return individual.fitness
+        route = individual.route
+        n = len(route)
+        route_buffer = self._route_buffer
+        edges = self._edge_buffer
+        route_buffer[:] = route
+        # Índice plano de cada aresta (i -> i+1, fechando no início) na matriz achatada
+        np.multiply(route_buffer, n, out=edges)
+        edges[:-1] += route_buffer[1:]
+        edges[-1] += route_buffer[0]
+        np.take(self.distance_matrix.matrix.reshape(-1), edges, out=self._length_buffer)
+        individual.route_length = float(self._length_buffer.sum(dtype=np.float64))
+        individual.capacity_penalty = self._capacity_penalty
+        priority_points = self._priority_points
+        if priority_points and not any(route[k] in priority_points for k in range(min(PRIORITY_MAX_POSITION + 1, n))):
+            individual.priority_penalty = PRIORITY_PENALTY_FACTOR
+        else:
+            individual.priority_penalty = 0
+        individual.fitness = fitness_from_costs(individual.route_length, individual.capacity_penalty,
+                                                individual.priority_penalty)
+        return individual.fitness
+
+    def crossover_into(self, child, parent1, parent2):
+        """Crossover OX1 escrito direto na lista `child`, sem alocar a rota filha (mesmos sorteios de `crossover_ox1`)."""
+        route1 = parent1.route
+        n = len(route1)
+        start_pos = random.randint(0, n - 1)
+        end_pos = random.randint(0, n - 1)
+        if start_pos > end_pos:
+            start_pos, end_pos = end_pos, start_pos
+        taken = self._taken
+        for position in range(start_pos, end_pos + 1):
+            gene = route1[position]
+            child[position] = gene
+            taken[gene] = 1
+        position = 0
+        for gene in parent2.route:
+            if taken[gene]:
+                continue
+            if position == start_pos:
+                position = end_pos + 1
+            child[position] = gene
+            position += 1
+        for position in range(start_pos, end_pos + 1):
+            taken[route1[position]] = 0
+        return child
+
+    def evolve(self, mutation_rate, distance_matrix, local_search=None, profiler=NULL_PROFILER, pool_size=5,
+               replacements=None):
+        """Gera `replacements` filhos, cada um disputando a vaga do pior indivíduo assim que é avaliado."""
+        population = self.population
+        fitness = self.fitness
+        replacements = len(population) - 1 if replacements is None else replacements
+        for _ in range(replacements):
+            with profiler.phase('selection'):
+                parent1 = self.select_parent_tournament(pool_size)
+                parent2 = self.select_parent_tournament(pool_size)
+            child = self._spare
+            with profiler.phase('crossover'):
+                self.crossover_into(child.route, parent1, parent2)
+            with profiler.phase('fitness'):
+                self.evaluate_into(child)
+            with profiler.phase('mutation'):
+                if random.random() < mutation_rate:
+                    child.swap(*random.sample(range(len(child.route)), 2))
+            with profiler.phase('replacement'):
+                # Filhos com aptidão idêntica à de alguém (quase sempre um clone) são descartados, para a
+                # substituição contínua não encher a população de cópias da elite
+                worst = int(fitness.argmin())
+                if child.fitness > fitness[worst] and not (fitness == child.fitness).any():
+                    self._spare = population[worst]
+                    population[worst] = child
+                    fitness[worst] = child.fitness
+        profiler.count('evaluations', replacements)
+        if local_search is not None:
+            with profiler.phase('local_search'):
+                for row in local_search.apply_to_individuals(population):
+                    fitness[row] = population[row].fitness
+        self._stats = None
+
+class ArrayPopulation:
+    """Alternativa à `Population` com todas as rotas em um único array `(pop_size, n)` e aptidão calculada por geração."""
+    def __init__(self, size, distance_matrix, rng=None):
+        """Cria uma população inicial de permutações aleatórias e avalia todas de uma vez."""
+        self.rng = np.random.default_rng() if rng is None else rng
+        self.distance_matrix = distance_matrix
+        base = np.arange(len(distance_matrix), dtype=np.int32)
+        self.routes = self.rng.permuted(np.tile(base, (size, 1)), axis=1)
+        self.set_costs(*batch_costs(self.routes, distance_matrix))
+
+    @classmethod
+    def from_routes(cls, routes, distance_matrix, costs=None, rng=None):
+        """Monta uma população a partir de rotas existentes, reaproveitando `costs` (como em `Population.from_routes`)."""
+        population = cls.__new__(cls)
+        population.rng = np.random.default_rng() if rng is None else rng
+        population.distance_matrix = distance_matrix
+        population.routes = np.array(routes, dtype=np.int32).reshape(len(routes), -1)
+        if costs is None:
+            costs = batch_costs(population.routes, distance_matrix)
+        population.set_costs(*(np.array(component) for component in costs))
+        return population
+
+    def __len__(self):
+        """Retorna o número de indivíduos da população."""
+        return len(self.routes)
+
+    def set_costs(self, route_lengths, capacity_penalties, priority_penalties):
+        """Guarda os componentes de custo de cada linha e recalcula o vetor de aptidão a partir deles."""
+        self.route_lengths = route_lengths
+        self.capacity_penalties = capacity_penalties
+        self.priority_penalties = priority_penalties
+        self.fitness = fitness_from_costs(route_lengths, capacity_penalties, priority_penalties)
+        self._stats = None
+
+    @property
+    def stats(self):
+        """`PopulationStats` da geração atual, calculado na primeira leitura depois de uma mudança e reaproveitado."""
+        if self._stats is None:
+            self._stats = population_stats(self.fitness, self.routes)
+        return self._stats
+
+    def get_individual(self, index):
+        """Empacota a linha `index` como um `Individual`, reaproveitando os custos já calculados."""
+        costs = (float(self.route_lengths[index]), float(self.capacity_penalties[index]), float(self.priority_penalties[index]))
+        return Individual(list(self.routes[index]), self.distance_matrix, costs=costs)
+
+    def get_fittest(self):
+        """Retorna o indivíduo mais apto (melhor rota) da população."""
+        return self.get_individual(self.stats.best_index)
+
+    def get_second_fittest(self):
+        """Encontra o segundo indivíduo mais apto da população sem ordenar o vetor inteiro."""
+        second = self.stats.second_index
+        return self.get_individual(second) if second is not None else None
+
+    def get_average_fitness(self):
+        """Retorna a aptidão média de toda a população."""
+        return self.stats.mean_fitness
+
+    def select_parent_tournament(self, pool_size=5):
+        """Seleciona, por torneio sobre o vetor de aptidão, o índice da linha de um pai."""
+        tournament_pool = self.rng.choice(len(self.fitness), pool_size, replace=False)
+        return int(tournament_pool[self.fitness[tournament_pool].argmax()])
+
+    def select_parents_tournament(self, count, pool_size=5):
+        """Executa `count` torneios de uma só vez e retorna os índices das linhas vencedoras."""
+        # Sorteia os competidores direto, em O(count·pool_size), e sorteia de novo só os torneios com repetidos
+        size = len(self.fitness)
+        pool_size = min(pool_size, size)
+        tournament_pools = self.rng.integers(0, size, size=(count, pool_size))
+        repeated = np.arange(count)
+        while len(repeated):
+            ordered = np.sort(tournament_pools[repeated], axis=1)
+            repeated = repeated[(ordered[:, 1:] == ordered[:, :-1]).any(axis=1)]
+            tournament_pools[repeated] = self.rng.integers(0, size, size=(len(repeated), pool_size))
+        winners = self.fitness[tournament_pools].argmax(axis=1)
+        return tournament_pools[np.arange(count), winners]
+
+    def replace_worst(self, routes):
+        """Substitui os piores indivíduos pelas rotas recebidas (por exemplo, migrantes de outra ilha)."""
+        routes = np.asarray(routes, dtype=self.routes.dtype).reshape(-1, self.routes.shape[1])[:len(self.routes)]
+        if not len(routes):
+            return
+        worst = np.argpartition(self.fitness, len(routes) - 1)[:len(routes)]
+        self.routes[worst] = routes
+        lengths, capacity, priority = batch_costs(routes, self.distance_matrix)
+        self.route_lengths[worst] = lengths
+        self.capacity_penalties[worst] = capacity
+        self.priority_penalties[worst] = priority
+        self.fitness[worst] = fitness_from_costs(lengths, capacity, priority)
+        self._stats = None
+
+    def crossover_ox1(self, parent1, parent2):
+        """Realiza o crossover de ordem (OX1) entre duas linhas de rotas."""
+        start_pos, end_pos = sorted(self.rng.integers(0, self.routes.shape[1], size=2))
+        return ox1(self.routes[parent1], self.routes[parent2], start_pos, end_pos)
+
+    def mutate(self, route, mutation_rate):
+        """Aplica mutação de troca em uma rota (array) com base na taxa de mutação."""
+        swap_mutation_batch(route[None, :], mutation_rate, self.rng)
+        return route
+
+    def evolve(self, mutation_rate, distance_matrix=None, local_search=None, profiler=NULL_PROFILER, pool_size=5):
+        """Evolui a população com operadores em lote, reaproveitando o custo da elite e das mutações."""
+        if distance_matrix is not None:
+            self.distance_matrix = distance_matrix
+        size, n = self.routes.shape
+        with profiler.phase('selection'):
+            parents = self.select_parents_tournament(2 * (size - 1), pool_size).reshape(2, -1)
+        with profiler.phase('crossover'):
+            start_pos, end_pos = draw_cut_points(self.rng, size - 1, n)
+            children = ox1_batch(self.routes[parents[0]], self.routes[parents[1]], start_pos, end_pos)
+        with profiler.phase('fitness'):
+            lengths, capacity, priority = batch_costs(children, self.distance_matrix)
+
+        # A troca altera no máximo quatro arestas e o início da rota; o volume total não muda. Com frota, os cortes
+        # das viagens podem mudar, e as linhas mutadas são reavaliadas inteiras
+        with profiler.phase('mutation'):
+            rows, idx1, idx2 = draw_swaps(self.rng, size - 1, n, mutation_rate)
+            if self.distance_matrix.fleet is not None:
+                apply_swaps(children, rows, idx1, idx2)
+                lengths[rows], capacity[rows], priority[rows] = batch_costs(children[rows], self.distance_matrix)
+            else:
+                matrix = self.distance_matrix.matrix
+                before = swapped_edge_lengths(children, rows, idx1, idx2, matrix)
+                apply_swaps(children, rows, idx1, idx2)
+                lengths[rows] += swapped_edge_lengths(children, rows, idx1, idx2, matrix) - before
+                priority[rows] = batch_priority_penalties(children[rows], self.distance_matrix)
+
+        with profiler.phase('elite'):
+            elite = self.fitness.argmax()
+            self.routes = np.concatenate([self.routes[None, elite], children])
+            self.set_costs(
+                np.concatenate([self.route_lengths[None, elite], lengths]),
+                np.concatenate([self.capacity_penalties[None, elite], capacity]),
+                np.concatenate([self.priority_penalties[None, elite], priority]),
+            )
+        profiler.count('evaluations', size - 1)
+        if local_search is not None:
+            with profiler.phase('local_search'):
+                local_search.apply(self)
+
+def population_arrays(population):
+    """Extrai as rotas e os componentes de custo de uma `Population` ou `ArrayPopulation` como arrays."""
+    if isinstance(population, ArrayPopulation):
+        return population.routes, population.route_lengths, population.capacity_penalties, population.priority_penalties
+    individuals = population.population
+    routes = np.array([individual.route for individual in individuals], dtype=np.int32)
+    route_lengths = np.array([individual.route_length for individual in individuals], dtype=np.float64)
+    capacity_penalties = np.array([individual.capacity_penalty for individual in individuals], dtype=np.float64)
+    priority_penalties = np.array([individual.priority_penalty for individual in individuals], dtype=np.float64)
+    return routes, route_lengths, capacity_penalties, priority_penalties
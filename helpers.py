@@ -1,16 +1,11 @@
 """Funções auxiliares para desenho, geração de dados e chamadas de API."""
 
-import os
-import random
+from functools import lru_cache
+import numpy as np
 import pygame
-import openai
-from dotenv import load_dotenv
-from ga_classes import Individual
-import matplotlib.pyplot as plt
-from matplotlib.backends.backend_agg import FigureCanvasAgg
-
-# Carrega as variáveis de ambiente do arquivo .env
-load_dotenv()
+from point_data import generate_points
+from render_cache import get_font, render_text
+from report import start_report
 
 PALETTE = {
     "background": (245, 245, 245),
@@ -25,160 +20,337 @@ PALETTE = {
     "point_critical": (231, 76, 60),
     "point_regular": (0, 0, 139),
     "point_glow": (255, 255, 0),
+    "depot": (39, 174, 96),
 }
 
-def generate_points(n):
-    """Gera uma lista de `n` pontos aleatórios com coordenadas, prioridade e volume."""
-    points = []
-    for _ in range(n):
-        x = random.randint(550, 950)
-        y = random.randint(280, 880)
-        priority = random.choice([0, 1])
-        volume = random.randint(1, 10)
-        points.append({'coords': (x, y), 'priority': priority, 'volume': volume})
-    return points
-
-def draw_points(screen, points):
-    """Desenha os pontos de entrega na tela."""
-    for point in points:
-        color = PALETTE["point_critical"] if point['priority'] == 1 else PALETTE["point_regular"]
-        pygame.draw.circle(screen, color, point['coords'], 5)
-
-def draw_legend(screen, position):
-    """Desenha a legenda de cores dos pontos na tela."""
-    font = pygame.font.Font(None, 22)
+# Cores das viagens de cada veículo, repetidas em ciclo quando há mais viagens que cores
+TRIP_COLORS = [
+    (52, 152, 219), (230, 126, 34), (155, 89, 182), (26, 188, 156), (241, 196, 15),
+    (121, 85, 72), (52, 73, 94), (46, 204, 113), (149, 165, 166), (211, 84, 0),
+]
+
+# Acima de LOD_POINTS pontos, o mapa entra no modo de nível de detalhe: pontos viram carimbos de 2x2 pixels
+# gravados direto no array da superfície, as rotas usam linhas de 1 pixel e a segunda melhor rota é omitida
+LOD_POINTS = 1500
+
+# Abaixo de POINT_LAYER_MIN pontos, redesenhar os círculos custa menos que copiar uma camada transparente inteira
+POINT_LAYER_MIN = 100
+
+def marker_radius(num_points):
+    """Raio dos círculos dos pontos: menor em instâncias mais densas, para o mapa continuar legível."""
+    return 5 if num_points <= 200 else 3
+
+def draw_point_markers(surface, positions, priorities):
+    """Desenha pontos já projetados (coordenadas de `surface`), com os prioritários por cima dos regulares."""
+    order = np.argsort(priorities, kind='stable')
+    positions, priorities = positions[order], priorities[order]
+    if len(positions) > LOD_POINTS:
+        stamp_points(surface, positions, priorities)
+        return
+    radius = marker_radius(len(positions))
+    for position, priority in zip(positions.tolist(), priorities.tolist()):
+        color = PALETTE["point_critical"] if priority == 1 else PALETTE["point_regular"]
+        pygame.draw.circle(surface, color, position, radius)
+
+def stamp_points(surface, positions, priorities, size=2):
+    """Grava cada ponto como um quadrado de `size` pixels direto nos arrays da superfície, sem uma chamada por ponto."""
+    width, height = surface.get_size()
+    xy = np.rint(positions).astype(np.intp)
+    inside = (xy[:, 0] >= 0) & (xy[:, 0] <= width - size) & (xy[:, 1] >= 0) & (xy[:, 1] <= height - size)
+    xy, priorities = xy[inside], priorities[inside]
+    colors = np.where((priorities == 1)[:, None], PALETTE["point_critical"], PALETTE["point_regular"])
+    rgb = pygame.surfarray.pixels3d(surface)
+    alpha = pygame.surfarray.pixels_alpha(surface) if surface.get_flags() & pygame.SRCALPHA else None
+    for dx in range(size):
+        for dy in range(size):
+            rgb[xy[:, 0] + dx, xy[:, 1] + dy] = colors
+            if alpha is not None:
+                alpha[xy[:, 0] + dx, xy[:, 1] + dy] = 255
+    # Os arrays travam a superfície enquanto existirem
+    del rgb, alpha
+
+def draw_points(screen, points, area):
+    """Desenha os pontos de entrega (um `PointStore`) projetados na área `area` da tela."""
+    draw_point_markers(screen, points.project(area), points.priorities)
+
+@lru_cache(maxsize=2)
+def build_legend_surface(depot=False):
+    """Pré-renderiza a legenda de cores dos pontos (e do depósito, com `depot`); cada variante é feita uma vez."""
+    font = get_font(22)
     background_color = (255, 255, 255, 180)
     legend_items = [
         (PALETTE["point_critical"], "Ponto Prioritário (Urgente)"),
         (PALETTE["point_regular"], "Ponto Regular")
     ]
-    legend_surface = pygame.Surface((250, 60), pygame.SRCALPHA)
+    if depot:
+        legend_items.append((PALETTE["depot"], "Depósito"))
+    legend_surface = pygame.Surface((250, 10 + 25 * len(legend_items)), pygame.SRCALPHA)
     pygame.draw.rect(legend_surface, background_color, legend_surface.get_rect(), border_radius=10)
     y_offset = 15
     for color, text in legend_items:
-        pygame.draw.circle(legend_surface, color, (20, y_offset), 5)
+        if color == PALETTE["depot"]:
+            pygame.draw.rect(legend_surface, color, pygame.Rect(15, y_offset - 5, 10, 10))
+        else:
+            pygame.draw.circle(legend_surface, color, (20, y_offset), 5)
         text_surface = font.render(text, True, PALETTE["text_dark"])
         legend_surface.blit(text_surface, (35, y_offset - 8))
         y_offset += 25
-    screen.blit(legend_surface, position)
+    return legend_surface
 
-def draw_route(screen, route, points, color, thickness=2):
-    """Desenha uma rota (lista de pontos) na tela."""
-    if not route:
+def draw_legend(screen, position, depot=False):
+    """Desenha a legenda de cores dos pontos na tela (com o depósito, se houver frota)."""
+    screen.blit(build_legend_surface(depot), position)
+
+def draw_route(screen, route, points, area, color, thickness=2):
+    """Desenha uma rota (sequência de índices de `points`) projetada na área `area` da tela, como uma única polilinha fechada."""
+    if len(route) < 2:
         return
-    for i in range(len(route) - 1):
-        pygame.draw.line(screen, color, points[route[i]]['coords'], points[route[i+1]]['coords'], thickness)
-    pygame.draw.line(screen, color, points[route[-1]]['coords'], points[route[0]]['coords'], thickness)
+    positions = points.project(area)[np.asarray(route)].tolist()
+    pygame.draw.lines(screen, color, True, positions, thickness)
+
+def draw_trips(screen, trips, points, area, depot, thickness=3):
+    """Desenha cada viagem como uma polilinha fechada que sai do depósito e volta a ele, uma cor por veículo.
+
+    `depot` é a posição do depósito nas coordenadas dos pontos; ele é marcado por um quadrado.
+    """
+    projected = points.project(area)
+    depot_position = points.project_point(depot, area)
+    for number, trip in enumerate(trips):
+        positions = [depot_position] + projected[np.asarray(trip)].tolist()
+        pygame.draw.lines(screen, TRIP_COLORS[number % len(TRIP_COLORS)], True, positions, thickness)
+    draw_depot(screen, depot_position)
+
+def draw_depot(screen, position, size=12):
+    """Marca o depósito (já projetado) com um quadrado."""
+    rect = pygame.Rect(0, 0, size, size)
+    rect.center = (round(position[0]), round(position[1]))
+    pygame.draw.rect(screen, PALETTE["depot"], rect)
+    pygame.draw.rect(screen, PALETTE["text_dark"], rect, 1)
+
+def map_signature(points, best_route=None, second_route=None, trips=None):
+    """Identidade do conteúdo do mapa: o conjunto de pontos e as rotas visíveis (sem a segunda no modo de detalhe).
+
+    Com as viagens da frota (`trips`), a segunda melhor rota não aparece e as viagens entram na identidade.
+    """
+    if best_route is None:
+        return (points.key, None, None)
+    if len(points) > LOD_POINTS or trips is not None:
+        second_route = None
+    if trips is not None:
+        return (points.key, tuple(best_route), None, tuple(tuple(trip) for trip in trips))
+    return (points.key, tuple(best_route), tuple(second_route) if second_route is not None else None)
+
+def lod_positions(positions):
+    """Arredonda uma polilinha para pixels e descarta vértices consecutivos que caem no mesmo pixel."""
+    pixels = np.rint(positions)
+    keep = np.ones(len(pixels), dtype=bool)
+    keep[1:] = (pixels[1:] != pixels[:-1]).any(axis=1)
+    return pixels[keep]
+
+class MapLayers:
+    """Camadas em cache da área do mapa: os pontos em uma camada transparente e o mapa composto em uma opaca.
+
+    A camada dos pontos (usada a partir de `POINT_LAYER_MIN` pontos; abaixo disso os círculos são desenhados direto no
+    mapa composto) só é redesenhada quando o conjunto de pontos muda (`PointStore.key`). O mapa composto
+    (fundo, rotas em polilinhas e pontos) só é remontado quando muda `map_signature` ou o fundo; nos demais quadros,
+    `draw` apenas copia a superfície pronta. Com mais de `LOD_POINTS` pontos, as camadas usam o modo de nível de
+    detalhe: pontos carimbados, rotas de 1 pixel sem vértices repetidos e sem a segunda melhor rota. Com as viagens
+    da frota, cada viagem é desenhada a partir do depósito, em sua cor (`draw_trips`), no lugar das rotas.
+    """
+    def __init__(self, rect):
+        """Guarda a área do mapa; as superfícies são criadas na primeira vez que forem desenhadas."""
+        self.rect = pygame.Rect(rect)
+        self.local_area = (0, 0, self.rect.width, self.rect.height)
+        self.surface = None
+        self.points_layer = None
+        self._points_key = None
+        self._cache_key = None
+
+    def _render_points(self, points):
+        """Redesenha a camada transparente dos pontos."""
+        if self.points_layer is None:
+            self.points_layer = pygame.Surface(self.rect.size, pygame.SRCALPHA)
+        self.points_layer.fill((0, 0, 0, 0))
+        draw_point_markers(self.points_layer, points.project(self.local_area), points.priorities)
+
+    def _render(self, points, best_route, second_route, background, trips=None, depot=None):
+        """Remonta o mapa composto: fundo, segunda melhor rota (cinza), melhor rota (ou as viagens) e os pontos."""
+        if self.surface is None:
+            self.surface = pygame.Surface(self.rect.size)
+        if background is not None:
+            self.surface.blit(background, (0, 0), self.rect)
+        else:
+            self.surface.fill(PALETTE["background"])
+        if trips is not None:
+            if len(points) > LOD_POINTS:
+                projected = points.project(self.local_area)
+                depot_position = points.project_point(depot, self.local_area)
+                for number, trip in enumerate(trips):
+                    positions = lod_positions(np.vstack([depot_position, projected[np.asarray(trip)]]))
+                    if len(positions) > 1:
+                        pygame.draw.lines(self.surface, TRIP_COLORS[number % len(TRIP_COLORS)], True, positions.tolist(), 1)
+                draw_depot(self.surface, depot_position)
+            else:
+                draw_trips(self.surface, trips, points, self.local_area, depot)
+        elif best_route is not None:
+            projected = points.project(self.local_area)
+            if len(points) > LOD_POINTS:
+                positions = lod_positions(projected[np.asarray(best_route)])
+                if len(positions) > 1:
+                    pygame.draw.lines(self.surface, PALETTE["route_color"], True, positions.tolist(), 1)
+            else:
+                if second_route is not None:
+                    draw_route(self.surface, second_route, points, self.local_area, (100, 100, 100), thickness=2)
+                draw_route(self.surface, best_route, points, self.local_area, PALETTE["route_color"], thickness=3)
+        if len(points) >= POINT_LAYER_MIN:
+            self.surface.blit(self.points_layer, (0, 0))
+        else:
+            draw_point_markers(self.surface, points.project(self.local_area), points.priorities)
+
+    def draw(self, screen, points, best_route=None, second_route=None, background=None, trips=None, depot=None):
+        """Copia o mapa para a tela, remontando antes só o que ficou desatualizado.
+
+        `background` é a superfície da tela inteira com o fundo estático; a área do mapa é recortada dela. `trips` e
+        `depot` são as viagens da melhor rota e a posição do depósito, quando há frota.
+        """
+        if self._points_key != points.key and len(points) >= POINT_LAYER_MIN:
+            self._render_points(points)
+            self._points_key = points.key
+        cache_key = (id(background), map_signature(points, best_route, second_route, trips))
+        if cache_key != self._cache_key:
+            self._render(points, best_route, second_route, background, trips, depot)
+            self._cache_key = cache_key
+        screen.blit(self.surface, self.rect.topleft)
+
+_map_layers = {}
+
+def draw_map(screen, points, rect, best_route=None, second_route=None, background=None, trips=None, depot=None):
+    """Desenha rotas (ou as viagens da frota) e pontos na área `rect`, reaproveitando um `MapLayers` por área da tela."""
+    key = tuple(rect)
+    if key not in _map_layers:
+        _map_layers[key] = MapLayers(rect)
+    _map_layers[key].draw(screen, points, best_route, second_route, background, trips, depot)
 
 def draw_text(screen, text, position, font_size=20, color=PALETTE["text_dark"], center=True):
-    """Renderiza e exibe um texto na tela."""
-    font = pygame.font.Font(None, font_size)
-    text_surface = font.render(text, True, color)
+    """Renderiza e exibe um texto na tela, reaproveitando superfícies já renderizadas."""
+    text_surface = render_text(text, font_size, color)
     if center:
         text_rect = text_surface.get_rect(center=position)
     else:
         text_rect = text_surface.get_rect(midleft=position)
     screen.blit(text_surface, text_rect)
 
-def convert_color(rgb_tuple):
-    """Converte uma cor RGB para o formato do Matplotlib (0-1)."""
-    return (rgb_tuple[0] / 255.0, rgb_tuple[1] / 255.0, rgb_tuple[2] / 255.0)
+def format_tick(value):
+    """Formata o rótulo de um eixo do gráfico (notação científica para aptidões muito pequenas)."""
+    if value == 0:
+        return "0"
+    if abs(value) < 0.01 or abs(value) >= 100000:
+        return f"{value:.2e}"
+    return f"{value:.2f}"
 
-def draw_plot(screen, history, rect, x_label='Geração', y_label='Aptidão'):
-    """Desenha o gráfico de evolução da aptidão usando Matplotlib."""
-    if not history:
-        placeholder_color = (220, 220, 220)
-        pygame.draw.rect(screen, placeholder_color, rect, border_radius=10)
-        draw_text(screen, "Aguardando simulação...", rect.center, font_size=20, color=(100, 100, 100))
-        return
+class FitnessChart:
+    """Gráfico de evolução da aptidão desenhado com o Pygame em uma superfície em cache.
 
-    generations = list(range(len(history)))
-    line_color = convert_color(PALETTE['primary'])
-    fig, ax = plt.subplots(figsize=(rect.width / 100, rect.height / 100), dpi=100)
-    ax.plot(generations, history, color=line_color)
-    ax.set_ylabel(y_label)
-    ax.set_xlabel(x_label)
-    ax.set_title("Evolução da Aptidão")
-    ax.grid(True)
-    plt.tight_layout(pad=0.5)
-    canvas = FigureCanvasAgg(fig)
-    canvas.draw()
-    renderer = canvas.get_renderer()
-    raw_data = renderer.tostring_argb()
-    size = canvas.get_width_height()
-    surf = pygame.image.fromstring(raw_data, size, "ARGB")
-    plt.close(fig)
-    scaled_surf = pygame.transform.scale(surf, (rect.width, rect.height))
-    screen.blit(scaled_surf, rect.topleft)
-
-def generate_llm_report(screen, width, height, best_individual, points):
-    """Gera um relatório de rota em Markdown usando a API da OpenAI, mostrando uma tela de loading."""
-    # --- Tela de Loading ---
-    overlay = pygame.Surface((width, height), pygame.SRCALPHA)
-    overlay.fill((0, 0, 0, 180))  # Overlay preto semi-transparente
-    screen.blit(overlay, (0, 0))
-    draw_text(screen, "Gerando relatório com IA...", (width // 2, height // 2 - 20), font_size=30, color=PALETTE["text_light"])
-    draw_text(screen, "Aguarde, a tela pode congelar por alguns segundos.", (width // 2, height // 2 + 20), font_size=20, color=PALETTE["text_light"])
-    pygame.display.flip()
-
-    print("Gerando relatório com a API da OpenAI... Isso pode levar alguns segundos.")
-    api_key = os.getenv("OPENAI_API_KEY")
-    if not api_key or api_key == "SUA_CHAVE_DA_API_AQUI":
-        print("ERRO: Chave da API da OpenAI não configurada.")
-        print("Por favor, defina a variável de ambiente OPENAI_API_KEY no arquivo .env")
-        return
+    A superfície só é redesenhada quando chegam novos pontos no histórico, e históricos longos são reduzidos à
+    largura em pixels da área de plotagem (mínimo e máximo por coluna), então o custo por quadro não cresce com
+    o número de gerações.
+    """
+    MARGIN_LEFT, MARGIN_RIGHT, MARGIN_TOP, MARGIN_BOTTOM = 70, 15, 35, 45
 
-    client = openai.OpenAI(api_key=api_key)
-
-    # --- 1. Coleta e Formatação dos Dados ---
-    route_indices = best_individual.route
-    ordered_points = [points[i] for i in route_indices]
-    total_distance = 1 / best_individual.fitness if best_individual.fitness > 0 else float('inf')
-    total_volume = sum(p['volume'] for p in ordered_points)
-
-    # Calcula a distância de uma rota não otimizada (sequencial) para comparação
-    naive_route = list(range(len(points)))
-    naive_dist = 0
-    for i in range(len(naive_route) - 1):
-        naive_dist += Individual.get_distance(points[naive_route[i]]['coords'], points[naive_route[i+1]]['coords'])
-    naive_dist += Individual.get_distance(points[naive_route[-1]]['coords'], points[naive_route[0]]['coords'])
-
-    # --- 2. Criação do Prompt Único e Eficiente ---
-    prompt = f"""Você é um assistente de logística. Sua tarefa é gerar um relatório completo sobre uma rota de entrega otimizada por um algoritmo genético. O relatório deve ser em formato Markdown e conter exatamente as seguintes seções:
-
-1.  **Instruções para o Motorista:** Um guia passo a passo claro e direto.
-2.  **Relatório de Eficiência:** Uma análise comparando a rota otimizada com uma rota não otimizada, incluindo a porcentagem de economia.
-3.  **Sugestões de Melhoria:** Com base nos dados da rota, sugira melhorias no processo logístico.
-4.  **Perguntas e Respostas:** Responda a um conjunto de perguntas comuns sobre a rota.
-
-**Dados da Rota para Análise:**
-- **Rota Otimizada (sequência de índices):** {route_indices}
-- **Pontos (com coordenadas, prioridade e volume):** {[(p['coords'], p['priority'], p['volume']) for p in ordered_points]}
-- **Distância Total da Rota Otimizada:** {total_distance:.2f} km
-- **Distância de uma Rota Não Otimizada (para comparação):** {naive_dist:.2f} km
-- **Volume Total da Carga:** {total_volume}
-- **Capacidade Máxima do Veículo:** 50
-
-Por favor, gere o relatório completo com base nestes dados."""
-
-    # --- 3. Chamada à API da OpenAI (BLOQUEANTE) ---
-    try:
-        print("Fazendo chamada à API... A interface irá congelar.")
-        completion = client.chat.completions.create(
-            model="gpt-3.5-turbo",
-            messages=[
-                {"role": "system", "content": "Você é um assistente de logística que gera relatórios em Markdown."},
-                {"role": "user", "content": prompt}
-            ]
+    def __init__(self, rect, x_label='Geração', y_label='Aptidão', title="Evolução da Aptidão"):
+        """Cria a superfície, as fontes e a área de plotagem uma única vez."""
+        self.rect = pygame.Rect(rect)
+        self.x_label = x_label
+        self.y_label = y_label
+        self.title = title
+        self.surface = pygame.Surface(self.rect.size)
+        self.plot_rect = pygame.Rect(
+            self.MARGIN_LEFT, self.MARGIN_TOP,
+            self.rect.width - self.MARGIN_LEFT - self.MARGIN_RIGHT,
+            self.rect.height - self.MARGIN_TOP - self.MARGIN_BOTTOM,
         )
-        llm_response = completion.choices[0].message.content
-        print("Resposta da API recebida.")
+        self.title_font = get_font(24)
+        self.label_font = get_font(20)
+        self.tick_font = get_font(16)
+        self._cache_key = None
+
+    def draw(self, screen, history):
+        """Desenha o gráfico, renderizando de novo apenas se o histórico mudou desde o último quadro."""
+        cache_key = (len(history), history[-1] if history else None)
+        if cache_key != self._cache_key:
+            self._render(history)
+            self._cache_key = cache_key
+        screen.blit(self.surface, self.rect.topleft)
+
+    def _render(self, history):
+        """Redesenha eixos, grade, rótulos e a curva na superfície em cache."""
+        surface = self.surface
+        if not history:
+            surface.fill(PALETTE["background"])
+            pygame.draw.rect(surface, (220, 220, 220), surface.get_rect(), border_radius=10)
+            text_surface = self.label_font.render("Aguardando simulação...", True, (100, 100, 100))
+            surface.blit(text_surface, text_surface.get_rect(center=surface.get_rect().center))
+            return
+
+        surface.fill(PALETTE["text_light"])
+        plot = self.plot_rect
+        values = np.asarray(history, dtype=np.float64)
+        low, high = float(values.min()), float(values.max())
+        if high - low < 1e-12:
+            low, high = low - abs(low) * 0.05 - 1e-12, high + abs(high) * 0.05 + 1e-12
+        padding = (high - low) * 0.05
+        low, high = low - padding, high + padding
+        last_index = max(len(values) - 1, 1)
+
+        # Grade e marcações dos dois eixos
+        for step in range(5):
+            fraction = step / 4
+            y = plot.bottom - fraction * plot.height
+            pygame.draw.line(surface, PALETTE["secondary"], (plot.left, y), (plot.right, y))
+            label = self.tick_font.render(format_tick(low + fraction * (high - low)), True, PALETTE["text_dark"])
+            surface.blit(label, label.get_rect(midright=(plot.left - 4, y)))
+            x = plot.left + fraction * plot.width
+            pygame.draw.line(surface, PALETTE["secondary"], (x, plot.top), (x, plot.bottom))
+            label = self.tick_font.render(str(int(round(fraction * last_index))), True, PALETTE["text_dark"])
+            surface.blit(label, label.get_rect(midtop=(x, plot.bottom + 4)))
+        pygame.draw.rect(surface, PALETTE["text_dark"], plot, 1)
+
+        # Reduz o histórico à largura da área: em cada coluna de pixels ficam o mínimo e o máximo
+        if len(values) > plot.width:
+            edges = np.linspace(0, len(values), plot.width + 1).astype(int)[:-1]
+            columns = plot.left + np.arange(plot.width)
+            ys = np.column_stack([np.minimum.reduceat(values, edges), np.maximum.reduceat(values, edges)]).ravel()
+            xs = np.repeat(columns, 2)
+        else:
+            xs = plot.left + np.arange(len(values)) / last_index * plot.width
+            ys = values
+        ys = plot.bottom - (ys - low) / (high - low) * plot.height
+        line_points = np.column_stack([xs, ys]).tolist()
+        if len(line_points) > 1:
+            pygame.draw.lines(surface, PALETTE["primary"], False, line_points, 2)
+        else:
+            pygame.draw.circle(surface, PALETTE["primary"], line_points[0], 2)
+
+        title = self.title_font.render(self.title, True, PALETTE["text_dark"])
+        surface.blit(title, title.get_rect(midtop=(self.rect.width // 2, 8)))
+        x_label = self.label_font.render(self.x_label, True, PALETTE["text_dark"])
+        surface.blit(x_label, x_label.get_rect(midbottom=(plot.centerx, self.rect.height - 4)))
+        y_label = pygame.transform.rotate(self.label_font.render(self.y_label, True, PALETTE["text_dark"]), 90)
+        surface.blit(y_label, y_label.get_rect(midleft=(4, plot.centery)))
+
+_charts = {}
+
+def draw_plot(screen, history, rect, x_label='Geração', y_label='Aptidão'):
+    """Desenha o gráfico de evolução da aptidão, reaproveitando um `FitnessChart` por área da tela."""
+    key = (tuple(rect), x_label, y_label)
+    if key not in _charts:
+        _charts[key] = FitnessChart(rect, x_label, y_label)
+    _charts[key].draw(screen, history)
 
-        # --- 4. Salvando o Relatório ---
-        final_report = f"# Relatório de Rota Otimizada (Gerado por IA)\n\n" + llm_response
-        with open("RELATORIO_DE_ROTA.md", "w", encoding="utf-8") as f:
-            f.write(final_report)
-        print("Relatório salvo com sucesso em RELATORIO_DE_ROTA.md")
+def generate_llm_report(best_individual, points, client=None, cache=None):
+    """Inicia a geração do relatório de rota em segundo plano e retorna o `ReportJob` (ou None sem cliente).
 
-    except Exception as e:
-        print(f"Ocorreu um erro ao chamar a API da OpenAI: {e}")
\ No newline at end of file
+    A resposta é gravada em `RELATORIO_DE_ROTA.md` à medida que chega; a interface continua desenhando e o AG
+    continua evoluindo enquanto isso. Veja `report.py`.
+    """
+    return start_report(best_individual, points, client=client, cache=cache)
@@ -0,0 +1,187 @@
+"""Modelo de ilhas: várias subpopulações evoluem em processos separados e trocam suas melhores rotas periodicamente."""
+
+import multiprocessing
+import os
+import time
+from multiprocessing import shared_memory
+
+import numpy as np
+
+from ga_classes import ArrayPopulation, DistanceMatrix, Individual
+
+SHARED_ARRAYS = ('coords', 'priorities', 'volumes', 'matrix')
+
+def share_distance_matrix(distance_matrix):
+    """Copia os arrays da matriz para blocos de memória compartilhada e retorna os blocos e a especificação para os workers."""
+    blocks = []
+    spec = {}
+    for name in SHARED_ARRAYS:
+        array = np.ascontiguousarray(getattr(distance_matrix, name))
+        block = shared_memory.SharedMemory(create=True, size=max(array.nbytes, 1))
+        np.ndarray(array.shape, dtype=array.dtype, buffer=block.buf)[...] = array
+        blocks.append(block)
+        spec[name] = (block.name, array.shape, array.dtype.str)
+    return blocks, spec
+
+def attach_distance_matrix(spec):
+    """Reconstrói uma `DistanceMatrix` sobre os blocos compartilhados, sem copiar nem recalcular as distâncias."""
+    blocks = []
+    arrays = {}
+    for name, (block_name, shape, dtype) in spec.items():
+        block = shared_memory.SharedMemory(name=block_name)
+        blocks.append(block)
+        arrays[name] = np.ndarray(shape, dtype=np.dtype(dtype), buffer=block.buf)
+    return DistanceMatrix.from_arrays(**arrays), blocks
+
+def _island_worker(spec, size, mutation_rate, seed, migrants, connection):
+    """Loop de um processo-ilha: recebe migrantes, evolui algumas gerações e devolve histórico e emigrantes."""
+    distance_matrix, blocks = attach_distance_matrix(spec)
+    population = ArrayPopulation(size, distance_matrix, rng=np.random.default_rng(seed))
+    try:
+        while True:
+            command, payload = connection.recv()
+            if command == 'stop':
+                break
+            num_generations, immigrants = payload
+            if immigrants is not None:
+                population.replace_worst(immigrants)
+            best_history = []
+            average_history = []
+            for _ in range(num_generations):
+                population.evolve(mutation_rate)
+                best_history.append(float(population.fitness.max()))
+                average_history.append(population.get_average_fitness())
+            top = np.argsort(population.fitness)[-migrants:]
+            connection.send((best_history, average_history, population.routes[top].copy(), population.fitness[top].copy()))
+    finally:
+        # Os arrays precisam ser liberados antes de fechar os blocos compartilhados
+        del population, distance_matrix
+        for block in blocks:
+            block.close()
+        connection.close()
+
+class IslandModel:
+    """Executa K subpopulações `ArrayPopulation` em paralelo, com migração em anel ou aleatória a cada M gerações."""
+    def __init__(self, distance_matrix, num_islands=None, island_size=50, mutation_rate=0.05,
+                 migration_interval=20, migrants=1, topology='ring', seed=None):
+        """Guarda a configuração; os processos só são criados em `start()`."""
+        if topology not in ('ring', 'random'):
+            raise ValueError(f"Topologia desconhecida: {topology}")
+        self.distance_matrix = distance_matrix
+        self.num_islands = num_islands or os.cpu_count() or 1
+        self.island_size = island_size
+        self.mutation_rate = mutation_rate
+        self.migration_interval = migration_interval
+        self.migrants = migrants
+        self.topology = topology
+        self.seed_sequence = np.random.SeedSequence(seed)
+        self.rng = np.random.default_rng(self.seed_sequence.spawn(1)[0])
+        self.best_fitness_history = []
+        self.average_fitness_history = []
+        self.best_route = None
+        self.best_fitness = 0.0
+        self.generation = 0
+        self._blocks = []
+        self._processes = []
+        self._connections = []
+        self._pending_migrants = []
+
+    def start(self):
+        """Publica a matriz em memória compartilhada e inicia um processo por ilha."""
+        if self._processes:
+            return
+        self._blocks, spec = share_distance_matrix(self.distance_matrix)
+        context = multiprocessing.get_context()
+        for seed in self.seed_sequence.spawn(self.num_islands):
+            parent_connection, child_connection = context.Pipe()
+            process = context.Process(
+                target=_island_worker,
+                args=(spec, self.island_size, self.mutation_rate, seed, self.migrants, child_connection),
+                daemon=True,
+            )
+            process.start()
+            child_connection.close()
+            self._processes.append(process)
+            self._connections.append(parent_connection)
+        self._pending_migrants = [None] * self.num_islands
+
+    def close(self):
+        """Encerra os processos e libera a memória compartilhada."""
+        for connection in self._connections:
+            try:
+                connection.send(('stop', None))
+            except (BrokenPipeError, OSError):
+                pass
+        for process in self._processes:
+            process.join()
+        for connection in self._connections:
+            connection.close()
+        for block in self._blocks:
+            block.close()
+            block.unlink()
+        self._processes, self._connections, self._blocks = [], [], []
+
+    def __enter__(self):
+        self.start()
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def _destinations(self):
+        """Define para qual ilha vão os emigrantes de cada ilha, de acordo com a topologia."""
+        k = self.num_islands
+        if k == 1:
+            return [0]
+        if self.topology == 'ring':
+            return [(i + 1) % k for i in range(k)]
+        offsets = self.rng.integers(1, k, size=k)
+        return [(i + offset) % k for i, offset in enumerate(offsets)]
+
+    def run(self, num_generations, time_budget=None):
+        """Evolui todas as ilhas até `num_generations` (ou `time_budget` segundos) e retorna o resultado agregado."""
+        self.start()
+        start = time.perf_counter()
+        deadline = start + time_budget if time_budget else None
+        while self.generation < num_generations:
+            if deadline is not None and time.perf_counter() >= deadline:
+                break
+            epoch = min(self.migration_interval, num_generations - self.generation)
+            for connection, immigrants in zip(self._connections, self._pending_migrants):
+                connection.send(('evolve', (epoch, immigrants)))
+            results = [connection.recv() for connection in self._connections]
+
+            # Agrega por geração: melhor aptidão entre as ilhas e média das médias (ilhas de mesmo tamanho)
+            self.best_fitness_history.extend(np.max([r[0] for r in results], axis=0).tolist())
+            self.average_fitness_history.extend(np.mean([r[1] for r in results], axis=0).tolist())
+            self.generation += epoch
+
+            pending = [[] for _ in range(self.num_islands)]
+            for (_, _, routes, fitness), destination in zip(results, self._destinations()):
+                pending[destination].append(routes)
+                if fitness[-1] > self.best_fitness:
+                    self.best_fitness = float(fitness[-1])
+                    self.best_route = routes[-1].copy()
+            self._pending_migrants = [np.concatenate(routes) if routes else None for routes in pending]
+
+        elapsed = time.perf_counter() - start
+        return {
+            'route': [int(gene) for gene in self.best_route] if self.best_route is not None else [],
+            'fitness': self.best_fitness,
+            'route_length': self.distance_matrix.route_length(self.best_route) if self.best_route is not None else 0.0,
+            'generations': self.generation,
+            'elapsed_seconds': elapsed,
+            'generations_per_second': self.generation / elapsed if elapsed > 0 else 0.0,
+            'best_fitness_history': self.best_fitness_history,
+            'average_fitness_history': self.average_fitness_history,
+        }
+
+    def get_fittest(self):
+        """Retorna a melhor rota encontrada entre todas as ilhas."""
+        if self.best_route is None:
+            return None
+        return Individual(list(self.best_route), self.distance_matrix)
+
+    def get_average_fitness(self):
+        """Retorna a aptidão média agregada da última geração."""
+        return self.average_fitness_history[-1] if self.average_fitness_history else 0.0
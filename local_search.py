@@ -0,0 +1,241 @@
+"""Busca local (2-opt e Or-opt) restrita a listas de vizinhos mais próximos, usada como etapa memética do AG."""
+
+import time
+
+import numpy as np
+
+from ga_classes import Individual, batch_costs, priority_penalty
+
+def nearest_neighbors(coords, k):
+    """Calcula os `k` vizinhos mais próximos de cada ponto usando uma grade espacial uniforme.
+
+    Cada célula da grade recebe, em média, cerca de dois pontos; a busca de um ponto começa na própria célula e
+    expande em anéis até garantir que nenhum vizinho mais próximo ficou de fora. Retorna um array `(n, k)` com
+    os índices ordenados do mais próximo para o mais distante.
+    """
+    coords = np.asarray(coords, dtype=np.float64)
+    n = len(coords)
+    k = min(k, n - 1)
+    if k <= 0:
+        return np.empty((n, 0), dtype=np.int32)
+
+    lower = coords.min(axis=0)
+    extent = np.maximum(coords.max(axis=0) - lower, 1e-9)
+    cell_size = max(np.sqrt(extent[0] * extent[1] * 2 / n), 1e-9)
+    shape = np.maximum((extent // cell_size).astype(int) + 1, 1)
+    cells = np.minimum(((coords - lower) // cell_size).astype(int), shape - 1)
+
+    # Agrupa os índices por célula: `order` ordenado por célula e `starts` marca o início de cada uma
+    cell_ids = cells[:, 0] * shape[1] + cells[:, 1]
+    order = np.argsort(cell_ids, kind='stable')
+    starts = np.searchsorted(cell_ids[order], np.arange(shape[0] * shape[1] + 1))
+
+    neighbors = np.empty((n, k), dtype=np.int32)
+    for point in range(n):
+        cx, cy = cells[point]
+        ring = 1
+        while True:
+            x0, x1 = max(cx - ring, 0), min(cx + ring, shape[0] - 1)
+            y0, y1 = max(cy - ring, 0), min(cy + ring, shape[1] - 1)
+            candidates = np.concatenate([
+                order[starts[x * shape[1] + y0]:starts[x * shape[1] + y1 + 1]] for x in range(x0, x1 + 1)
+            ])
+            candidates = candidates[candidates != point]
+            covers_grid = x0 == 0 and y0 == 0 and x1 == shape[0] - 1 and y1 == shape[1] - 1
+            if len(candidates) >= k or covers_grid:
+                distances = np.hypot(*(coords[candidates] - coords[point]).T)
+                nearest = np.argsort(distances, kind='stable')[:k]
+                # Qualquer ponto fora do quadrado visitado está a mais de `ring * cell_size` de distância
+                if covers_grid or distances[nearest[-1]] <= ring * cell_size:
+                    neighbors[point] = candidates[nearest]
+                    break
+            ring += 1
+    return neighbors
+
+class LocalSearch:
+    """Aplica movimentos 2-opt e Or-opt de melhoria, restritos às listas de vizinhos, com orçamento por geração."""
+    def __init__(self, distance_matrix, neighbors=8, max_moves=200, time_budget=None,
+                 apply_to_elite=True, offspring_fraction=0.0, rng=None):
+        """Pré-calcula as listas de vizinhos e guarda o orçamento de movimentos e de tempo."""
+        self.distance_matrix = distance_matrix
+        self.neighbors = nearest_neighbors(distance_matrix.coords, neighbors)
+        self.max_moves = max_moves
+        self.time_budget = time_budget
+        self.apply_to_elite = apply_to_elite
+        self.offspring_fraction = offspring_fraction
+        self.rng = np.random.default_rng() if rng is None else rng
+        # Listas Python tornam o acesso escalar no laço interno bem mais barato que indexar arrays NumPy
+        self._neighbor_lists = self.neighbors.tolist()
+        self._neighbor_distances = np.take_along_axis(distance_matrix.matrix, self.neighbors.astype(np.intp), axis=1).tolist()
+
+    def improve(self, route, max_moves=None, deadline=None):
+        """Melhora uma rota até não haver movimento de melhoria, esgotar `max_moves` ou passar de `deadline`.
+
+        Um movimento só é aceito se reduzir a distância somada à penalidade de prioridade; a penalidade de
+        capacidade depende apenas do volume total e não muda com a ordem das paradas. Retorna a rota melhorada
+        e o número de movimentos aplicados.
+        """
+        route = [int(city) for city in route]
+        n = len(route)
+        if n < 5:
+            return np.array(route, dtype=np.int32), 0
+        max_moves = self.max_moves if max_moves is None else max_moves
+        position = [0] * n
+        for index, city in enumerate(route):
+            position[city] = index
+        penalty = priority_penalty(route, self.distance_matrix)
+        moves = 0
+
+        # "Don't look bits": só voltam à fila as cidades cujas arestas mudaram no último movimento
+        queue = list(reversed(route))
+        queued = [True] * n
+        while queue and moves < max_moves:
+            if deadline is not None and time.perf_counter() >= deadline:
+                break
+            city = queue.pop()
+            queued[city] = False
+            move = self._two_opt(route, position, city, penalty) or self._or_opt(route, position, city, penalty)
+            if move is None:
+                continue
+            route, penalty, touched = move
+            for index, value in enumerate(route):
+                position[value] = index
+            moves += 1
+            for value in touched:
+                if not queued[value]:
+                    queued[value] = True
+                    queue.append(value)
+        return np.array(route, dtype=np.int32), moves
+
+    def _accept(self, candidate, gain, penalty, touched):
+        """Aceita o candidato se o ganho de distância superar o aumento da penalidade de prioridade."""
+        new_penalty = priority_penalty(candidate, self.distance_matrix)
+        if gain - (new_penalty - penalty) > 1e-9:
+            return candidate, new_penalty, touched
+        return None
+
+    def _two_opt(self, route, position, city, penalty):
+        """Procura um 2-opt que ligue `city` a um de seus vizinhos, nos sentidos sucessor e antecessor."""
+        n = len(route)
+        matrix = self.distance_matrix.matrix
+        i = position[city]
+        for direction in (1, -1):
+            other = route[(i + direction) % n]
+            base = matrix.item(city, other)
+            for neighbor, new_edge in zip(self._neighbor_lists[city], self._neighbor_distances[city]):
+                if new_edge >= base:
+                    break
+                j = position[neighbor]
+                neighbor_other = route[(j + direction) % n]
+                if neighbor_other == city or neighbor == other:
+                    continue
+                gain = base + matrix.item(neighbor, neighbor_other) - new_edge - matrix.item(other, neighbor_other)
+                if gain <= 1e-9:
+                    continue
+                # Arestas removidas começam nas posições p e q; inverter p+1..q reconecta city-neighbor
+                p, q = (i, j) if direction == 1 else ((i - 1) % n, (j - 1) % n)
+                if p < q:
+                    candidate = route[:p + 1] + route[p + 1:q + 1][::-1] + route[q + 1:]
+                else:
+                    candidate = route[:q + 1] + route[q + 1:p + 1][::-1] + route[p + 1:]
+                accepted = self._accept(candidate, gain, penalty, (city, other, neighbor, neighbor_other))
+                if accepted is not None:
+                    return accepted
+        return None
+
+    def _or_opt(self, route, position, city, penalty):
+        """Procura mover um trecho de 1 a 3 paradas iniciado em `city` para junto de um de seus vizinhos."""
+        n = len(route)
+        matrix = self.distance_matrix.matrix
+        i = position[city]
+        for length in (1, 2, 3):
+            if i + length >= n or n - length < 3:
+                break
+            segment = route[i:i + length]
+            first, last = segment[0], segment[-1]
+            prev, following = route[i - 1], route[i + length]
+            removal_gain = matrix.item(prev, first) + matrix.item(last, following) - matrix.item(prev, following)
+            for neighbor, new_edge in zip(self._neighbor_lists[first], self._neighbor_distances[first]):
+                if new_edge >= removal_gain:
+                    break
+                if neighbor in segment:
+                    continue
+                # Vizinhos de `neighbor` na rota sem o trecho
+                j = position[neighbor]
+                after = following if neighbor == prev else route[(j + 1) % n]
+                before = prev if neighbor == following else route[j - 1]
+                # Opção A: neighbor, first..last, after / Opção B: before, last..first, neighbor
+                if neighbor != prev:
+                    gain = removal_gain - (new_edge + matrix.item(last, after) - matrix.item(neighbor, after))
+                    if gain > 1e-9:
+                        candidate = self._move_segment(route, i, length, neighbor, segment, after_neighbor=True)
+                        accepted = self._accept(candidate, gain, penalty, (prev, following, neighbor, after, first, last))
+                        if accepted is not None:
+                            return accepted
+                if neighbor != following:
+                    gain = removal_gain - (matrix.item(before, last) + new_edge - matrix.item(before, neighbor))
+                    if gain > 1e-9:
+                        candidate = self._move_segment(route, i, length, neighbor, segment[::-1], after_neighbor=False)
+                        accepted = self._accept(candidate, gain, penalty, (prev, following, neighbor, before, first, last))
+                        if accepted is not None:
+                            return accepted
+        return None
+
+    @staticmethod
+    def _move_segment(route, i, length, neighbor, piece, after_neighbor):
+        """Retira o trecho `route[i:i+length]` e o reinsere, na ordem de `piece`, logo depois ou antes de `neighbor`."""
+        rest = route[:i] + route[i + length:]
+        slot = rest.index(neighbor) + (1 if after_neighbor else 0)
+        return rest[:slot] + piece + rest[slot:]
+
+    def _plan(self, fitness):
+        """Linhas melhoradas em uma geração (a elite e `offspring_fraction` sorteadas, sem repetição) e o prazo dela."""
+        deadline = time.perf_counter() + self.time_budget if self.time_budget else None
+        rows = []
+        if self.apply_to_elite:
+            rows.append(int(np.argmax(fitness)))
+        offspring = int(round(self.offspring_fraction * len(fitness)))
+        if offspring:
+            rows.extend(self.rng.choice(len(fitness), offspring, replace=False).tolist())
+        return list(dict.fromkeys(rows)), deadline
+
+    def _improve_rows(self, rows, routes, deadline):
+        """Melhora as rotas `routes[row]` de cada linha, dividindo o orçamento de movimentos e o prazo da geração.
+
+        Gera `(row, rota_melhorada)` para cada linha em que algum movimento foi aplicado.
+        """
+        moves_left = self.max_moves
+        for row in rows:
+            if moves_left <= 0 or (deadline is not None and time.perf_counter() >= deadline):
+                break
+            improved_route, moves = self.improve(routes[row], max_moves=moves_left, deadline=deadline)
+            moves_left -= moves
+            if moves:
+                yield row, improved_route
+
+    def apply_to_individuals(self, individuals):
+        """Versão de `apply` para listas de `Individual` (`Population` e `SteadyStatePopulation`).
+
+        Cada indivíduo melhorado é trocado na lista por um novo, com a aptidão recalculada; o antigo pode estar em um
+        snapshot lido pela interface e não é alterado. Retorna as posições trocadas.
+        """
+        fitness = np.fromiter((individual.fitness for individual in individuals), dtype=np.float64,
+                              count=len(individuals))
+        rows, deadline = self._plan(fitness)
+        improved = []
+        for row, route in self._improve_rows(rows, [individual.route for individual in individuals], deadline):
+            individuals[row] = Individual(route.tolist(), individuals[row].distance_matrix)
+            improved.append(row)
+        return improved
+
+    def apply(self, population):
+        """Melhora a elite e uma fração dos filhos de uma `ArrayPopulation`, respeitando o orçamento da geração."""
+        rows, deadline = self._plan(population.fitness)
+        for row, route in self._improve_rows(rows, population.routes, deadline):
+            population.routes[row] = route
+        if rows:
+            lengths, capacity, priority = batch_costs(population.routes[rows], self.distance_matrix)
+            population.route_lengths[rows] = lengths
+            population.capacity_penalties[rows] = capacity
+            population.priority_penalties[rows] = priority
+            population.set_costs(population.route_lengths, population.capacity_penalties, population.priority_penalties)
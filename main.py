@@ -1,15 +1,20 @@
 """Ponto de entrada e loop principal da aplicação de otimização de rotas."""
 
+import os
 import pygame
 import sys
-from helpers import draw_text, draw_points, draw_route, draw_plot, draw_legend, generate_points, generate_llm_report, PALETTE
+from helpers import draw_text, draw_map, draw_plot, draw_legend, map_signature, generate_points, generate_llm_report, PALETTE
+from render_cache import DirtyRegions, FrameTimer
 from ui_elements import Button, Slider
-from ga_classes import Population
+from checkpoint import load_checkpoint
+from convergence import ConvergenceController
+from evolution_worker import EvolutionWorker
+from ga_classes import MAX_CAPACITY, Fleet
+from profiling import Profiler, TelemetryWriter
 
-pygame.init()
 width, height = 1000, 1000
-screen = pygame.display.set_mode((width, height))
-pygame.display.set_caption("Otimização de Rotas com Algoritmo Genético")
+# A janela só é criada em `init_display`; importar o módulo não inicializa o pygame
+screen = None
 
 # --- Constantes e Configuração de Layout ---
 UI_PANEL_Y = 70
@@ -40,6 +45,50 @@ initial_num_points = 20
 initial_num_generations = 1000
 initial_population_size = 50
 initial_mutation_rate = 0.05
+FPS = 60
+
+# Instrumentação: GA_PROFILE=1 liga o overlay de desempenho desde o início (F3 alterna durante a execução) e
+# GA_TELEMETRY=arquivo.jsonl (ou .csv) grava a telemetria por geração
+PROFILE = os.getenv("GA_PROFILE") == "1"
+TELEMETRY_PATH = os.getenv("GA_TELEMETRY")
+OVERLAY_REFRESH_SECONDS = 0.5
+OVERLAY_PHASES = 3
+OVERLAY_X = SLIDER_X_COL2 + SLIDER_WIDTH + 20
+OVERLAY_Y = UI_PANEL_Y + 10
+OVERLAY_LINE_HEIGHT = 14
+
+# Reotimização incremental: mudar as cidades ou a população adapta a população evoluída (GA_WARM_START=0 desativa)
+WARM_START = os.getenv("GA_WARM_START", "1") != "0"
+
+# População inicial: permutações aleatórias; GA_SEEDING=greedy,hilbert,nearest (ou parte deles) mistura rotas do vizinho
+# mais próximo, da curva de Hilbert e de arestas gulosas a uma fração GA_RANDOM_FRACTION de rotas aleatórias
+SEEDING = tuple(name for name in os.getenv("GA_SEEDING", "random").split(",") if name and name != "random")
+RANDOM_FRACTION = float(os.getenv("GA_RANDOM_FRACTION", "0.5"))
+
+# Frota: com GA_SPLIT=1, a rota é dividida em viagens de veículos com capacidade GA_CAPACITY, saindo de um depósito no
+# centro do mapa (GA_VEHICLES limita a frota, 0 = ilimitada); sem ela, a rota é única
+SPLIT = os.getenv("GA_SPLIT", "0") == "1"
+CAPACITY = float(os.getenv("GA_CAPACITY", str(MAX_CAPACITY)))
+VEHICLES = int(os.getenv("GA_VEHICLES", "0"))
+
+# Convergência: com GA_CONVERGENCE=1, o AG para antes do número de gerações quando estagna (depois de recomeçar da
+# elite) e sobe a mutação do slider quando a diversidade colapsa (GA_PATIENCE define as gerações sem melhora)
+CONVERGENCE = os.getenv("GA_CONVERGENCE", "0") == "1"
+PATIENCE = int(os.getenv("GA_PATIENCE", "150"))
+
+# Checkpoints: F5 grava, F9 retoma. Só com GA_CHECKPOINT definido o worker também grava sozinho: a cada
+# GA_CHECKPOINT_INTERVAL gerações, ao fechar a janela e antes de "Reiniciar"/"Gerar cidades" descartarem uma população
+AUTOSAVE = bool(os.getenv("GA_CHECKPOINT"))
+CHECKPOINT_PATH = os.getenv("GA_CHECKPOINT") or "checkpoint_ga.npz"
+CHECKPOINT_INTERVAL = int(os.getenv("GA_CHECKPOINT_INTERVAL", "100"))
+
+# Texto do botão de relatório para cada estado do `ReportJob` (None: nenhum relatório pedido)
+REPORT_BUTTON_TEXT = {
+    None: "Gerar Relatório",
+    'running': "Gerando relatório...",
+    'done': "Relatório pronto",
+    'error': "Erro no relatório",
+}
 
 # --- Inicialização dos Elementos de UI ---
 button_reload = Button((BUTTON_RELOAD_X, BUTTON_Y, BUTTON_WIDTH, BUTTON_HEIGHT), "Reiniciar", "reload")
@@ -54,179 +103,275 @@ slider_mutation = Slider(SLIDER_X_COL2, SLIDER_Y_ROW2, SLIDER_WIDTH, SLIDER_HEIG
 
 chart_area = pygame.Rect(20, CHART_MAP_Y, 450, CHART_MAP_HEIGHT)
 map_area = pygame.Rect(530, CHART_MAP_Y, 450, CHART_MAP_HEIGHT)
+panel_area = pygame.Rect(0, UI_PANEL_Y, width, UI_PANEL_HEIGHT)
+
+# --- Caches de Renderização ---
+dirty_regions = DirtyRegions()
+frame_timer = FrameTimer()
+render_profiler = Profiler()
+static_layer = None
+overlay_cache = {'time': 0.0, 'lines': ()}
+map_background_image = None
+
+
+def init_display():
+    """Inicializa o pygame, cria a janela e carrega a imagem de fundo do mapa; retorna a superfície da tela."""
+    global screen, map_background_image
+    if screen is not None:
+        return screen
+    pygame.init()
+    screen = pygame.display.set_mode((width, height))
+    pygame.display.set_caption("Otimização de Rotas com Algoritmo Genético")
 
-# Carrega e redimensiona a imagem de fundo do mapa
-try:
-    map_background_image = pygame.image.load('map_background.png').convert_alpha()
-    map_background_image = pygame.transform.scale(map_background_image, (map_area.width, map_area.height))
-except pygame.error as e:
-    print(f"Erro ao carregar a imagem do mapa: {e}")
-    map_background_image = None
+    # Carrega e redimensiona a imagem de fundo do mapa
+    try:
+        map_background_image = pygame.image.load('map_background.png').convert_alpha()
+        map_background_image = pygame.transform.scale(map_background_image, (map_area.width, map_area.height))
+    except pygame.error as e:
+        print(f"Erro ao carregar a imagem do mapa: {e}")
+        map_background_image = None
+    return screen
 
 
 def main():
     """Função principal que executa o loop da aplicação, lida com eventos e atualiza a tela."""
+    init_display()
     # Variáveis de estado da simulação
     num_points = initial_num_points
     num_generations = initial_num_generations
     population_size = initial_population_size
     mutation_rate = initial_mutation_rate
     
-    points = generate_points(num_points)
-    
-    # Inicializa a população
-    current_population = Population(size=int(population_size), points=points)
-    current_best_individual = current_population.get_fittest()
-    generation = 0
-    best_fitness_history = []
+    # A evolução roda em uma thread própria; a interface só envia comandos e lê o snapshot mais recente
+    profiling = PROFILE or bool(TELEMETRY_PATH)
+    evolution_profiler = Profiler(enabled=profiling, writer=TelemetryWriter(TELEMETRY_PATH) if TELEMETRY_PATH else None)
+    render_profiler.enabled = profiling
+    worker = EvolutionWorker(generate_points(num_points), population_size, mutation_rate, num_generations,
+                             time_budget=1 / FPS, profiler=evolution_profiler,
+                             checkpoint_path=CHECKPOINT_PATH if AUTOSAVE else None,
+                             checkpoint_interval=CHECKPOINT_INTERVAL,
+                             warm_start=WARM_START,
+                             convergence=ConvergenceController(patience=PATIENCE) if CONVERGENCE else None,
+                             seeding=SEEDING, random_fraction=RANDOM_FRACTION,
+                             fleet=Fleet(CAPACITY, VEHICLES or None) if SPLIT else None)
+    worker.start()
+    clock = pygame.time.Clock()
+    # Relatório em geração (ou o último gerado); roda em segundo plano, sem bloquear a interface
+    report_job = None
     
     running = True
-    running_ga = False
     
     while running:
         for event in pygame.event.get():
             if event.type == pygame.QUIT:
                 running = False
+                worker.stop()
                 sys.exit()
             
+            # F3 liga/desliga a medição por fase e o overlay de desempenho
+            if event.type == pygame.KEYDOWN and event.key == pygame.K_F3:
+                profiling = not profiling
+                worker.send('set_profiling', profiling)
+                render_profiler.enabled = profiling
+                render_profiler.reset()
+
+            # F5 grava um checkpoint; F9 retoma o último, ajustando os sliders aos parâmetros gravados
+            if event.type == pygame.KEYDOWN and event.key == pygame.K_F5:
+                worker.send('save_checkpoint', CHECKPOINT_PATH)
+            if event.type == pygame.KEYDOWN and event.key == pygame.K_F9:
+                if os.path.exists(CHECKPOINT_PATH):
+                    checkpoint = load_checkpoint(CHECKPOINT_PATH)
+                    num_points = len(checkpoint.points)
+                    population_size = len(checkpoint.routes)
+                    mutation_rate = checkpoint.metadata.get('mutation_rate', mutation_rate)
+                    num_generations = int(checkpoint.metadata.get('num_generations', num_generations))
+                    slider_cities.set_value(num_points)
+                    slider_population.set_value(population_size)
+                    slider_mutation.set_value(mutation_rate)
+                    slider_generations.set_value(num_generations)
+                    worker.send('load_checkpoint', checkpoint)
+                else:
+                    print(f"Nenhum checkpoint encontrado em {CHECKPOINT_PATH}")
+
             # --- Lida com eventos da UI ---
             
             # Sliders
             new_num_points = slider_cities.handle_event(event)
             if new_num_points != num_points:
                 num_points = new_num_points
-                points = generate_points(num_points)
-                running_ga = False
-                current_population = Population(size=int(population_size), points=points)
-                current_best_individual = current_population.get_fittest()
-                generation = 0
-                best_fitness_history = []
+                if WARM_START:
+                    worker.send('resize_points', num_points)
+                else:
+                    worker.send('set_points', generate_points(num_points))
 
             new_num_generations = slider_generations.handle_event(event)
             if new_num_generations != num_generations:
                 num_generations = new_num_generations
+                worker.send('set_num_generations', num_generations)
                 
             new_population_size = slider_population.handle_event(event)
             if new_population_size != population_size:
                 population_size = new_population_size
-                running_ga = False
-                current_population = Population(size=int(population_size), points=points)
-                current_best_individual = current_population.get_fittest()
-                generation = 0
-                best_fitness_history = []
+                worker.send('set_population_size', population_size)
 
             new_mutation_rate = slider_mutation.handle_event(event)
             if new_mutation_rate != mutation_rate:
                 mutation_rate = new_mutation_rate
+                worker.send('set_mutation_rate', mutation_rate)
             
             # Botões
             if button_reload.is_clicked(event):
-                running_ga = False
-                current_population = Population(size=int(population_size), points=points)
-                current_best_individual = current_population.get_fittest()
-                generation = 0
-                best_fitness_history = []
+                worker.send('reset')
             
             if button_run_ga.is_clicked(event):
-                running_ga = not running_ga
+                worker.send('toggle')
                 
             if button_regenerate.is_clicked(event):
-                running_ga = False
-                points = generate_points(num_points)
-                current_population = Population(size=int(population_size), points=points)
-                current_best_individual = current_population.get_fittest()
-                generation = 0
-                best_fitness_history = []
+                worker.send('set_points', generate_points(num_points))
             
             if button_generate_report.is_clicked(event):
-                # A classe do botão já impede o clique se estiver desabilitado
-                generate_llm_report(screen, width, height, current_best_individual, points)
-
-        # --- Lógica de Evolução do AG ---
-        if running_ga and generation < num_generations:
-            current_population.evolve(mutation_rate, points)
-            current_best_individual = current_population.get_fittest()
-            best_fitness_history.append(current_best_individual.fitness)
-            generation += 1
-        
-        # --- Atualiza a Tela ---
-        print_screen(
-            screen, points, current_best_individual, generation, num_generations, 
-            best_fitness_history, current_population, running_ga, num_points, 
-            population_size, mutation_rate
-        )
-
-
-
-def print_screen(screen, points, current_best_individual, generation, num_generations, best_fitness_history, current_population, running_ga, num_points, population_size, mutation_rate):
-    """Lida com todas as operações de desenho na tela."""
-    screen.fill(PALETTE["background"])
-
-    # Desenha o painel da UI e os elementos
-    pygame.draw.rect(screen, PALETTE["secondary"], (0, UI_PANEL_Y, width, UI_PANEL_HEIGHT))
-    draw_text(screen, "Otimização de Rotas - Algoritmo Genético", (width // 2, 40), font_size=48, color=PALETTE["text_dark"])
-    
+                # A classe do botão já impede o clique se estiver desabilitado (inclusive durante a geração)
+                snapshot = worker.snapshot
+                report_job = generate_llm_report(snapshot.best_individual, snapshot.points)
+
+        # --- Atualiza a Tela com o snapshot mais recente, em FPS fixo ---
+        print_screen(screen, worker.snapshot, num_generations, num_points, population_size, mutation_rate, report_job,
+                     worker.profiler)
+        clock.tick(FPS)
+
+
+def build_static_layer():
+    """Pré-renderiza o fundo, o painel da UI, o título e a imagem do mapa, que não mudam entre quadros."""
+    layer = pygame.Surface((width, height))
+    layer.fill(PALETTE["background"])
+    pygame.draw.rect(layer, PALETTE["secondary"], (0, UI_PANEL_Y, width, UI_PANEL_HEIGHT))
+    draw_text(layer, "Otimização de Rotas - Algoritmo Genético", (width // 2, 40), font_size=48, color=PALETTE["text_dark"])
+    if map_background_image:
+        layer.blit(map_background_image, map_area.topleft)
+    return layer
+
+
+def profile_overlay_lines(evolution_profiler):
+    """Monta as linhas do overlay de desempenho (ger/s, FPS e as fases mais caras), recalculadas a cada meio segundo."""
+    now = pygame.time.get_ticks() / 1000
+    if overlay_cache['lines'] and now - overlay_cache['time'] < OVERLAY_REFRESH_SECONDS:
+        return overlay_cache['lines']
+    generations_per_second = evolution_profiler.rate if evolution_profiler else 0.0
+    lines = [f"{generations_per_second:.0f} ger/s | {frame_timer.fps:.0f} FPS"]
+    for label, profiler in (("AG", evolution_profiler), ("Tela", render_profiler)):
+        phases = list(profiler.phase_ms().items())[:OVERLAY_PHASES] if profiler else []
+        lines.extend(f"{label} {name}: {milliseconds:.2f} ms" for name, milliseconds in phases)
+    overlay_cache['time'] = now
+    overlay_cache['lines'] = tuple(lines)
+    return overlay_cache['lines']
+
+
+def print_screen(screen, snapshot, num_generations, num_points, population_size, mutation_rate, report_job=None,
+                 evolution_profiler=None):
+    """Desenha um snapshot da evolução na tela, redesenhando apenas as regiões cujo estado mudou.
+
+    Com o `render_profiler` ligado, mede cada região e troca as informações de status pelo overlay de desempenho
+    (ger/s do `evolution_profiler`, FPS e milissegundos por fase).
+    """
+    points = snapshot.points
+    generation = snapshot.generation
+    current_best_individual = snapshot.best_individual
+    best_fitness_history = snapshot.best_fitness_history
+    global static_layer
+    if static_layer is None:
+        static_layer = build_static_layer()
+    if dirty_regions.full_redraw:
+        screen.blit(static_layer, (0, 0))
+
     # --- Lógica dos Botões ---
-    # Habilita/desabilita o botão de relatório
-    button_generate_report.disabled = (generation < num_generations)
+    # Habilita/desabilita o botão de relatório e mostra o andamento da geração em segundo plano
+    report_state = report_job.state if report_job else None
+    finished = generation >= num_generations or snapshot.converged
+    button_generate_report.disabled = not finished or report_state == 'running'
+    button_generate_report.text = REPORT_BUTTON_TEXT[report_state]
     # Alterna o texto do botão de execução
-    button_run_ga.text = "Pausar" if running_ga else "Rodar GA"
-    
-    # Desenha os botões
-    button_reload.draw(screen)
-    button_regenerate.draw(screen)
-    button_run_ga.draw(screen)
-    button_generate_report.draw(screen)
-    
-    # Desenha sliders e seus valores
-    slider_cities.draw(screen)
-    draw_text(screen, f"Cidades: {int(num_points)}", (SLIDER_X_COL1 + SLIDER_WIDTH / 2, SLIDER_Y_ROW1 + 25), color=PALETTE["text_dark"])
-    
-    slider_generations.draw(screen)
-    draw_text(screen, f"Gerações: {int(num_generations)}", (SLIDER_X_COL2 + SLIDER_WIDTH / 2, SLIDER_Y_ROW1 + 25), color=PALETTE["text_dark"])
-
-    slider_population.draw(screen)
-    draw_text(screen, f"População: {int(population_size)}", (SLIDER_X_COL1 + SLIDER_WIDTH / 2, SLIDER_Y_ROW2 + 25), color=PALETTE["text_dark"])
+    button_run_ga.text = "Pausar" if snapshot.running else "Rodar GA"
 
-    slider_mutation.draw(screen)
-    draw_text(screen, f"Mutação: {mutation_rate:.2f}", (SLIDER_X_COL2 + SLIDER_WIDTH / 2, SLIDER_Y_ROW2 + 25), color=PALETTE["text_dark"])
+    effective_mutation_rate = snapshot.effective_mutation_rate if snapshot.effective_mutation_rate is not None else mutation_rate
+    mutation_text = f"Mutação: {mutation_rate:.2f}"
+    if round(effective_mutation_rate, 2) != round(mutation_rate, 2):
+        mutation_text += f" (efetiva: {effective_mutation_rate:.2f})"
+    generation_text = f"Geração Atual: {generation}" + (" (convergiu)" if snapshot.converged else "")
 
-    # Desenha informações de status
-    draw_text(screen, f"Geração Atual: {generation}", (SLIDER_X_COL3 + 350, SLIDER_Y_ROW1), font_size=20, color=PALETTE["text_dark"])
-    
     best_dist = 1/current_best_individual.fitness if current_best_individual and current_best_individual.fitness > 0 else 0
-    draw_text(screen, f"Melhor Distância: {best_dist:.2f}", (SLIDER_X_COL3 + 350, SLIDER_Y_ROW1 + 30), font_size=20, color=PALETTE["text_dark"])
+    best_text = f"Melhor Distância: {best_dist:.2f}"
+    if snapshot.best_trips is not None and generation > 0:
+        best_text += f" ({len(snapshot.best_trips)} viagens)"
+    avg_dist = 1/snapshot.average_fitness if snapshot.average_fitness > 0 else 0
 
-    if current_population:
-        avg_fitness = current_population.get_average_fitness()
-        avg_dist = 1/avg_fitness if avg_fitness > 0 else 0
-        draw_text(screen, f"Distância Média: {avg_dist:.2f}", (SLIDER_X_COL3 + 350, SLIDER_Y_ROW1 + 60), font_size=20, color=PALETTE["text_dark"])
+    overlay_lines = profile_overlay_lines(evolution_profiler) if render_profiler.enabled else ()
 
-    # Desenha o gráfico de aptidão
-    draw_plot(screen, best_fitness_history, chart_area)
-    
-    # Desenha o fundo do mapa
-    if 'map_background_image' in globals() and map_background_image:
-        screen.blit(map_background_image, map_area.topleft)
-    
-    # Desenha a legenda dos pontos
-    draw_legend(screen, (map_area.left + 10, map_area.bottom - 70))
-
-    # Desenha as rotas apenas se a simulação tiver começado
-    if generation > 0:
-        if current_population:
-            second_best_individual = current_population.get_second_fittest()
-            if second_best_individual:
-                draw_route(screen, second_best_individual.route, points, (100, 100, 100), thickness=2)
-        
-        if current_best_individual:
-            draw_route(screen, current_best_individual.route, points, PALETTE["route_color"], thickness=3)
-
-    # Desenha os pontos
-    draw_points(screen, points)
-    
-    pygame.display.flip()
-    pygame.time.wait(10)
+    # --- Painel: botões, sliders e informações de status ---
+    panel_signature = (
+        int(num_points), int(num_generations), int(population_size), mutation_text,
+        generation_text, best_text, round(avg_dist, 2),
+        button_run_ga.text, button_generate_report.text, button_generate_report.disabled,
+        tuple(tuple(slider.handle_rect) for slider in (slider_cities, slider_generations, slider_population, slider_mutation)),
+        overlay_lines,
+    )
+    with render_profiler.phase('panel'):
+        if dirty_regions.needs_redraw('panel', panel_area, panel_signature):
+            screen.blit(static_layer, panel_area, panel_area)
+
+            # Desenha os botões
+            button_reload.draw(screen)
+            button_regenerate.draw(screen)
+            button_run_ga.draw(screen)
+            button_generate_report.draw(screen)
+
+            # Desenha sliders e seus valores
+            slider_cities.draw(screen)
+            draw_text(screen, f"Cidades: {int(num_points)}", (SLIDER_X_COL1 + SLIDER_WIDTH / 2, SLIDER_Y_ROW1 + 25), color=PALETTE["text_dark"])
+
+            slider_generations.draw(screen)
+            draw_text(screen, f"Gerações: {int(num_generations)}", (SLIDER_X_COL2 + SLIDER_WIDTH / 2, SLIDER_Y_ROW1 + 25), color=PALETTE["text_dark"])
+
+            slider_population.draw(screen)
+            draw_text(screen, f"População: {int(population_size)}", (SLIDER_X_COL1 + SLIDER_WIDTH / 2, SLIDER_Y_ROW2 + 25), color=PALETTE["text_dark"])
+
+            slider_mutation.draw(screen)
+            draw_text(screen, mutation_text, (SLIDER_X_COL2 + SLIDER_WIDTH / 2, SLIDER_Y_ROW2 + 25), color=PALETTE["text_dark"])
+
+            # Desenha informações de status (ou o overlay de desempenho, se a medição estiver ligada)
+            if overlay_lines:
+                draw_text(screen, f"Geração {generation} | Melhor: {best_dist:.2f}", (OVERLAY_X, OVERLAY_Y), font_size=16, color=PALETTE["text_dark"], center=False)
+                for row, line in enumerate(overlay_lines, start=1):
+                    draw_text(screen, line, (OVERLAY_X, OVERLAY_Y + row * OVERLAY_LINE_HEIGHT), font_size=16, color=PALETTE["text_dark"], center=False)
+            else:
+                draw_text(screen, generation_text, (SLIDER_X_COL3 + 350, SLIDER_Y_ROW1), font_size=20, color=PALETTE["text_dark"])
+                draw_text(screen, best_text, (SLIDER_X_COL3 + 350, SLIDER_Y_ROW1 + 30), font_size=20, color=PALETTE["text_dark"])
+                draw_text(screen, f"Distância Média: {avg_dist:.2f}", (SLIDER_X_COL3 + 350, SLIDER_Y_ROW1 + 60), font_size=20, color=PALETTE["text_dark"])
+
+    # --- Gráfico de aptidão ---
+    chart_signature = (len(best_fitness_history), best_fitness_history[-1] if best_fitness_history else None)
+    with render_profiler.phase('chart'):
+        if dirty_regions.needs_redraw('chart', chart_area, chart_signature):
+            screen.blit(static_layer, chart_area, chart_area)
+            draw_plot(screen, best_fitness_history, chart_area)
+
+    # --- Mapa: fundo, legenda, rotas e pontos ---
+    # As rotas só aparecem depois que a simulação começa; o mapa só é redesenhado quando os pontos ou as rotas mudam
+    show_routes = generation > 0 and current_best_individual is not None
+    best_route = tuple(current_best_individual.route) if show_routes else None
+    second_route = snapshot.second_best_route if show_routes else None
+    trips = snapshot.best_trips if show_routes else None
+    with render_profiler.phase('map'):
+        if dirty_regions.needs_redraw('map', map_area, map_signature(points, best_route, second_route, trips)):
+            # Fundo, rotas (ou as viagens de cada veículo) e pontos vêm do mapa composto em cache; a legenda fica por cima
+            draw_map(screen, points, map_area, best_route, second_route, background=static_layer,
+                     trips=trips, depot=snapshot.depot)
+            has_depot = snapshot.depot is not None
+            draw_legend(screen, (map_area.left + 10, map_area.bottom - (95 if has_depot else 70)), depot=has_depot)
+
+    with render_profiler.phase('display'):
+        dirty_regions.flush()
+    frame_timer.tick()
+    render_profiler.tick()
 
 if __name__ == '__main__':
     main()
\ No newline at end of file
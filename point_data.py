@@ -0,0 +1,228 @@
+"""Armazenamento, geração, leitura e gravação dos pontos de entrega, sem dependências de interface gráfica."""
+
+import itertools
+import json
+import random
+
+import numpy as np
+
+# Um registro por ponto: coordenadas no espaço dos dados (não em pixels), prioridade (0/1) e volume
+POINT_DTYPE = np.dtype([('x', np.float64), ('y', np.float64), ('priority', np.int8), ('volume', np.float64)])
+
+# Área, no espaço dos dados, onde `generate_points` sorteia as coordenadas
+GENERATED_BOUNDS = (0, 0, 400, 600)
+
+_store_keys = itertools.count()
+
+class PointStore:
+    """Conjunto de pontos guardado em um único array estruturado do NumPy (campos x, y, priority e volume).
+
+    O array pode ser um `np.memmap` (veja `load_points` com arquivos `.npy`), então listas de dezenas de milhares de
+    paradas não viram milhões de objetos Python. O conjunto é tratado como imutável: `concat` e `delete` retornam um
+    novo `PointStore`, cada um com uma `key` própria que a interface usa para saber quando os pontos mudaram.
+    As coordenadas ficam no espaço dos dados e só viram pixels em `project`, na hora de desenhar.
+    """
+    def __init__(self, data, bounds=None, depot=None):
+        """Envolve `data` (array com `POINT_DTYPE`); `bounds` (x_min, y_min, x_max, y_max) é calculado se omitido.
+
+        `depot` é a posição `(x, y)` do depósito lido do arquivo (veja `load_tsplib`), ou None.
+        """
+        self.data = np.asarray(data, dtype=POINT_DTYPE).reshape(-1)
+        self.depot = (float(depot[0]), float(depot[1])) if depot is not None else None
+        self.key = next(_store_keys)
+        self._coords = None
+        self._projections = {}
+        if bounds is None and len(self.data):
+            bounds = (self.data['x'].min(), self.data['y'].min(), self.data['x'].max(), self.data['y'].max())
+        self.bounds = tuple(float(value) for value in bounds) if bounds is not None else (0.0, 0.0, 1.0, 1.0)
+
+    @classmethod
+    def from_arrays(cls, coords, priorities, volumes, bounds=None, depot=None):
+        """Monta o conjunto a partir de um array de coordenadas `(n, 2)` e dos vetores de prioridade e volume."""
+        coords = np.asarray(coords, dtype=np.float64).reshape(-1, 2)
+        data = np.empty(len(coords), dtype=POINT_DTYPE)
+        data['x'] = coords[:, 0]
+        data['y'] = coords[:, 1]
+        data['priority'] = priorities
+        data['volume'] = volumes
+        return cls(data, bounds, depot)
+
+    @classmethod
+    def from_records(cls, records):
+        """Monta o conjunto a partir de uma lista de dicionários `{'coords', 'priority', 'volume'}` (formato antigo)."""
+        records = list(records)
+        return cls.from_arrays(
+            [record['coords'] for record in records],
+            [record['priority'] for record in records],
+            [record['volume'] for record in records],
+        )
+
+    def __len__(self):
+        """Retorna o número de pontos."""
+        return len(self.data)
+
+    @property
+    def coords(self):
+        """Coordenadas `(n, 2)` em float64 (calculadas uma vez e reaproveitadas)."""
+        if self._coords is None:
+            self._coords = np.column_stack((self.data['x'], self.data['y']))
+        return self._coords
+
+    @property
+    def priorities(self):
+        """Vetor de prioridades (0 ou 1)."""
+        return self.data['priority']
+
+    @property
+    def volumes(self):
+        """Vetor de volumes."""
+        return self.data['volume']
+
+    def to_records(self):
+        """Converte para a lista de dicionários do formato antigo (usada na gravação em JSON)."""
+        return [
+            {'coords': [x, y], 'priority': priority, 'volume': volume}
+            for x, y, priority, volume in zip(self.data['x'].tolist(), self.data['y'].tolist(),
+                                              self.data['priority'].tolist(), self.data['volume'].tolist())
+        ]
+
+    def concat(self, other):
+        """Retorna um novo conjunto com os pontos de `other` acrescentados ao fim (as áreas são unidas)."""
+        bounds = (
+            min(self.bounds[0], other.bounds[0]), min(self.bounds[1], other.bounds[1]),
+            max(self.bounds[2], other.bounds[2]), max(self.bounds[3], other.bounds[3]),
+        )
+        return PointStore(np.concatenate([self.data, other.data]), bounds, self.depot)
+
+    def delete(self, indices):
+        """Retorna um novo conjunto sem os pontos `indices` (a área de projeção e o depósito são mantidos)."""
+        return PointStore(np.delete(self.data, list(indices)), self.bounds, self.depot)
+
+    def project(self, area, margin=20):
+        """Projeta as coordenadas na área retangular `area` (left, top, width, height) da tela, em pixels.
+
+        A escala preserva a proporção dos dados, o conteúdo fica centralizado e o eixo y aponta para cima, como em
+        um mapa. O resultado é guardado por área, então redesenhar o mesmo conjunto não repete a conta.
+        """
+        left, top, width, height = (float(value) for value in area)
+        cache_key = (left, top, width, height, margin)
+        projected = self._projections.get(cache_key)
+        if projected is None:
+            x_min, y_min, scale, offset_x, offset_y = self._projection(area, margin)
+            projected = np.empty((len(self), 2))
+            projected[:, 0] = offset_x + (self.data['x'] - x_min) * scale
+            projected[:, 1] = offset_y - (self.data['y'] - y_min) * scale
+            self._projections[cache_key] = projected
+        return projected
+
+    def project_point(self, coords, area, margin=20):
+        """Projeta uma posição `(x, y)` fora do conjunto (por exemplo, o depósito) com a mesma escala de `project`."""
+        x_min, y_min, scale, offset_x, offset_y = self._projection(area, margin)
+        return (offset_x + (coords[0] - x_min) * scale, offset_y - (coords[1] - y_min) * scale)
+
+    def _projection(self, area, margin):
+        """Origem dos dados, escala e deslocamento que levam `bounds` para a área `area` da tela."""
+        left, top, width, height = (float(value) for value in area)
+        x_min, y_min, x_max, y_max = self.bounds
+        span_x = (x_max - x_min) or 1.0
+        span_y = (y_max - y_min) or 1.0
+        scale = min((width - 2 * margin) / span_x, (height - 2 * margin) / span_y)
+        offset_x = left + (width - span_x * scale) / 2
+        offset_y = top + (height + span_y * scale) / 2
+        return x_min, y_min, scale, offset_x, offset_y
+
+def generate_points(n):
+    """Gera `n` pontos aleatórios com coordenadas, prioridade e volume dentro de `GENERATED_BOUNDS`."""
+    x_min, y_min, x_max, y_max = GENERATED_BOUNDS
+    data = np.empty(n, dtype=POINT_DTYPE)
+    for index in range(n):
+        data[index] = (random.randint(x_min, x_max), random.randint(y_min, y_max),
+                       random.choice([0, 1]), random.randint(1, 10))
+    return PointStore(data, GENERATED_BOUNDS)
+
+def load_csv(path, delimiter=','):
+    """Carrega pontos de um CSV com cabeçalho; `x` e `y` são obrigatórias, `priority` (0) e `volume` (1) opcionais.
+
+    As linhas são lidas em blocos pelo leitor em C do NumPy direto para arrays, sem um objeto por linha.
+    """
+    with open(path, encoding='utf-8') as f:
+        header = [name.strip().lower() for name in f.readline().split(delimiter)]
+        missing = {'x', 'y'} - set(header)
+        if missing:
+            raise ValueError(f"Colunas obrigatórias ausentes em {path}: {', '.join(sorted(missing))}")
+        names = [name for name in ('x', 'y', 'priority', 'volume') if name in header]
+        table = np.loadtxt(f, delimiter=delimiter, usecols=[header.index(name) for name in names], ndmin=2)
+    data = np.zeros(len(table), dtype=POINT_DTYPE)
+    data['volume'] = 1
+    for column, name in enumerate(names):
+        data[name] = table[:, column]
+    return PointStore(data)
+
+def load_tsplib(path):
+    """Carrega pontos de um arquivo TSPLIB (`.tsp` ou `.vrp`) com `NODE_COORD_SECTION`.
+
+    Se houver `DEMAND_SECTION` (instâncias de roteamento com capacidade), as demandas viram os volumes; caso
+    contrário, todo ponto tem volume 1. Os nós de `DEPOT_SECTION` não são paradas: saem do conjunto, e o primeiro
+    vira `depot` (usado pela frota quando nenhum depósito é informado). O formato não tem prioridades, então todas
+    ficam em 0.
+    """
+    header = {}
+    with open(path, encoding='utf-8') as f:
+        for line in f:
+            line = line.strip()
+            if line.startswith('NODE_COORD_SECTION'):
+                break
+            key, _, value = line.partition(':')
+            if key:
+                header[key.strip().upper()] = value.strip()
+        else:
+            raise ValueError(f"{path} não tem NODE_COORD_SECTION (só coordenadas explícitas são suportadas)")
+        dimension = int(header['DIMENSION'])
+        nodes = np.loadtxt(f, usecols=(0, 1, 2), max_rows=dimension, ndmin=2)
+        volumes = np.ones(dimension)
+        depot_ids = []
+        for line in f:
+            section = line.strip()
+            if section.startswith('DEMAND_SECTION'):
+                volumes = np.loadtxt(f, usecols=1, max_rows=dimension, ndmin=1)
+            elif section.startswith('DEPOT_SECTION'):
+                for depot_line in f:
+                    node = int(depot_line.split()[0])
+                    if node < 0:
+                        break
+                    depot_ids.append(node)
+    coords = nodes[:, 1:]
+    is_depot = np.isin(nodes[:, 0].astype(np.int64), depot_ids)
+    depot = coords[is_depot][0] if is_depot.any() else None
+    bounds = (*coords.min(axis=0), *coords.max(axis=0)) if dimension else None
+    stops = ~is_depot
+    return PointStore.from_arrays(coords[stops], np.zeros(int(stops.sum()), dtype=np.int8), volumes[stops],
+                                  bounds=bounds, depot=depot)
+
+def load_points(path):
+    """Carrega pontos pela extensão: `.json` (lista de dicionários), `.csv`, `.tsp`/`.vrp` (TSPLIB) ou `.npy`.
+
+    Arquivos `.npy` (gravados por `save_points`) são mapeados em memória em vez de lidos inteiros.
+    """
+    path = str(path)
+    extension = path.lower().rsplit('.', 1)[-1]
+    if extension == 'json':
+        with open(path, encoding='utf-8') as f:
+            return PointStore.from_records(json.load(f))
+    if extension in ('tsp', 'vrp'):
+        return load_tsplib(path)
+    if extension == 'npy':
+        return PointStore(np.load(path, mmap_mode='r'))
+    return load_csv(path)
+
+def save_points(points, path):
+    """Salva os pontos em JSON, CSV ou `.npy` (array estruturado), de acordo com a extensão do arquivo."""
+    path = str(path)
+    if path.endswith('.json'):
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump(points.to_records(), f)
+    elif path.endswith('.npy'):
+        np.save(path, points.data)
+    else:
+        table = np.column_stack((points.data['x'], points.data['y'], points.data['priority'], points.data['volume']))
+        np.savetxt(path, table, delimiter=',', fmt='%.10g', header='x,y,priority,volume', comments='')
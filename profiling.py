@@ -0,0 +1,169 @@
+"""Instrumentação leve por fase (temporizadores e contadores nomeados) e exportação de telemetria em JSONL/CSV."""
+
+import csv
+import json
+import threading
+import time
+from collections import defaultdict, deque
+
+class _NullPhase:
+    """Contexto vazio devolvido por um `Profiler` desligado: entrar e sair não fazem nada."""
+    __slots__ = ()
+
+    def __enter__(self):
+        """Não faz nada."""
+        return self
+
+    def __exit__(self, *exc):
+        """Não faz nada (e não suprime exceções)."""
+        return False
+
+_NULL_PHASE = _NullPhase()
+
+class _Phase:
+    """Mede o tempo de um bloco `with` e o soma à fase correspondente do `Profiler`."""
+    __slots__ = ('profiler', 'name', 'start')
+
+    def __init__(self, profiler, name):
+        """Guarda o profiler e o nome da fase."""
+        self.profiler = profiler
+        self.name = name
+
+    def __enter__(self):
+        """Marca o início da fase."""
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc):
+        """Soma o tempo decorrido à fase (e não suprime exceções)."""
+        self.profiler.add_time(self.name, time.perf_counter() - self.start)
+        return False
+
+class Profiler:
+    """Temporizadores e contadores por fase, agregados por passo (uma geração ou um quadro).
+
+    Desligado, `phase()` devolve sempre o mesmo contexto vazio e `count()`/`tick()` retornam de imediato, então a
+    instrumentação pode ficar nos laços críticos. Ligado, `tick()` fecha o passo atual: guarda os tempos de cada
+    fase em uma janela móvel de `window` passos e, se houver um `TelemetryWriter`, grava uma linha de telemetria.
+    As médias podem ser lidas de outra thread (por exemplo, a interface lendo o profiler do worker de evolução).
+    """
+    def __init__(self, enabled=False, window=60, writer=None):
+        """Cria as estruturas de agregação; `writer` é opcional."""
+        self.enabled = enabled
+        self.writer = writer
+        self.window = window
+        self.steps = 0
+        self._step_times = defaultdict(float)
+        self._step_counts = defaultdict(int)
+        self._recent = {}
+        self._timestamps = deque(maxlen=window + 1)
+        self._start = time.perf_counter()
+        self._lock = threading.Lock()
+
+    def phase(self, name):
+        """Retorna um contexto que mede o bloco como a fase `name` (sem custo se o profiler estiver desligado)."""
+        if not self.enabled:
+            return _NULL_PHASE
+        return _Phase(self, name)
+
+    def add_time(self, name, seconds):
+        """Soma `seconds` ao tempo da fase `name` no passo atual."""
+        self._step_times[name] += seconds
+
+    def count(self, name, value=1):
+        """Soma `value` ao contador `name` no passo atual."""
+        if self.enabled:
+            self._step_counts[name] += value
+
+    def tick(self, **fields):
+        """Fecha o passo atual, atualiza as médias móveis e grava a telemetria com os campos extras `fields`."""
+        if not self.enabled:
+            return
+        now = time.perf_counter()
+        with self._lock:
+            self._timestamps.append(now)
+            self.steps += 1
+            for name, seconds in self._step_times.items():
+                if name not in self._recent:
+                    self._recent[name] = deque(maxlen=self.window)
+                self._recent[name].append(seconds)
+        if self.writer is not None:
+            record = dict(fields)
+            record['elapsed_seconds'] = now - self._start
+            record.update((f'{name}_ms', seconds * 1000) for name, seconds in self._step_times.items())
+            record.update(self._step_counts)
+            self.writer.write(record)
+        self._step_times.clear()
+        self._step_counts.clear()
+
+    @property
+    def rate(self):
+        """Passos por segundo na janela atual (0 enquanto não houver passos suficientes)."""
+        with self._lock:
+            if len(self._timestamps) < 2:
+                return 0.0
+            elapsed = self._timestamps[-1] - self._timestamps[0]
+            return (len(self._timestamps) - 1) / elapsed if elapsed > 0 else 0.0
+
+    def phase_ms(self):
+        """Tempo médio por passo de cada fase, em milissegundos, na janela atual (da fase mais cara à mais barata)."""
+        with self._lock:
+            means = {name: sum(times) * 1000 / len(times) for name, times in self._recent.items() if times}
+        return dict(sorted(means.items(), key=lambda item: item[1], reverse=True))
+
+    def reset(self):
+        """Descarta as médias móveis (por exemplo, depois de reiniciar a simulação)."""
+        with self._lock:
+            self.steps = 0
+            self._step_times.clear()
+            self._step_counts.clear()
+            self._recent.clear()
+            self._timestamps.clear()
+            self._start = time.perf_counter()
+
+    def close(self):
+        """Fecha o arquivo de telemetria, se houver."""
+        if self.writer is not None:
+            self.writer.close()
+            self.writer = None
+
+# Profiler sempre desligado, usado como padrão quando nenhum é passado
+NULL_PROFILER = Profiler()
+
+class TelemetryWriter:
+    """Grava uma linha de telemetria por passo em JSONL ou, se o arquivo terminar em `.csv`, em CSV.
+
+    No CSV, as colunas são todas as chaves vistas até agora. Quando uma fase ou contador aparece pela primeira vez
+    (por exemplo, `checkpoint_ms` só na geração do primeiro checkpoint), o arquivo é reescrito com o cabeçalho novo.
+    """
+    def __init__(self, path):
+        """Abre o arquivo para escrita (sobrescrevendo o anterior)."""
+        self.path = path
+        self.is_csv = str(path).lower().endswith('.csv')
+        self._file = open(path, 'w', newline='' if self.is_csv else None, encoding='utf-8')
+        self._csv = None
+        self._fieldnames = []
+        self._known = set()
+        self._records = []
+
+    def write(self, record):
+        """Grava uma linha."""
+        if not self.is_csv:
+            self._file.write(json.dumps(record, default=float) + '\n')
+            return
+        self._records.append(record)
+        new_fields = [key for key in record if key not in self._known]
+        if new_fields:
+            self._fieldnames.extend(new_fields)
+            self._known.update(new_fields)
+            self._file.seek(0)
+            self._file.truncate()
+            self._csv = csv.DictWriter(self._file, fieldnames=self._fieldnames, restval='')
+            self._csv.writeheader()
+            self._csv.writerows(self._records)
+        else:
+            self._csv.writerow(record)
+
+    def close(self):
+        """Fecha o arquivo."""
+        self._file.close()
@@ -0,0 +1,65 @@
+"""Caches de renderização da interface: fontes, textos, camadas estáticas e atualização por regiões sujas."""
+
+import time
+from collections import deque
+from functools import lru_cache
+
+import pygame
+
+@lru_cache(maxsize=None)
+def get_font(size):
+    """Retorna a fonte padrão do Pygame no tamanho pedido, criando-a uma única vez."""
+    return pygame.font.Font(None, size)
+
+@lru_cache(maxsize=512)
+def render_text(text, size, color):
+    """Renderiza um texto (com antialiasing) e guarda a superfície, indexada por (texto, tamanho, cor)."""
+    return get_font(size).render(text, True, color)
+
+class DirtyRegions:
+    """Acompanha o estado de cada região da tela e acumula os retângulos que precisam ser enviados ao display."""
+    def __init__(self):
+        """Começa exigindo um redesenho completo."""
+        self._signatures = {}
+        self.rects = []
+        self.full_redraw = True
+
+    def needs_redraw(self, name, rect, signature):
+        """Retorna True (e marca `rect` como suja) se a assinatura da região mudou desde o último quadro."""
+        if not self.full_redraw and self._signatures.get(name) == signature:
+            return False
+        self._signatures[name] = signature
+        self.rects.append(pygame.Rect(rect))
+        return True
+
+    def invalidate(self):
+        """Força o redesenho de todas as regiões no próximo quadro (por exemplo, depois de um overlay)."""
+        self.full_redraw = True
+        self._signatures.clear()
+
+    def flush(self):
+        """Envia ao display apenas as regiões alteradas (ou a tela inteira, se houve invalidação)."""
+        if self.full_redraw:
+            pygame.display.flip()
+        elif self.rects:
+            pygame.display.update(self.rects)
+        self.rects = []
+        self.full_redraw = False
+
+class FrameTimer:
+    """Mede quadros por segundo com média móvel sobre os últimos `window` quadros."""
+    def __init__(self, window=60):
+        """Cria a janela de tempos dos quadros."""
+        self._timestamps = deque(maxlen=window + 1)
+
+    def tick(self):
+        """Registra o fim de um quadro."""
+        self._timestamps.append(time.perf_counter())
+
+    @property
+    def fps(self):
+        """Quadros por segundo na janela atual (0 enquanto não houver quadros suficientes)."""
+        if len(self._timestamps) < 2:
+            return 0.0
+        elapsed = self._timestamps[-1] - self._timestamps[0]
+        return (len(self._timestamps) - 1) / elapsed if elapsed > 0 else 0.0
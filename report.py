@@ -0,0 +1,220 @@
+"""Geração de relatórios de rota com um LLM em segundo plano, com cache em disco e cliente intercambiável."""
+
+import hashlib
+import json
+import os
+import threading
+
+import numpy as np
+
+from ga_classes import MAX_CAPACITY
+
+REPORT_PATH = "RELATORIO_DE_ROTA.md"
+REPORT_HEADER = "# Relatório de Rota Otimizada (Gerado por IA)\n\n"
+REPORT_CACHE_DIR = ".report_cache"
+REPORT_MODEL = "gpt-3.5-turbo"
+SYSTEM_MESSAGE = "Você é um assistente de logística que gera relatórios em Markdown."
+
+def describe_trips(best_individual, points):
+    """Linhas do prompt com a frota e a viagem de cada veículo (paradas e carga), ou só a capacidade sem frota."""
+    distance_matrix = best_individual.distance_matrix
+    fleet = distance_matrix.fleet
+    if fleet is None:
+        return f"- **Capacidade Máxima do Veículo:** {MAX_CAPACITY:g}"
+    depot = f"({fleet.depot[0]:.2f}, {fleet.depot[1]:.2f})"
+    lines = [
+        f"- **Capacidade de Cada Veículo:** {fleet.capacity:g}",
+        f"- **Veículos Disponíveis:** {fleet.vehicles if fleet.vehicles else 'sem limite'}",
+        f"- **Depósito (início e fim de cada viagem):** {depot}",
+        "- **Viagens por Veículo (índices das paradas, na ordem, e carga):**",
+    ]
+    for number, trip in enumerate(distance_matrix.trips(best_individual.route), start=1):
+        load = float(points.volumes[trip].sum())
+        lines.append(f"  - Veículo {number}: depósito -> {trip} -> depósito (carga {load:g})")
+    return "\n".join(lines)
+
+def build_report_prompt(best_individual, points):
+    """Monta o prompt do relatório com a rota otimizada, os pontos (um `PointStore`) e a comparação com a rota sequencial.
+
+    Com frota, o prompt traz a viagem de cada veículo e pede as instruções separadas por veículo.
+    """
+    route_indices = [int(i) for i in best_individual.route]
+    total_distance = 1 / best_individual.fitness if best_individual.fitness > 0 else float('inf')
+    total_volume = float(points.volumes[route_indices].sum())
+    ordered_points = [
+        ((round(x, 2), round(y, 2)), priority, volume)
+        for (x, y), priority, volume in zip(points.coords[route_indices].tolist(),
+                                            points.priorities[route_indices].tolist(),
+                                            points.volumes[route_indices].tolist())
+    ]
+
+    # Calcula a distância de uma rota não otimizada (sequencial) para comparação. Com frota, a rota sequencial é
+    # dividida em viagens a partir do depósito, como a otimizada, para que as duas distâncias sejam comparáveis
+    distance_matrix = best_individual.distance_matrix
+    driver_instructions = "Um guia passo a passo claro e direto."
+    if distance_matrix.fleet is None:
+        closed = np.vstack([points.coords, points.coords[:1]])
+        naive_dist = float(np.hypot(*np.diff(closed, axis=0).T).sum())
+    else:
+        naive_dist = distance_matrix.travel_length(np.arange(len(points.coords)))
+        driver_instructions = "Um guia passo a passo claro e direto para o motorista de cada veículo, viagem por viagem."
+
+    return f"""Você é um assistente de logística. Sua tarefa é gerar um relatório completo sobre uma rota de entrega otimizada por um algoritmo genético. O relatório deve ser em formato Markdown e conter exatamente as seguintes seções:
+
+1.  **Instruções para o Motorista:** {driver_instructions}
+2.  **Relatório de Eficiência:** Uma análise comparando a rota otimizada com uma rota não otimizada, incluindo a porcentagem de economia.
+3.  **Sugestões de Melhoria:** Com base nos dados da rota, sugira melhorias no processo logístico.
+4.  **Perguntas e Respostas:** Responda a um conjunto de perguntas comuns sobre a rota.
+
+**Dados da Rota para Análise:**
+- **Rota Otimizada (sequência de índices):** {route_indices}
+- **Pontos (com coordenadas, prioridade e volume):** {ordered_points}
+- **Distância Total da Rota Otimizada:** {total_distance:.2f} km
+- **Distância de uma Rota Não Otimizada (para comparação):** {naive_dist:.2f} km
+- **Volume Total da Carga:** {total_volume:g}
+{describe_trips(best_individual, points)}
+
+Por favor, gere o relatório completo com base nestes dados."""
+
+def report_cache_key(route, points, prompt, model=REPORT_MODEL):
+    """Calcula a chave do cache: um hash SHA-256 da rota, dos pontos, do prompt e do modelo."""
+    payload = json.dumps({
+        'route': [int(i) for i in route],
+        'points': hashlib.sha256(np.ascontiguousarray(points.data).tobytes()).hexdigest(),
+        'prompt': prompt,
+        'model': model,
+    }, sort_keys=True)
+    return hashlib.sha256(payload.encode('utf-8')).hexdigest()
+
+class ReportCache:
+    """Guarda relatórios já gerados em arquivos Markdown, um por chave, dentro de `directory`."""
+    def __init__(self, directory=REPORT_CACHE_DIR):
+        """Define o diretório do cache (criado na primeira gravação)."""
+        self.directory = directory
+
+    def _path(self, key):
+        """Caminho do arquivo de uma chave."""
+        return os.path.join(self.directory, f"{key}.md")
+
+    def get(self, key):
+        """Retorna o relatório guardado para `key`, ou None se não houver."""
+        try:
+            with open(self._path(key), encoding='utf-8') as f:
+                return f.read()
+        except FileNotFoundError:
+            return None
+
+    def put(self, key, text):
+        """Grava o relatório de forma atômica (arquivo temporário + rename)."""
+        os.makedirs(self.directory, exist_ok=True)
+        temporary = self._path(key) + '.tmp'
+        with open(temporary, 'w', encoding='utf-8') as f:
+            f.write(text)
+        os.replace(temporary, self._path(key))
+
+class OpenAIChatClient:
+    """Cliente de chat com streaming sobre a API da OpenAI ou qualquer servidor compatível.
+
+    `base_url` permite trocar o endpoint oficial por um servidor local (por exemplo, `report_standin.py`);
+    por padrão usa a variável de ambiente `OPENAI_BASE_URL`, se definida.
+    """
+    def __init__(self, api_key, base_url=None, model=REPORT_MODEL):
+        """Guarda a configuração; o cliente `openai` só é criado na primeira requisição."""
+        self.api_key = api_key
+        self.base_url = base_url or os.getenv("OPENAI_BASE_URL") or None
+        self.model = model
+
+    def stream(self, messages):
+        """Envia as mensagens e gera os trechos de texto da resposta à medida que chegam."""
+        import openai
+        client = openai.OpenAI(api_key=self.api_key, base_url=self.base_url)
+        response = client.chat.completions.create(model=self.model, messages=messages, stream=True)
+        for chunk in response:
+            if chunk.choices and chunk.choices[0].delta.content:
+                yield chunk.choices[0].delta.content
+
+def create_report_client():
+    """Cria o cliente padrão a partir do `.env`; retorna None se a chave da API não estiver configurada.
+
+    O `.env` só é lido aqui, no primeiro relatório, para que importar o módulo não carregue o `dotenv`.
+    """
+    from dotenv import load_dotenv
+    load_dotenv()
+    api_key = os.getenv("OPENAI_API_KEY")
+    if not api_key or api_key == "SUA_CHAVE_DA_API_AQUI":
+        return None
+    return OpenAIChatClient(api_key)
+
+class ReportJob(threading.Thread):
+    """Gera um relatório em uma thread própria, gravando a resposta em `path` à medida que ela chega.
+
+    A interface consulta `state` (`running`, `done` ou `error`), `chars` e `cached` a cada quadro.
+    Relatórios concluídos vão para o cache; um pedido repetido é atendido sem chamar a API.
+    """
+    def __init__(self, client, prompt, key, cache=None, path=REPORT_PATH):
+        """Prepara o pedido; a geração começa com `start()`."""
+        super().__init__(daemon=True)
+        self.client = client
+        self.prompt = prompt
+        self.key = key
+        self.cache = cache
+        self.path = path
+        self.state = 'running'
+        self.chars = 0
+        self.cached = False
+        self.error = None
+
+    def run(self):
+        """Usa o cache se possível; senão faz a chamada com streaming, gravando cada trecho no arquivo."""
+        try:
+            cached_report = self.cache.get(self.key) if self.cache else None
+            if cached_report is not None:
+                self.cached = True
+                self._write(cached_report)
+                print(f"Relatório reaproveitado do cache e salvo em {self.path}")
+            else:
+                report = self._stream()
+                if self.cache:
+                    self.cache.put(self.key, report)
+                print(f"Relatório salvo com sucesso em {self.path}")
+            self.state = 'done'
+        except Exception as e:
+            self.error = e
+            self.state = 'error'
+            print(f"Ocorreu um erro ao gerar o relatório: {e}")
+
+    def _write(self, report):
+        """Grava um relatório completo de uma vez."""
+        with open(self.path, 'w', encoding='utf-8') as f:
+            f.write(report)
+        self.chars = len(report)
+
+    def _stream(self):
+        """Grava o cabeçalho e depois cada trecho recebido, liberando o buffer para o arquivo acompanhar a geração."""
+        messages = [
+            {"role": "system", "content": SYSTEM_MESSAGE},
+            {"role": "user", "content": self.prompt},
+        ]
+        parts = [REPORT_HEADER]
+        with open(self.path, 'w', encoding='utf-8') as f:
+            f.write(REPORT_HEADER)
+            f.flush()
+            for text in self.client.stream(messages):
+                parts.append(text)
+                self.chars += len(text)
+                f.write(text)
+                f.flush()
+        return ''.join(parts)
+
+def start_report(best_individual, points, client=None, cache=None, path=REPORT_PATH):
+    """Inicia a geração do relatório em segundo plano e retorna o `ReportJob` (ou None se não há cliente)."""
+    client = client or create_report_client()
+    if client is None:
+        print("ERRO: Chave da API da OpenAI não configurada.")
+        print("Por favor, defina a variável de ambiente OPENAI_API_KEY no arquivo .env")
+        return None
+    prompt = build_report_prompt(best_individual, points)
+    key = report_cache_key(best_individual.route, points, prompt, getattr(client, 'model', REPORT_MODEL))
+    job = ReportJob(client, prompt, key, ReportCache() if cache is None else cache, path)
+    job.start()
+    return job
@@ -0,0 +1,112 @@
+"""Servidor HTTP local que imita o endpoint de chat da OpenAI, para testar relatórios sem rede nem chave.
+
+Uso: `python -m report_standin --port 8765` e depois, em outro terminal,
+`OPENAI_BASE_URL=http://127.0.0.1:8765/v1 OPENAI_API_KEY=local python main.py`.
+"""
+
+import argparse
+import json
+import sys
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+STANDIN_REPORT = """## Instruções para o Motorista
+
+Siga a sequência de paradas da rota otimizada, começando pelos pontos prioritários.
+
+## Relatório de Eficiência
+
+Relatório de teste gerado pelo servidor local; nenhuma análise real foi feita.
+
+## Sugestões de Melhoria
+
+Nenhuma.
+
+## Perguntas e Respostas
+
+**P:** Este relatório veio da OpenAI?
+**R:** Não, do servidor local de testes.
+"""
+
+class StandInHandler(BaseHTTPRequestHandler):
+    """Responde a `POST .../chat/completions` com uma resposta fixa, em streaming (SSE) ou de uma vez."""
+    response_text = STANDIN_REPORT
+    chunk_size = 40
+    delay = 0.0
+
+    def do_POST(self):
+        """Lê o pedido e devolve a resposta no formato da API de chat."""
+        if not self.path.rstrip('/').endswith('/chat/completions'):
+            self.send_error(404)
+            return
+        request = json.loads(self.rfile.read(int(self.headers.get('Content-Length', 0))) or b'{}')
+        model = request.get('model', 'standin')
+        if request.get('stream'):
+            self._stream(model)
+        else:
+            self._send_json({
+                'id': 'standin', 'object': 'chat.completion', 'created': int(time.time()), 'model': model,
+                'choices': [{'index': 0, 'finish_reason': 'stop',
+                             'message': {'role': 'assistant', 'content': self.response_text}}],
+            })
+
+    def _send_json(self, payload):
+        """Envia uma resposta JSON completa."""
+        body = json.dumps(payload).encode('utf-8')
+        self.send_response(200)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def _stream(self, model):
+        """Envia a resposta em trechos de `chunk_size` caracteres como eventos SSE."""
+        self.send_response(200)
+        self.send_header('Content-Type', 'text/event-stream')
+        self.send_header('Cache-Control', 'no-cache')
+        self.end_headers()
+        text = self.response_text
+        for start in range(0, len(text), self.chunk_size):
+            chunk = {
+                'id': 'standin', 'object': 'chat.completion.chunk', 'created': int(time.time()), 'model': model,
+                'choices': [{'index': 0, 'finish_reason': None, 'delta': {'content': text[start:start + self.chunk_size]}}],
+            }
+            self.wfile.write(f"data: {json.dumps(chunk)}\n\n".encode('utf-8'))
+            self.wfile.flush()
+            if self.delay:
+                time.sleep(self.delay)
+        self.wfile.write(b"data: [DONE]\n\n")
+        self.wfile.flush()
+
+    def log_message(self, format, *args):
+        """Silencia o log de cada requisição."""
+
+def start_standin_server(port=0, response_text=STANDIN_REPORT, chunk_size=40, delay=0.0):
+    """Sobe o servidor em uma thread e retorna `(server, base_url)`; encerre com `server.shutdown()`."""
+    handler = type('ConfiguredStandInHandler', (StandInHandler,), {
+        'response_text': response_text, 'chunk_size': chunk_size, 'delay': delay,
+    })
+    server = ThreadingHTTPServer(('127.0.0.1', port), handler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server, f"http://127.0.0.1:{server.server_address[1]}/v1"
+
+def main(argv=None):
+    """Roda o servidor em primeiro plano até Ctrl+C."""
+    parser = argparse.ArgumentParser(description="Servidor local que imita a API de chat da OpenAI.")
+    parser.add_argument('--port', type=int, default=8765, help="Porta do servidor.")
+    parser.add_argument('--delay', type=float, default=0.05, help="Pausa em segundos entre os trechos enviados.")
+    args = parser.parse_args(argv)
+    handler = type('ConfiguredStandInHandler', (StandInHandler,), {'delay': args.delay})
+    server = ThreadingHTTPServer(('127.0.0.1', args.port), handler)
+    print(f"Servidor local em http://127.0.0.1:{args.port}/v1 (Ctrl+C para encerrar)")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+    return 0
+
+if __name__ == '__main__':
+    sys.exit(main())
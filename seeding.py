@@ -0,0 +1,189 @@
+"""Construção da população inicial: rotas do vizinho mais próximo, da curva de Hilbert e de arestas gulosas,
+misturadas a uma fração de permutações aleatórias."""
+
+import numpy as np
+
+from ga_classes import PRIORITY_MAX_POSITION, batch_costs, fitness_from_costs
+from local_search import nearest_neighbors
+from warm_start import perturbed_copies
+
+# Inicializadores disponíveis, na ordem em que suas rotas entram na população
+INITIALIZERS = ('greedy', 'hilbert', 'nearest')
+
+# Tamanho das listas de vizinhos (índice espacial) usadas pelo vizinho mais próximo e pelas arestas gulosas
+SEEDING_NEIGHBORS = 10
+
+# Resolução da curva de Hilbert: uma grade de 2**HILBERT_ORDER células por lado
+HILBERT_ORDER = 16
+
+def hilbert_order(coords, order=HILBERT_ORDER):
+    """Ordena os pontos pela posição na curva de Hilbert, que mantém próximos na rota os pontos próximos no plano.
+
+    As coordenadas são levadas a uma grade de `2**order` células por lado e o índice na curva de todos os pontos é
+    calculado de uma vez, bit a bit. Custo O(n log n), dominado pela ordenação.
+    """
+    coords = np.asarray(coords, dtype=np.float64)
+    side = 1 << order
+    lower = coords.min(axis=0)
+    extent = max(float((coords.max(axis=0) - lower).max()), 1e-9)
+    cells = ((coords - lower) / extent * (side - 1)).astype(np.int64)
+    x, y = cells[:, 0], cells[:, 1]
+    distance = np.zeros(len(coords), dtype=np.int64)
+    s = side >> 1
+    while s > 0:
+        rx = (x & s) > 0
+        ry = (y & s) > 0
+        distance += s * s * ((3 * rx) ^ ry)
+        # Gira o quadrante para que a curva continue de onde o quadrante anterior terminou
+        flip = ~ry & rx
+        x = np.where(flip, side - 1 - x, x)
+        y = np.where(flip, side - 1 - y, y)
+        x, y = np.where(~ry, y, x), np.where(~ry, x, y)
+        s >>= 1
+    return np.argsort(distance, kind='stable')
+
+def nearest_neighbor_tour(distance_matrix, start, neighbors):
+    """Rota do vizinho mais próximo a partir de `start`, consultando primeiro a lista de vizinhos de cada ponto.
+
+    Como a lista está ordenada por distância, o primeiro vizinho ainda não visitado é o mais próximo de todos. Só
+    quando a lista inteira já foi visitada a linha da matriz é varrida; com listas de `SEEDING_NEIGHBORS` isso é
+    raro, e o custo fica perto de O(n·k).
+    """
+    n = len(distance_matrix)
+    matrix = distance_matrix.matrix
+    neighbor_lists = neighbors.tolist()
+    visited = np.zeros(n, dtype=bool)
+    route = [start]
+    visited[start] = True
+    current = start
+    for _ in range(n - 1):
+        for candidate in neighbor_lists[current]:
+            if not visited[candidate]:
+                current = candidate
+                break
+        else:
+            current = int(np.where(visited, np.inf, matrix[current]).argmin())
+        visited[current] = True
+        route.append(current)
+    return np.array(route, dtype=np.int64)
+
+def greedy_edge_tour(distance_matrix, neighbors):
+    """Rota das arestas gulosas: aceita as arestas mais curtas que não criam ciclo nem grau maior que 2.
+
+    As arestas candidatas vêm das listas de vizinhos (n·k arestas em vez de n²). Os fragmentos que sobram são
+    ligados pelo extremo livre mais próximo do fim do fragmento atual.
+    """
+    n = len(distance_matrix)
+    matrix = distance_matrix.matrix
+    tails = np.repeat(np.arange(n), neighbors.shape[1])
+    heads = neighbors.ravel()
+    pairs = np.unique(np.sort(np.stack([tails, heads], axis=1), axis=1), axis=0)
+    pairs = pairs[np.argsort(matrix[pairs[:, 0], pairs[:, 1]], kind='stable')]
+
+    parent = list(range(n))
+    degree = [0] * n
+    adjacency = [[] for _ in range(n)]
+
+    def find(node):
+        """Raiz do conjunto de `node` (union-find com compressão de caminho pela metade)."""
+        while parent[node] != node:
+            parent[node] = parent[parent[node]]
+            node = parent[node]
+        return node
+
+    for a, b in pairs.tolist():
+        if degree[a] < 2 and degree[b] < 2:
+            root_a, root_b = find(a), find(b)
+            if root_a != root_b:
+                parent[root_a] = root_b
+                degree[a] += 1
+                degree[b] += 1
+                adjacency[a].append(b)
+                adjacency[b].append(a)
+
+    # Extremos livres de cada fragmento (um ponto isolado é os dois extremos do próprio fragmento)
+    ends = np.array([node for node in range(n) if degree[node] < 2], dtype=np.int64)
+    open_ends = np.ones(len(ends), dtype=bool)
+    end_index = {int(node): index for index, node in enumerate(ends)}
+    visited = np.zeros(n, dtype=bool)
+    route = []
+    node = int(ends[0])
+    while True:
+        open_ends[end_index[node]] = False
+        previous = -1
+        while True:
+            route.append(node)
+            visited[node] = True
+            following = [other for other in adjacency[node] if other != previous and not visited[other]]
+            if not following:
+                break
+            previous, node = node, following[0]
+        open_ends[end_index[node]] = False
+        if len(route) == n:
+            break
+        candidates = ends[open_ends]
+        node = int(candidates[matrix[node, candidates].argmin()])
+    return np.array(route, dtype=np.int64)
+
+def rotate_to_priority(routes, distance_matrix, rng):
+    """Gira cada rota para começar em um ponto prioritário, se nenhum estiver nas primeiras posições.
+
+    Sem frota, a rota é um ciclo: girá-la não muda a distância e zera a penalidade de prioridade de
+    `calculate_fitness`. Com frota, o giro muda os cortes das viagens e pode aumentar a distância, então as rotas
+    giradas são reavaliadas (`batch_costs`) e o giro só é mantido se o custo total cair. O ponto prioritário do
+    início é sorteado entre os da rota, para manter a diversidade.
+    """
+    priorities = distance_matrix.priorities
+    if not (priorities == 1).any():
+        return routes
+    rows = []
+    rotated = []
+    for row, route in enumerate(routes):
+        positions = np.flatnonzero(priorities[route] == 1)
+        if positions[0] > PRIORITY_MAX_POSITION:
+            rows.append(row)
+            rotated.append(np.roll(route, -positions[rng.integers(len(positions))]))
+    if not rows:
+        return routes
+    rotated = np.array(rotated)
+    if distance_matrix.fleet is not None:
+        before = fitness_from_costs(*batch_costs(routes[rows], distance_matrix))
+        after = fitness_from_costs(*batch_costs(rotated, distance_matrix))
+        keep = after > before
+        rows = np.array(rows)[keep]
+        rotated = rotated[keep]
+    routes[rows] = rotated
+    return routes
+
+def seed_routes(distance_matrix, size, methods=INITIALIZERS, random_fraction=0.5, rng=None):
+    """Monta as `size` rotas iniciais: `random_fraction` delas aleatórias e o resto dos inicializadores `methods`.
+
+    `greedy` e `hilbert` contribuem uma rota cada; `nearest` preenche o restante com rotas do vizinho mais próximo a
+    partir de inícios aleatórios distintos. Se ainda faltarem rotas (instância pequena ou sem `nearest`), as
+    construídas são copiadas com um trecho invertido. As rotas começam por um ponto prioritário (com frota, só quando
+    isso reduz o custo; veja `rotate_to_priority`). Retorna um array `(size, n)`.
+    """
+    rng = np.random.default_rng() if rng is None else rng
+    unknown = set(methods) - set(INITIALIZERS)
+    if unknown:
+        raise ValueError(f"Inicializadores desconhecidos: {', '.join(sorted(unknown))}")
+    n = len(distance_matrix)
+    num_seeded = size - int(round(size * random_fraction)) if methods and n > 3 else 0
+
+    tours = []
+    if num_seeded:
+        neighbors = nearest_neighbors(distance_matrix.coords, SEEDING_NEIGHBORS)
+        if 'greedy' in methods:
+            tours.append(greedy_edge_tour(distance_matrix, neighbors))
+        if 'hilbert' in methods:
+            tours.append(hilbert_order(distance_matrix.coords))
+        if 'nearest' in methods:
+            starts = rng.choice(n, min(n, max(num_seeded - len(tours), 0)), replace=False)
+            tours.extend(nearest_neighbor_tour(distance_matrix, int(start), neighbors) for start in starts)
+        tours = tours[:num_seeded]
+        if len(tours) < num_seeded:
+            tours.extend(perturbed_copies(np.array(tours), num_seeded - len(tours), rng))
+
+    random_routes = rng.permuted(np.tile(np.arange(n, dtype=np.int64), (size - len(tours), 1)), axis=1)
+    routes = np.concatenate([np.array(tours, dtype=np.int64).reshape(-1, n), random_routes])
+    return rotate_to_priority(routes, distance_matrix, rng)
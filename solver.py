@@ -0,0 +1,236 @@
+"""Modo de linha de comando (sem interface gráfica) para rodar o AG em lote, na velocidade máxima.
+
+Uso: `python -m solver --num-points 200 --generations 2000 --output melhor_rota.json`
+"""
+
+import argparse
+import csv
+import json
+import random
+import sys
+import time
+
+import numpy as np
+
+from checkpoint import checkpoint_fleet, load_checkpoint, restore_population, save_checkpoint
+from convergence import RESTART, STOP, ConvergenceController, restart_from_elite
+from ga_classes import MAX_CAPACITY, ArrayPopulation, DistanceMatrix, Fleet, Population, SteadyStatePopulation
+from local_search import LocalSearch
+from point_data import generate_points, load_points, save_points
+from profiling import NULL_PROFILER, Profiler, TelemetryWriter
+from seeding import INITIALIZERS, seed_routes
+
+def create_population(engine, size, distance_matrix, rng, seeding=None, random_fraction=0.5):
+    """Cria a população inicial usando a implementação escolhida (`array`, `list` ou `steady`).
+
+    Com `seeding` (nomes de `seeding.INITIALIZERS`), as rotas iniciais vêm de `seed_routes`, com `random_fraction`
+    delas aleatórias; sem ele, todas são permutações aleatórias.
+    """
+    if seeding:
+        routes = seed_routes(distance_matrix, size, seeding, random_fraction, rng)
+        if engine == 'array':
+            return ArrayPopulation.from_routes(routes, distance_matrix, rng=rng)
+        if engine == 'steady':
+            return SteadyStatePopulation.from_routes(routes, distance_matrix)
+        return Population.from_routes(routes, distance_matrix)
+    if engine == 'array':
+        return ArrayPopulation(size, distance_matrix, rng=rng)
+    if engine == 'steady':
+        return SteadyStatePopulation(size, distance_matrix)
+    return Population(size, distance_matrix)
+
+def run_solver(population, distance_matrix, mutation_rate, num_generations, time_budget=None, local_search=None,
+               profiler=NULL_PROFILER, checkpoint_path=None, checkpoint_interval=0, resume=None, convergence=None,
+               points=None):
+    """Evolui a população até `num_generations` ou até esgotar `time_budget` segundos, sem pausas entre gerações."""
+    best_fitness_history = list(resume.best_fitness_history) if resume else []
+    average_fitness_history = list(resume.average_fitness_history) if resume else []
+    generation = first_generation = resume.generation if resume else 0
+
+    def checkpoint():
+        """Grava o estado atual, se houver um caminho de checkpoint."""
+        if checkpoint_path:
+            with profiler.phase('checkpoint'):
+                save_checkpoint(checkpoint_path, population, distance_matrix, generation, best_fitness_history,
+                                average_fitness_history, points=points, mutation_rate=mutation_rate,
+                                num_generations=num_generations)
+
+    start = time.perf_counter()
+    deadline = start + time_budget if time_budget else None
+
+    while generation < num_generations:
+        if deadline is not None and time.perf_counter() >= deadline:
+            break
+        rate = convergence.mutation_rate(mutation_rate) if convergence is not None else mutation_rate
+        population.evolve(rate, distance_matrix, local_search=local_search, profiler=profiler)
+        with profiler.phase('statistics'):
+            stats = population.stats
+            best_fitness_history.append(stats.best_fitness)
+            average_fitness_history.append(stats.mean_fitness)
+        generation += 1
+        decision = convergence.update(stats) if convergence is not None else None
+        if decision == RESTART:
+            population = restart_from_elite(population, distance_matrix, convergence.elite_size,
+                                            getattr(population, 'rng', None))
+        if checkpoint_interval and generation % checkpoint_interval == 0:
+            checkpoint()
+        profiler.tick(generation=generation, best_fitness=stats.best_fitness, average_fitness=stats.mean_fitness,
+                      fitness_std=stats.std_fitness, diversity=stats.diversity, mutation_rate=rate)
+        if decision == STOP:
+            break
+
+    elapsed = time.perf_counter() - start
+    if generation > first_generation:
+        checkpoint()
+    best_individual = population.get_fittest()
+    return {
+        'route': [int(gene) for gene in best_individual.route],
+        'fitness': best_individual.fitness,
+        'route_length': distance_matrix.travel_length(best_individual.route),
+        'trips': distance_matrix.trips(best_individual.route) if distance_matrix.fleet is not None else None,
+        'generations': generation,
+        'elapsed_seconds': elapsed,
+        'generations_per_second': (generation - first_generation) / elapsed if elapsed > 0 else 0.0,
+        'converged': convergence.converged if convergence is not None else False,
+        'restarts': convergence.restarts if convergence is not None else 0,
+        'best_fitness_history': best_fitness_history,
+        'average_fitness_history': average_fitness_history,
+    }
+
+def write_history_csv(result, path):
+    """Grava o histórico de aptidão (melhor e média por geração) em CSV."""
+    with open(path, 'w', newline='', encoding='utf-8') as f:
+        writer = csv.writer(f)
+        writer.writerow(['generation', 'best_fitness', 'average_fitness', 'best_distance'])
+        for generation, (best, average) in enumerate(zip(result['best_fitness_history'], result['average_fitness_history']), start=1):
+            writer.writerow([generation, best, average, 1 / best if best > 0 else 0])
+
+def parse_args(argv):
+    """Lê os parâmetros da linha de comando."""
+    parser = argparse.ArgumentParser(description="Otimização de rotas com Algoritmo Genético, sem interface gráfica.")
+    source = parser.add_mutually_exclusive_group()
+    source.add_argument('--points', help="Arquivo de pontos (.json, .csv com colunas x, y, priority, volume, TSPLIB .tsp/.vrp ou .npy).")
+    source.add_argument('--num-points', type=int, default=20, help="Quantidade de pontos aleatórios a gerar.")
+    parser.add_argument('--population', type=int, default=50, help="Tamanho da população.")
+    parser.add_argument('--mutation', type=float, default=0.05, help="Taxa de mutação.")
+    parser.add_argument('--generations', type=int, default=1000, help="Número máximo de gerações.")
+    parser.add_argument('--time-budget', type=float, default=None, help="Tempo máximo de execução em segundos.")
+    parser.add_argument('--engine', choices=['array', 'list', 'steady'], default='array', help="Implementação da população (steady: regime permanente).")
+    parser.add_argument('--seeding', nargs='+', choices=INITIALIZERS, default=None, help="Inicializadores da população (vizinho mais próximo, curva de Hilbert, arestas gulosas).")
+    parser.add_argument('--random-fraction', type=float, default=0.5, help="Fração de rotas aleatórias na população inicial (com --seeding).")
+    parser.add_argument('--split', action='store_true', help="Divide a rota em viagens de veículos com capacidade limitada, saindo do depósito.")
+    parser.add_argument('--capacity', type=float, default=MAX_CAPACITY, help="Capacidade de cada veículo (com --split).")
+    parser.add_argument('--vehicles', type=int, default=0, help="Número de veículos da frota (com --split; 0 = ilimitado).")
+    parser.add_argument('--depot', type=float, nargs=2, default=None, metavar=('X', 'Y'), help="Posição do depósito (com --split; padrão: o DEPOT_SECTION do arquivo TSPLIB ou o centro dos pontos).")
+    parser.add_argument('--float32', action='store_true', help="Usa float32 na matriz de distâncias.")
+    parser.add_argument('--islands', type=int, default=0, help="Número de ilhas em processos paralelos (0 desativa o modelo de ilhas).")
+    parser.add_argument('--migration-interval', type=int, default=20, help="Gerações entre migrações no modelo de ilhas.")
+    parser.add_argument('--topology', choices=['ring', 'random'], default='ring', help="Topologia de migração entre as ilhas.")
+    parser.add_argument('--local-search', action='store_true', help="Ativa a busca local 2-opt/Or-opt (AG memético).")
+    parser.add_argument('--ls-neighbors', type=int, default=8, help="Tamanho das listas de vizinhos da busca local.")
+    parser.add_argument('--ls-moves', type=int, default=200, help="Máximo de movimentos da busca local por geração.")
+    parser.add_argument('--ls-offspring', type=float, default=0.0, help="Fração dos filhos melhorados pela busca local.")
+    parser.add_argument('--early-stop', action='store_true', help="Para ao convergir, recomeça da elite na estagnação e adapta a mutação à diversidade.")
+    parser.add_argument('--patience', type=int, default=150, help="Gerações sem melhora antes de recomeçar ou parar (com --early-stop).")
+    parser.add_argument('--restarts', type=int, default=1, help="Reinícios a partir da elite antes de parar (com --early-stop).")
+    parser.add_argument('--profile', action='store_true', help="Mede o tempo de cada fase do AG e imprime um resumo ao final.")
+    parser.add_argument('--telemetry', default=None, help="Grava a telemetria por geração em JSONL (ou CSV, se terminar em .csv).")
+    parser.add_argument('--checkpoint', default=None, help="Grava checkpoints (.npz) da execução neste arquivo.")
+    parser.add_argument('--checkpoint-interval', type=int, default=100, help="Gerações entre checkpoints.")
+    parser.add_argument('--resume', default=None, help="Retoma a execução a partir de um checkpoint (.npz).")
+    parser.add_argument('--seed', type=int, default=None, help="Semente dos geradores aleatórios.")
+    parser.add_argument('--output', default='melhor_rota.json', help="Arquivo JSON com a melhor rota e as estatísticas.")
+    parser.add_argument('--history-csv', default=None, help="Arquivo CSV com o histórico de aptidão por geração.")
+    parser.add_argument('--save-points', default=None, help="Salva os pontos usados (útil quando são gerados).")
+    args = parser.parse_args(argv)
+    if args.islands and (args.checkpoint or args.resume):
+        parser.error("--checkpoint e --resume não são suportados com --islands")
+    if args.islands and args.early_stop:
+        parser.error("--early-stop não é suportado com --islands")
+    if args.islands and args.seeding:
+        parser.error("--seeding não é suportado com --islands")
+    if args.split and args.islands:
+        parser.error("--split não é suportado com --islands")
+    if args.split and args.local_search:
+        parser.error("--split não é suportado com --local-search (a busca local mede o ciclo da rota gigante)")
+    return args
+
+def main(argv=None):
+    """Carrega ou gera os pontos, roda o AG e grava os resultados."""
+    args = parse_args(argv)
+    if args.seed is not None:
+        random.seed(args.seed)
+        np.random.seed(args.seed)
+    rng = np.random.default_rng(args.seed)
+
+    resume = load_checkpoint(args.resume) if args.resume else None
+    if resume is not None:
+        points = resume.points
+    else:
+        points = load_points(args.points) if args.points else generate_points(args.num_points)
+    if args.save_points:
+        save_points(points, args.save_points)
+    fleet = Fleet(args.capacity, args.vehicles or None, args.depot) if args.split else None
+    if resume is not None:
+        fleet = checkpoint_fleet(resume, fleet)
+    distance_matrix = DistanceMatrix(points, dtype=np.float32 if args.float32 else np.float64, fleet=fleet)
+
+    if args.islands:
+        # Importado só aqui: o modelo de ilhas puxa `multiprocessing` e memória compartilhada, que o caminho comum
+        # (um processo, uma população) não usa
+        from islands import IslandModel
+        with IslandModel(distance_matrix, args.islands, args.population, args.mutation,
+                         migration_interval=args.migration_interval, topology=args.topology, seed=args.seed) as model:
+            result = model.run(args.generations, args.time_budget)
+    else:
+        local_search = None
+        if args.local_search:
+            local_search = LocalSearch(distance_matrix, neighbors=args.ls_neighbors, max_moves=args.ls_moves,
+                                       offspring_fraction=args.ls_offspring, rng=rng)
+        if resume is not None:
+            population = restore_population(resume, distance_matrix, args.engine)
+        else:
+            population = create_population(args.engine, args.population, distance_matrix, rng, args.seeding,
+                                               args.random_fraction)
+        profiler = NULL_PROFILER
+        if args.profile or args.telemetry:
+            profiler = Profiler(enabled=True, window=max(args.generations, 1),
+                                writer=TelemetryWriter(args.telemetry) if args.telemetry else None)
+        convergence = None
+        if args.early_stop:
+            convergence = ConvergenceController(patience=args.patience, max_restarts=args.restarts)
+        try:
+            result = run_solver(population, distance_matrix, args.mutation, args.generations, args.time_budget,
+                                local_search, profiler, args.checkpoint, args.checkpoint_interval, resume, convergence,
+                                points)
+        finally:
+            profiler.close()
+        if args.profile:
+            print("Tempo médio por geração (ms):")
+            for name, milliseconds in profiler.phase_ms().items():
+                print(f"  {name:<14} {milliseconds:8.3f}")
+
+    summary = {key: value for key, value in result.items() if not key.endswith('_history')}
+    summary.update({
+        'num_points': len(points),
+        'population_size': len(resume.routes) if resume is not None else args.population,
+        'mutation_rate': args.mutation,
+        'engine': 'islands' if args.islands else args.engine,
+        'islands': args.islands,
+        'local_search': args.local_search,
+        'seeding': args.seeding,
+        'fleet': distance_matrix.fleet._asdict() if distance_matrix.fleet is not None else None,
+        'seed': args.seed,
+    })
+    with open(args.output, 'w', encoding='utf-8') as f:
+        json.dump(summary, f, indent=2)
+    if args.history_csv:
+        write_history_csv(result, args.history_csv)
+
+    print(f"{result['generations']} gerações em {result['elapsed_seconds']:.2f}s "
+          f"({result['generations_per_second']:.1f} ger/s) - distância da melhor rota: {result['route_length']:.2f}"
+          + (f" em {len(result['trips'])} viagens" if result.get('trips') else ""))
+    return 0
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,270 @@
+"""Varredura de parâmetros do AG (população, mutação, gerações e tamanho do torneio) em um pool de processos.
+
+Uso: `python -m sweep --num-points 50 --population 20 50 100 --mutation 0.01 0.05 0.1 --generations 500 --pool-size 3 5 --seeds 3`
+"""
+
+import argparse
+import csv
+import hashlib
+import itertools
+import json
+import multiprocessing
+import os
+import random
+import statistics
+import sys
+import time
+from collections import namedtuple
+
+import numpy as np
+
+from ga_classes import DistanceMatrix
+from point_data import PointStore, generate_points, load_points
+from solver import create_population
+
+PARAMETERS = ('population_size', 'mutation_rate', 'num_generations', 'pool_size')
+
+# Uma célula da varredura é uma configuração rodada com uma semente
+SweepConfig = namedtuple('SweepConfig', PARAMETERS)
+
+SUMMARY_FIELDS = PARAMETERS + (
+    'runs', 'mean_cost', 'std_cost', 'best_cost', 'mean_distance', 'hits', 'median_seconds_to_target',
+    'median_generations_to_target', 'generations_per_second',
+)
+
+def grid_configs(population_sizes, mutation_rates, generations, pool_sizes):
+    """Todas as combinações dos valores; torneios maiores que a população são descartados."""
+    return [
+        SweepConfig(*values)
+        for values in itertools.product(population_sizes, mutation_rates, generations, pool_sizes)
+        if values[3] <= values[0]
+    ]
+
+def sample_configs(configs, samples, seed=None):
+    """Amostra aleatória de `samples` configurações da grade, na ordem da grade (todas, se `samples` for None)."""
+    if samples is None or samples >= len(configs):
+        return list(configs)
+    chosen = sorted(random.Random(seed).sample(range(len(configs)), samples))
+    return [configs[index] for index in chosen]
+
+def points_digest(points):
+    """Hash SHA-256 do array de pontos, para que o cache nunca misture resultados de instâncias diferentes."""
+    return hashlib.sha256(np.ascontiguousarray(points.data).tobytes()).hexdigest()
+
+def cell_key(digest, engine, config, seed):
+    """Chave de uma célula no cache: pontos, implementação, parâmetros e semente."""
+    payload = json.dumps({'points': digest, 'engine': engine, 'config': list(config), 'seed': seed})
+    return hashlib.sha256(payload.encode('utf-8')).hexdigest()
+
+def run_cell(engine, config, seed, distance_matrix):
+    """Roda uma configuração com uma semente e retorna custo e distância finais, tempo, ger/s e a trajetória.
+
+    A trajetória guarda `(segundos, geração, custo)` a cada melhora do melhor custo (distância + penalidades), o que
+    basta para calcular o tempo até qualquer alvo depois, sem rodar a célula de novo.
+    """
+    random.seed(seed)
+    np.random.seed(seed)
+    population = create_population(engine, config.population_size, distance_matrix, np.random.default_rng(seed))
+    best_cost = 1 / population.stats.best_fitness - 1
+    trajectory = [(0.0, 0, best_cost)]
+    start = time.perf_counter()
+    for generation in range(1, config.num_generations + 1):
+        population.evolve(config.mutation_rate, distance_matrix, pool_size=config.pool_size)
+        cost = 1 / population.stats.best_fitness - 1
+        if cost < best_cost:
+            best_cost = cost
+            trajectory.append((time.perf_counter() - start, generation, cost))
+    elapsed = time.perf_counter() - start
+    return {
+        'final_cost': best_cost,
+        'final_distance': distance_matrix.route_length(population.get_fittest().route),
+        'seconds': elapsed,
+        'generations_per_second': config.num_generations / elapsed if elapsed > 0 else 0.0,
+        'trajectory': trajectory,
+    }
+
+# Matriz de distâncias de cada processo do pool, montada uma única vez pelo inicializador
+_worker_matrix = None
+
+def _init_worker(data, bounds):
+    """Inicializador do pool: reconstrói os pontos e a matriz de distâncias no processo."""
+    global _worker_matrix
+    _worker_matrix = DistanceMatrix(PointStore(data, bounds))
+
+def _run_task(task):
+    """Executa uma célula no processo do pool e devolve o registro completo."""
+    key, digest, engine, config, seed = task
+    record = {'key': key, 'points': digest, 'engine': engine, 'seed': seed, **config._asdict()}
+    record.update(run_cell(engine, config, seed, _worker_matrix))
+    return record
+
+def load_cache(path):
+    """Lê os registros já concluídos (JSONL, um por célula), indexados pela chave."""
+    cache = {}
+    if not path or not os.path.exists(path):
+        return cache
+    with open(path, encoding='utf-8') as f:
+        for line in f:
+            try:
+                record = json.loads(line)
+            except json.JSONDecodeError:
+                # Última linha cortada por uma interrupção no meio da gravação
+                continue
+            cache[record['key']] = record
+    return cache
+
+def open_cache(path):
+    """Abre o cache para acrescentar registros, completando a última linha se uma interrupção a deixou cortada."""
+    cache_file = open(path, 'a+', encoding='utf-8')
+    if cache_file.tell():
+        cache_file.seek(cache_file.tell() - 1)
+        if cache_file.read(1) != '\n':
+            cache_file.write('\n')
+    return cache_file
+
+def run_sweep(points, configs, seeds, engine='list', processes=None, cache_path=None):
+    """Roda todas as células (configuração × semente) que ainda não estão no cache, em um pool de processos.
+
+    Cada célula concluída é acrescentada ao cache assim que termina, então uma varredura interrompida retoma
+    calculando só as que faltam. Retorna os registros de todas as células pedidas e quantas foram calculadas agora.
+    """
+    digest = points_digest(points)
+    cache = load_cache(cache_path)
+    records = []
+    tasks = []
+    for config in configs:
+        for seed in seeds:
+            key = cell_key(digest, engine, config, seed)
+            if key in cache:
+                records.append(cache[key])
+            else:
+                tasks.append((key, digest, engine, config, seed))
+    if not tasks:
+        return records, 0
+
+    initargs = (np.ascontiguousarray(points.data), points.bounds)
+    cache_file = open_cache(cache_path) if cache_path else None
+    pool = None
+    try:
+        if processes == 1:
+            _init_worker(*initargs)
+            results = map(_run_task, tasks)
+        else:
+            pool = multiprocessing.get_context().Pool(processes, initializer=_init_worker, initargs=initargs)
+            results = pool.imap_unordered(_run_task, tasks)
+        for record in results:
+            records.append(record)
+            if cache_file is not None:
+                cache_file.write(json.dumps(record) + '\n')
+                cache_file.flush()
+        if pool is not None:
+            pool.close()
+            pool.join()
+    finally:
+        if pool is not None:
+            pool.terminate()
+        if cache_file is not None:
+            cache_file.close()
+    return records, len(tasks)
+
+def time_to_target(trajectory, target):
+    """Primeiro `(segundos, geração)` em que o melhor custo atingiu `target`, ou `(None, None)`."""
+    for seconds, generation, cost in trajectory:
+        if cost <= target:
+            return seconds, generation
+    return None, None
+
+def summarize(records, target=None, target_gap=0.05):
+    """Agrega as sementes de cada configuração, da melhor para a pior pelo custo médio final.
+
+    O alvo do tempo até o alvo é `target` ou, se omitido, o melhor custo da varredura acrescido de `target_gap`.
+    Retorna o alvo usado e as linhas da tabela.
+    """
+    if target is None:
+        target = min(record['final_cost'] for record in records) * (1 + target_gap)
+    groups = {}
+    for record in records:
+        groups.setdefault(SweepConfig(*(record[name] for name in PARAMETERS)), []).append(record)
+    rows = []
+    for config, runs in groups.items():
+        costs = [run['final_cost'] for run in runs]
+        reached = [time_to_target(run['trajectory'], target) for run in runs]
+        reached = [hit for hit in reached if hit[0] is not None]
+        rows.append({
+            **config._asdict(),
+            'runs': len(runs),
+            'mean_cost': statistics.fmean(costs),
+            'std_cost': statistics.pstdev(costs),
+            'best_cost': min(costs),
+            'mean_distance': statistics.fmean(run['final_distance'] for run in runs),
+            'hits': len(reached),
+            'median_seconds_to_target': statistics.median(hit[0] for hit in reached) if reached else None,
+            'median_generations_to_target': statistics.median(hit[1] for hit in reached) if reached else None,
+            'generations_per_second': statistics.fmean(run['generations_per_second'] for run in runs),
+        })
+    rows.sort(key=lambda row: row['mean_cost'])
+    return target, rows
+
+def write_summary_csv(rows, path):
+    """Grava a tabela agregada em CSV."""
+    with open(path, 'w', newline='', encoding='utf-8') as f:
+        writer = csv.DictWriter(f, fieldnames=SUMMARY_FIELDS)
+        writer.writeheader()
+        writer.writerows(rows)
+
+def parse_args(argv):
+    """Lê os parâmetros da linha de comando."""
+    parser = argparse.ArgumentParser(description="Varredura de parâmetros do AG em um pool de processos.")
+    source = parser.add_mutually_exclusive_group()
+    source.add_argument('--points', help="Arquivo de pontos (.json, .csv, TSPLIB .tsp/.vrp ou .npy).")
+    source.add_argument('--num-points', type=int, default=50, help="Quantidade de pontos aleatórios a gerar.")
+    parser.add_argument('--points-seed', type=int, default=0, help="Semente dos pontos gerados (fixa, para o cache valer entre execuções).")
+    parser.add_argument('--population', type=int, nargs='+', default=[20, 50, 100], help="Tamanhos de população.")
+    parser.add_argument('--mutation', type=float, nargs='+', default=[0.01, 0.05, 0.1], help="Taxas de mutação.")
+    parser.add_argument('--generations', type=int, nargs='+', default=[500], help="Números de gerações.")
+    parser.add_argument('--pool-size', type=int, nargs='+', default=[3, 5], help="Tamanhos do torneio de seleção.")
+    parser.add_argument('--samples', type=int, default=None, help="Roda só uma amostra aleatória desta quantidade de configurações da grade.")
+    parser.add_argument('--sample-seed', type=int, default=0, help="Semente da amostra de configurações.")
+    parser.add_argument('--seeds', type=int, default=3, help="Execuções (sementes 0..N-1) por configuração.")
+    parser.add_argument('--engine', choices=['list', 'array', 'steady'], default='list', help="Implementação da população.")
+    parser.add_argument('--processes', type=int, default=None, help="Processos do pool (padrão: todos os núcleos).")
+    parser.add_argument('--cache', default='varredura_cache.jsonl', help="Arquivo JSONL com as células já concluídas.")
+    parser.add_argument('--target', type=float, default=None, help="Custo alvo do tempo até o alvo.")
+    parser.add_argument('--target-gap', type=float, default=0.05, help="Sem --target, o alvo é o melhor custo da varredura mais esta fração.")
+    parser.add_argument('--output', default='varredura.csv', help="Arquivo CSV com a tabela agregada.")
+    parser.add_argument('--top', type=int, default=10, help="Linhas da tabela impressas no terminal.")
+    return parser.parse_args(argv)
+
+def main(argv=None):
+    """Monta a grade, roda as células que faltam e grava a tabela de resultados."""
+    args = parse_args(argv)
+    if args.points:
+        points = load_points(args.points)
+    else:
+        random.seed(args.points_seed)
+        points = generate_points(args.num_points)
+    configs = sample_configs(grid_configs(args.population, args.mutation, args.generations, args.pool_size),
+                             args.samples, args.sample_seed)
+    if not configs:
+        print("Nenhuma configuração válida (o torneio não pode ser maior que a população).")
+        return 1
+
+    start = time.perf_counter()
+    records, computed = run_sweep(points, configs, range(args.seeds), args.engine, args.processes, args.cache)
+    print(f"{len(configs)} configurações × {args.seeds} sementes: {computed} células calculadas em "
+          f"{time.perf_counter() - start:.1f}s, {len(records) - computed} do cache")
+
+    target, rows = summarize(records, args.target, args.target_gap)
+    write_summary_csv(rows, args.output)
+    print(f"Alvo do tempo até o alvo: custo {target:.2f}")
+    print(f"{'pop':>5} {'mutação':>7} {'gerações':>8} {'torneio':>7} {'custo_médio':>11} {'desvio':>8} "
+          f"{'alvo':>5} {'t_alvo':>8} {'ger/s':>8}")
+    for row in rows[:args.top]:
+        seconds = f"{row['median_seconds_to_target']:.2f}s" if row['hits'] else '-'
+        print(f"{row['population_size']:>5} {row['mutation_rate']:>7.3f} {row['num_generations']:>8} "
+              f"{row['pool_size']:>7} {row['mean_cost']:>11.1f} {row['std_cost']:>8.1f} "
+              f"{row['hits']:>2}/{row['runs']:<2} {seconds:>8} {row['generations_per_second']:>8.1f}")
+    return 0
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,27 @@
+"""Seleção e evolução da `ArrayPopulation`."""
+
+import random
+
+import numpy as np
+
+from ga_classes import ArrayPopulation, DistanceMatrix
+from point_data import generate_points
+
+def make_population(size, seed=0):
+    """População vetorizada de 30 pontos com sementes fixas."""
+    random.seed(seed)
+    return ArrayPopulation(size, DistanceMatrix(generate_points(30)), rng=np.random.default_rng(seed))
+
+def test_tournament_pools_have_distinct_competitors():
+    """Com `pool_size` igual à população, cada torneio tem todos os indivíduos e o vencedor é sempre o melhor."""
+    population = make_population(8)
+    winners = population.select_parents_tournament(500, pool_size=8)
+    assert (winners == population.fitness.argmax()).all()
+
+def test_tournament_winners_are_valid_rows():
+    """Os vencedores são linhas da população e torneios pequenos também escolhem indivíduos piores."""
+    population = make_population(200)
+    winners = population.select_parents_tournament(1000)
+    assert winners.shape == (1000,)
+    assert ((winners >= 0) & (winners < 200)).all()
+    assert len(np.unique(winners)) > 10
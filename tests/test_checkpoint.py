@@ -0,0 +1,26 @@
+"""Retomada de checkpoints com a divisão em viagens (`--split`)."""
+
+import json
+import warnings
+
+import solver
+
+def run(tmp_path, name, *argv):
+    """Roda o solver com `argv` e retorna o JSON de saída."""
+    output = tmp_path / f"{name}.json"
+    assert solver.main([*argv, '--output', str(output)]) == 0
+    return json.loads(output.read_text(encoding='utf-8'))
+
+def test_resume_with_split_keeps_depot_and_distance(tmp_path):
+    """O depósito padrão e a distância da melhor rota são os mesmos antes e depois de retomar."""
+    checkpoint = str(tmp_path / 'ga.npz')
+    original = run(tmp_path, 'original', '--num-points', '40', '--generations', '30', '--split', '--seed', '3',
+                   '--checkpoint', checkpoint)
+    with warnings.catch_warnings():
+        # Uma frota diferente da gravada descartaria os custos com um aviso
+        warnings.simplefilter('error')
+        resumed = run(tmp_path, 'resumed', '--resume', checkpoint, '--generations', '30', '--split')
+    assert resumed['fleet']['depot'] == original['fleet']['depot']
+    assert resumed['route'] == original['route']
+    assert resumed['route_length'] == original['route_length']
+    assert resumed['trips'] == original['trips']
@@ -0,0 +1,76 @@
+"""Divisão da rota gigante em viagens (`fleet.py`) e custos com frota."""
+
+import itertools
+
+import numpy as np
+import pytest
+
+from fleet import split_tour, split_tours, tour_trips
+from ga_classes import (CAPACITY_PENALTY_FACTOR, VEHICLE_PENALTY_FACTOR, DistanceMatrix, Fleet, Individual,
+                        batch_costs)
+from point_data import PointStore
+
+def random_instance(n, seed):
+    """Matriz com frota para `n` pontos aleatórios de volume 1 a 10, com depósito no centro."""
+    rng = np.random.default_rng(seed)
+    points = PointStore.from_arrays(rng.random((n, 2)) * 100, np.zeros(n, dtype=np.int8), rng.integers(1, 11, n))
+    return DistanceMatrix(points, fleet=Fleet(capacity=15))
+
+def brute_force_split(route, distance_matrix, capacity):
+    """Menor distância entre todos os cortes possíveis da rota, com viagens que cabem no veículo."""
+    matrix, depot, volumes = distance_matrix.matrix, distance_matrix.depot_distances, distance_matrix.volumes
+    n = len(route)
+    best = float('inf')
+    for cuts in itertools.product((False, True), repeat=n - 1):
+        starts = [0] + [k + 1 for k, cut in enumerate(cuts) if cut]
+        trips = tour_trips(route, starts)
+        if any(len(trip) > 1 and volumes[trip].sum() > capacity for trip in trips):
+            continue
+        length = sum(depot[trip[0]] + depot[trip[-1]] + sum(matrix[a, b] for a, b in zip(trip, trip[1:]))
+                     for trip in trips)
+        best = min(best, length)
+    return best
+
+@pytest.mark.parametrize('seed', range(10))
+def test_split_matches_brute_force(seed):
+    """O split linear encontra a mesma distância mínima que testar todos os cortes."""
+    distance_matrix = random_instance(9, seed)
+    route = np.random.default_rng(seed).permutation(9)
+    split = distance_matrix.split(route)
+    assert split.length == pytest.approx(brute_force_split(route, distance_matrix, 15))
+    trips = tour_trips(route, split.starts)
+    assert [city for trip in trips for city in trip] == route.tolist()
+    assert all(distance_matrix.volumes[trip].sum() <= 15 for trip in trips)
+    assert split.overload == 0
+
+def test_oversized_stop_travels_alone():
+    """Uma parada acima da capacidade forma uma viagem sozinha e o excesso volta em `overload`."""
+    points = PointStore.from_arrays([[0, 10], [0, 20], [0, 30]], np.zeros(3, dtype=np.int8), [5, 40, 5])
+    distance_matrix = DistanceMatrix(points, fleet=Fleet(capacity=15, depot=(0, 0)))
+    split = distance_matrix.split([0, 1, 2])
+    assert distance_matrix.trips([0, 1, 2]) == [[0], [1], [2]]
+    assert split.overload == pytest.approx(25)
+    assert split.length == pytest.approx(2 * (10 + 20 + 30))
+
+def test_batch_split_matches_single_split():
+    """A divisão em lote dá o mesmo resultado que dividir cada rota separadamente."""
+    distance_matrix = random_instance(40, 0)
+    routes = np.random.default_rng(1).permuted(np.tile(np.arange(40), (5, 1)), axis=1)
+    args = (distance_matrix.matrix, distance_matrix.depot_distances, distance_matrix.volumes, 15)
+    for route, split in zip(routes, split_tours(routes, *args)):
+        assert split == split_tour(route, *args)
+
+def test_vehicle_limit_is_penalized():
+    """Cada viagem além de `vehicles` soma `VEHICLE_PENALTY_FACTOR`, com os mesmos custos em lote e por indivíduo."""
+    distance_matrix = random_instance(30, 2)
+    limited = DistanceMatrix(PointStore.from_arrays(distance_matrix.coords, distance_matrix.priorities,
+                                                    distance_matrix.volumes),
+                             fleet=Fleet(capacity=15, vehicles=3, depot=distance_matrix.fleet.depot))
+    route = np.arange(30)
+    trips = len(limited.split(route).starts)
+    individual = Individual(list(route), limited)
+    assert individual.capacity_penalty == pytest.approx(max(trips - 3, 0) * VEHICLE_PENALTY_FACTOR
+                                                        + limited.split(route).overload * CAPACITY_PENALTY_FACTOR)
+    lengths, capacity, _ = batch_costs(route[None], limited)
+    assert lengths[0] == pytest.approx(individual.route_length)
+    assert capacity[0] == pytest.approx(individual.capacity_penalty)
@@ -0,0 +1,66 @@
+"""Modelo de ilhas (`islands.py`): memória compartilhada, migração e execução em processos."""
+
+import random
+
+import numpy as np
+import pytest
+
+from ga_classes import ArrayPopulation, DistanceMatrix
+from islands import IslandModel, attach_distance_matrix, share_distance_matrix
+from point_data import generate_points
+
+def make_matrix(n=30):
+    """Matriz de distâncias de `n` pontos gerados com semente fixa."""
+    random.seed(0)
+    return DistanceMatrix(generate_points(n))
+
+def test_shared_matrix_round_trip():
+    """A matriz reconstruída sobre a memória compartilhada tem os mesmos arrays da original."""
+    distance_matrix = make_matrix()
+    blocks, spec = share_distance_matrix(distance_matrix)
+    try:
+        attached, attached_blocks = attach_distance_matrix(spec)
+        np.testing.assert_array_equal(attached.matrix, distance_matrix.matrix)
+        np.testing.assert_array_equal(attached.volumes, distance_matrix.volumes)
+        assert attached.route_length(np.arange(30)) == distance_matrix.route_length(np.arange(30))
+        del attached
+        for block in attached_blocks:
+            block.close()
+    finally:
+        for block in blocks:
+            block.close()
+            block.unlink()
+
+@pytest.mark.parametrize('topology', ['ring', 'random'])
+def test_migration_never_targets_the_source_island(topology):
+    """Na topologia em anel, a ilha i envia para i+1; nas duas, nenhuma ilha envia para si mesma."""
+    model = IslandModel(make_matrix(), num_islands=5, topology=topology, seed=0)
+    for _ in range(20):
+        destinations = model._destinations()
+        assert all(destination != island for island, destination in enumerate(destinations))
+        if topology == 'ring':
+            assert destinations == [1, 2, 3, 4, 0]
+
+def test_immigrants_replace_the_worst_rows():
+    """Os migrantes entram no lugar dos piores indivíduos, e a melhor rota da ilha continua lá."""
+    distance_matrix = make_matrix()
+    population = ArrayPopulation(20, distance_matrix, rng=np.random.default_rng(0))
+    best_route = population.routes[population.fitness.argmax()].copy()
+    worst = set(np.argsort(population.fitness)[:2].tolist())
+    immigrants = np.array([np.arange(30), np.arange(30)[::-1]])
+    population.replace_worst(immigrants)
+    replaced = {row for row in range(20) if (population.routes[row] == immigrants[0]).all()
+                or (population.routes[row] == immigrants[1]).all()}
+    assert replaced == worst
+    assert any((route == best_route).all() for route in population.routes)
+
+def test_island_run_keeps_best_fitness_monotone():
+    """Duas ilhas com migração: o histórico tem uma entrada por geração e a melhor aptidão nunca piora."""
+    distance_matrix = make_matrix()
+    with IslandModel(distance_matrix, num_islands=2, island_size=20, migration_interval=5, seed=0) as model:
+        result = model.run(15)
+    assert result['generations'] == 15
+    assert len(result['best_fitness_history']) == 15
+    assert np.all(np.diff(result['best_fitness_history']) >= 0)
+    assert sorted(result['route']) == list(range(30))
+    assert result['fitness'] == pytest.approx(max(result['best_fitness_history']))
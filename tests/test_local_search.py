@@ -0,0 +1,88 @@
+"""Etapa memética (`LocalSearch`) nas três implementações da população."""
+
+import random
+
+import numpy as np
+import pytest
+
+from ga_classes import ArrayPopulation, DistanceMatrix, Population, SteadyStatePopulation
+from local_search import LocalSearch, nearest_neighbors
+from point_data import PointStore, generate_points
+
+def circle_matrix(n=12):
+    """Pontos em um círculo, sem prioridades: a rota ótima visita os pontos na ordem dos ângulos."""
+    angles = np.linspace(0, 2 * np.pi, n, endpoint=False)
+    coords = np.column_stack((np.cos(angles), np.sin(angles))) * 100
+    return DistanceMatrix(PointStore.from_arrays(coords, np.zeros(n, dtype=np.int8), np.ones(n)))
+
+def test_nearest_neighbors_match_brute_force():
+    """A grade espacial devolve os mesmos vizinhos, na mesma ordem, que ordenar todas as distâncias."""
+    coords = np.random.default_rng(0).random((300, 2)) * [400, 600]
+    distances = np.hypot(*(coords[:, None] - coords[None, :]).transpose(2, 0, 1))
+    np.fill_diagonal(distances, np.inf)
+    np.testing.assert_array_equal(nearest_neighbors(coords, 6), np.argsort(distances, axis=1)[:, :6])
+
+def test_two_opt_removes_crossing():
+    """Uma rota com um trecho invertido (duas arestas cruzadas) volta ao ciclo ótimo."""
+    distance_matrix = circle_matrix()
+    optimal = distance_matrix.route_length(np.arange(12))
+    route = [0, 1, 2, 7, 6, 5, 4, 3, 8, 9, 10, 11]
+    assert distance_matrix.route_length(route) > optimal + 1
+    improved, moves = LocalSearch(distance_matrix, neighbors=4).improve(route)
+    assert moves >= 1
+    assert distance_matrix.route_length(improved) == pytest.approx(optimal)
+
+def test_or_opt_reinserts_displaced_stop():
+    """Uma parada fora do lugar é devolvida para entre os seus vizinhos por um movimento Or-opt."""
+    distance_matrix = circle_matrix()
+    route = [0, 1, 2, 4, 5, 6, 7, 3, 8, 9, 10, 11]
+    local_search = LocalSearch(distance_matrix, neighbors=4)
+    position = [0] * 12
+    for index, city in enumerate(route):
+        position[city] = index
+    candidate, _, _ = local_search._or_opt(route, position, 3, 0)
+    assert distance_matrix.route_length(candidate) < distance_matrix.route_length(route)
+    improved, _ = local_search.improve(route)
+    assert distance_matrix.route_length(improved) == pytest.approx(distance_matrix.route_length(np.arange(12)))
+
+@pytest.mark.parametrize('engine', [Population, SteadyStatePopulation])
+def test_offspring_fraction_applies_to_individual_populations(engine):
+    """Com `offspring_fraction`, além da elite, indivíduos sorteados são melhorados e recebem a aptidão nova."""
+    random.seed(0)
+    np.random.seed(0)
+    distance_matrix = DistanceMatrix(generate_points(60))
+    population = engine(20, distance_matrix)
+    local_search = LocalSearch(distance_matrix, max_moves=10_000, offspring_fraction=0.5,
+                               rng=np.random.default_rng(0))
+    before = [individual.fitness for individual in population.population]
+    improved = local_search.apply_to_individuals(population.population)
+    assert len(improved) > 1
+    for row in improved:
+        individual = population.population[row]
+        assert individual.fitness > before[row]
+        assert sorted(individual.route) == list(range(60))
+
+def test_time_budget_stops_individual_populations():
+    """O prazo da geração também vale para as populações de `Individual`: esgotado, nada é melhorado."""
+    random.seed(0)
+    distance_matrix = DistanceMatrix(generate_points(60))
+    population = Population(20, distance_matrix)
+    local_search = LocalSearch(distance_matrix, time_budget=1e-12, offspring_fraction=1.0)
+    assert local_search.apply_to_individuals(population.population) == []
+
+@pytest.mark.parametrize('engine', ['list', 'steady', 'array'])
+def test_evolve_with_local_search_keeps_costs_consistent(engine):
+    """Depois de `evolve` com busca local, a aptidão guardada é a da rota de cada indivíduo."""
+    random.seed(1)
+    np.random.seed(1)
+    distance_matrix = DistanceMatrix(generate_points(40))
+    rng = np.random.default_rng(1)
+    population = {'list': Population, 'steady': SteadyStatePopulation}.get(engine)
+    population = population(20, distance_matrix) if population else ArrayPopulation(20, distance_matrix, rng=rng)
+    local_search = LocalSearch(distance_matrix, offspring_fraction=0.3, rng=rng)
+    for _ in range(5):
+        population.evolve(0.05, distance_matrix, local_search=local_search)
+    best = population.get_fittest()
+    assert best.fitness == pytest.approx(type(best)(list(best.route), distance_matrix).fitness)
+    if engine == 'steady':
+        assert list(population.fitness) == [individual.fitness for individual in population.population]
@@ -0,0 +1,72 @@
+"""Leitura e gravação dos arquivos de pontos (`load_points` / `save_points`)."""
+
+import random
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+from ga_classes import DistanceMatrix, Fleet
+from point_data import generate_points, load_points, save_points
+
+DATA = Path(__file__).parent / 'data'
+
+def test_tsplib_depot_is_not_a_stop():
+    """O nó de `DEPOT_SECTION` sai das paradas e vira `depot`; as demandas das paradas viram os volumes."""
+    points = load_points(DATA / 'small.vrp')
+    assert len(points) == 4
+    np.testing.assert_array_equal(points.coords, [[10, 20], [90, 20], [90, 80], [10, 80]])
+    np.testing.assert_array_equal(points.volumes, [3, 4.5, 2, 6])
+    assert points.depot == (50.0, 50.0)
+    assert points.bounds == (10.0, 20.0, 90.0, 80.0)
+
+def test_fleet_uses_file_depot():
+    """Sem depósito na frota, a matriz usa o do arquivo; um depósito explícito tem precedência."""
+    points = load_points(DATA / 'small.vrp')
+    assert DistanceMatrix(points, fleet=Fleet(capacity=10)).fleet.depot == (50.0, 50.0)
+    assert DistanceMatrix(points, fleet=Fleet(capacity=10, depot=(0, 0))).fleet.depot == (0.0, 0.0)
+
+def test_tsplib_without_demands(tmp_path):
+    """Sem `DEMAND_SECTION` nem `DEPOT_SECTION`, todo nó é uma parada de volume 1 e prioridade 0."""
+    path = tmp_path / 'instancia.tsp'
+    path.write_text((DATA / 'small.vrp').read_text(encoding='utf-8').split('DEMAND_SECTION')[0], encoding='utf-8')
+    points = load_points(path)
+    assert len(points) == 5
+    np.testing.assert_array_equal(points.volumes, np.ones(5))
+    np.testing.assert_array_equal(points.priorities, np.zeros(5))
+    assert points.depot is None
+
+def test_tsplib_requires_coordinates(tmp_path):
+    """Instâncias só com matriz de pesos explícita não são suportadas."""
+    path = tmp_path / 'pesos.tsp'
+    path.write_text('NAME : pesos\nDIMENSION : 3\nEDGE_WEIGHT_SECTION\n1 2 3\nEOF\n', encoding='utf-8')
+    with pytest.raises(ValueError, match='NODE_COORD_SECTION'):
+        load_points(path)
+
+def test_csv_optional_columns(tmp_path):
+    """No CSV, as colunas podem vir em qualquer ordem; `priority` e `volume` ausentes valem 0 e 1."""
+    path = tmp_path / 'pontos.csv'
+    path.write_text('id,y,x,volume\n7,2.5,1,4\n8,6,3.5,0.5\n', encoding='utf-8')
+    points = load_points(path)
+    np.testing.assert_array_equal(points.coords, [[1, 2.5], [3.5, 6]])
+    np.testing.assert_array_equal(points.volumes, [4, 0.5])
+    np.testing.assert_array_equal(points.priorities, [0, 0])
+
+def test_csv_requires_coordinates(tmp_path):
+    """Um CSV sem `x` ou `y` é recusado com o nome da coluna que falta."""
+    path = tmp_path / 'pontos.csv'
+    path.write_text('x,volume\n1,2\n', encoding='utf-8')
+    with pytest.raises(ValueError, match='y'):
+        load_points(path)
+
+@pytest.mark.parametrize('extension', ['json', 'csv', 'npy'])
+def test_save_and_load_round_trip(tmp_path, extension):
+    """Gravar e carregar de novo preserva coordenadas, prioridades e volumes."""
+    random.seed(0)
+    points = generate_points(25)
+    path = tmp_path / f'pontos.{extension}'
+    save_points(points, path)
+    loaded = load_points(path)
+    np.testing.assert_array_equal(loaded.coords, points.coords)
+    np.testing.assert_array_equal(loaded.priorities, points.priorities)
+    np.testing.assert_array_equal(loaded.volumes, points.volumes)
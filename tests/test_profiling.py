@@ -0,0 +1,19 @@
+"""Telemetria por passo (`TelemetryWriter`)."""
+
+import csv
+
+from profiling import TelemetryWriter
+
+def test_csv_keeps_keys_missing_from_first_record(tmp_path):
+    """Uma fase que só aparece em um passo posterior ganha coluna, e as linhas anteriores ficam vazias nela."""
+    path = tmp_path / 'telemetria.csv'
+    writer = TelemetryWriter(path)
+    writer.write({'generation': 1, 'evolve_ms': 2.0})
+    writer.write({'generation': 2, 'evolve_ms': 1.5, 'checkpoint_ms': 7.0})
+    writer.write({'generation': 3, 'evolve_ms': 1.0})
+    writer.close()
+    with open(path, newline='', encoding='utf-8') as f:
+        rows = list(csv.DictReader(f))
+    assert list(rows[0]) == ['generation', 'evolve_ms', 'checkpoint_ms']
+    assert [row['generation'] for row in rows] == ['1', '2', '3']
+    assert [row['checkpoint_ms'] for row in rows] == ['', '7.0', '']
@@ -0,0 +1,18 @@
+"""Prompt do relatório (`build_report_prompt`)."""
+
+import random
+
+from ga_classes import DistanceMatrix, Fleet, Individual
+from point_data import generate_points
+from report import build_report_prompt
+
+def test_fleet_baseline_splits_sequential_route():
+    """Com frota, a rota não otimizada de comparação é a sequencial dividida em viagens a partir do depósito."""
+    random.seed(0)
+    points = generate_points(40)
+    distance_matrix = DistanceMatrix(points, fleet=Fleet())
+    best = Individual(list(range(40)), distance_matrix)
+    prompt = build_report_prompt(best, points)
+    baseline = distance_matrix.travel_length(list(range(40)))
+    assert f"Distância de uma Rota Não Otimizada (para comparação):** {baseline:.2f} km" in prompt
+    assert baseline > DistanceMatrix(points).route_length(list(range(40)))
@@ -0,0 +1,91 @@
+"""População inicial (`seeding.py`): inicializadores construtivos e giro para um ponto prioritário."""
+
+import random
+
+import numpy as np
+import pytest
+
+from ga_classes import PRIORITY_MAX_POSITION, DistanceMatrix, Fleet, batch_costs, fitness_from_costs
+from local_search import nearest_neighbors
+from point_data import generate_points
+from seeding import (SEEDING_NEIGHBORS, greedy_edge_tour, hilbert_order, nearest_neighbor_tour, rotate_to_priority,
+                     seed_routes)
+
+def few_priority_points(n):
+    """Pontos aleatórios com só dois prioritários, para que a maioria das rotas precise girar."""
+    random.seed(0)
+    points = generate_points(n)
+    points.data['priority'] = 0
+    points.data['priority'][[3, 7]] = 1
+    return points
+
+def random_routes(n, count, seed):
+    """`count` permutações aleatórias de `n` pontos."""
+    return np.random.default_rng(seed).permuted(np.tile(np.arange(n), (count, 1)), axis=1)
+
+def test_rotation_keeps_length_without_fleet():
+    """Sem frota, toda rota passa a começar por um ponto prioritário e o comprimento do ciclo não muda."""
+    distance_matrix = DistanceMatrix(few_priority_points(60))
+    routes = random_routes(60, 30, 0)
+    before = batch_costs(routes, distance_matrix)[0]
+    rotated = rotate_to_priority(routes.copy(), distance_matrix, np.random.default_rng(0))
+    np.testing.assert_allclose(batch_costs(rotated, distance_matrix)[0], before)
+    assert all((distance_matrix.priorities[route[:PRIORITY_MAX_POSITION + 1]] == 1).any() for route in rotated)
+
+def test_rotation_never_raises_fleet_cost():
+    """Com frota, o giro muda os cortes das viagens e só é mantido quando o custo total cai."""
+    distance_matrix = DistanceMatrix(few_priority_points(60), fleet=Fleet())
+    routes = random_routes(60, 30, 1)
+    before = fitness_from_costs(*batch_costs(routes, distance_matrix))
+    rotated = rotate_to_priority(routes.copy(), distance_matrix, np.random.default_rng(0))
+    after = fitness_from_costs(*batch_costs(rotated, distance_matrix))
+    assert (after >= before).all()
+    assert (rotated != routes).any()
+
+def brute_force_nearest_tour(matrix, start):
+    """Vizinho mais próximo varrendo a linha inteira da matriz a cada passo."""
+    route = [start]
+    visited = {start}
+    while len(route) < len(matrix):
+        row = np.where(np.isin(np.arange(len(matrix)), list(visited)), np.inf, matrix[route[-1]])
+        route.append(int(row.argmin()))
+        visited.add(route[-1])
+    return route
+
+def test_nearest_neighbor_tour_matches_brute_force():
+    """Consultar primeiro as listas de vizinhos dá a mesma rota que varrer a matriz inteira."""
+    random.seed(0)
+    distance_matrix = DistanceMatrix(generate_points(80))
+    neighbors = nearest_neighbors(distance_matrix.coords, SEEDING_NEIGHBORS)
+    for start in (0, 17, 79):
+        route = nearest_neighbor_tour(distance_matrix, start, neighbors)
+        assert route.tolist() == brute_force_nearest_tour(distance_matrix.matrix, start)
+
+@pytest.mark.parametrize('initializer', ['greedy', 'hilbert'])
+def test_constructive_tours_beat_random(initializer):
+    """As rotas gulosa e de Hilbert visitam todos os pontos e são bem mais curtas que as aleatórias."""
+    random.seed(0)
+    distance_matrix = DistanceMatrix(generate_points(200))
+    if initializer == 'greedy':
+        route = greedy_edge_tour(distance_matrix, nearest_neighbors(distance_matrix.coords, SEEDING_NEIGHBORS))
+    else:
+        route = hilbert_order(distance_matrix.coords)
+    assert sorted(route.tolist()) == list(range(200))
+    random_length = np.mean(batch_costs(random_routes(200, 20, 0), distance_matrix)[0])
+    assert distance_matrix.route_length(route) < 0.5 * random_length
+
+def test_seed_routes_mixes_constructive_and_random():
+    """`seed_routes` devolve permutações válidas, com a fração pedida de rotas aleatórias ao fim."""
+    random.seed(0)
+    distance_matrix = DistanceMatrix(generate_points(60))
+    routes = seed_routes(distance_matrix, 10, random_fraction=0.4, rng=np.random.default_rng(0))
+    assert routes.shape == (10, 60)
+    assert all(sorted(route) == list(range(60)) for route in routes.tolist())
+    lengths = batch_costs(routes, distance_matrix)[0]
+    assert lengths[:6].max() < lengths[6:].min()
+
+def test_seed_routes_rejects_unknown_initializer():
+    """Nomes fora de `INITIALIZERS` são recusados."""
+    random.seed(0)
+    with pytest.raises(ValueError, match='christofides'):
+        seed_routes(DistanceMatrix(generate_points(10)), 5, methods=('greedy', 'christofides'))
@@ -0,0 +1,42 @@
+"""Demandas fracionárias (por exemplo, de instâncias TSPLIB) na avaliação das rotas."""
+
+import numpy as np
+import pytest
+
+from ga_classes import (CAPACITY_PENALTY_FACTOR, DistanceMatrix, Fleet, Individual, SteadyStatePopulation,
+                        batch_costs)
+from point_data import PointStore
+
+def fractional_points(volume, n=6):
+    """`n` pontos em um círculo, todos com o mesmo volume `volume`."""
+    angles = np.linspace(0, 2 * np.pi, n, endpoint=False)
+    coords = np.column_stack((np.cos(angles), np.sin(angles))) * 10
+    return PointStore.from_arrays(coords, np.zeros(n, dtype=np.int8), np.full(n, volume))
+
+def test_volumes_keep_fractions():
+    """Os volumes da matriz são os do conjunto de pontos, sem truncar as casas decimais."""
+    distance_matrix = DistanceMatrix(fractional_points(0.6))
+    np.testing.assert_array_equal(distance_matrix.volumes, np.full(6, 0.6))
+
+@pytest.mark.parametrize('engine', ['individual', 'batch', 'steady'])
+def test_capacity_penalty_counts_fractional_excess(engine):
+    """Seis paradas de 8.5 somam 51: o excesso de 1 sobre `MAX_CAPACITY` é penalizado em todas as avaliações."""
+    distance_matrix = DistanceMatrix(fractional_points(8.5))
+    route = list(range(6))
+    if engine == 'individual':
+        penalty = Individual(route, distance_matrix).capacity_penalty
+    elif engine == 'batch':
+        penalty = batch_costs(np.array([route]), distance_matrix)[1][0]
+    else:
+        population = SteadyStatePopulation(2, distance_matrix)
+        individual = Individual(route, distance_matrix)
+        population.evaluate_into(individual)
+        penalty = individual.capacity_penalty
+    assert penalty == pytest.approx(1.0 * CAPACITY_PENALTY_FACTOR)
+
+def test_split_respects_fractional_load():
+    """Com capacidade 1, duas paradas de 0.6 não cabem na mesma viagem."""
+    distance_matrix = DistanceMatrix(fractional_points(0.6), fleet=Fleet(capacity=1))
+    split = distance_matrix.split(np.arange(6))
+    assert len(split.starts) == 6
+    assert split.overload == 0
@@ -2,6 +2,7 @@
 
 import pygame
 from helpers import PALETTE
+from render_cache import get_font
 
 screen = None
 
@@ -12,25 +13,35 @@ class Button:
         self.rect = pygame.Rect(rect)
         self.text = text
         self.action = action
-        self.font = pygame.font.Font(None, 24)
+        self.font_size = 24
         self.color = PALETTE["secondary"]
         self.disabled_color = (200, 200, 200)
         self.disabled = False
+        self._surfaces = {}
 
     def draw(self, screen):
         """Desenha o botão na tela, com aparência de desabilitado se necessário."""
+        key = (self.text, self.disabled)
+        if key not in self._surfaces:
+            self._surfaces[key] = self._render()
+        screen.blit(self._surfaces[key], self.rect.topleft)
+
+    def _render(self):
+        """Pré-renderiza o botão (sombra, fundo, borda e texto) para o estado atual."""
         bg_color = self.disabled_color if self.disabled else self.color
         text_color = (100, 100, 100) if self.disabled else PALETTE["text_dark"]
         border_color = (150, 150, 150) if self.disabled else PALETTE["text_dark"]
 
-        shadow_rect = self.rect.copy()
-        shadow_rect.move_ip(2, 2)
-        pygame.draw.rect(screen, PALETTE["shadow"], shadow_rect, border_radius=10)
-        pygame.draw.rect(screen, bg_color, self.rect, border_radius=10)
-        pygame.draw.rect(screen, border_color, self.rect, 2, border_radius=10)
-        text_surface = self.font.render(self.text, True, text_color)
-        text_rect = text_surface.get_rect(center=self.rect.center)
-        screen.blit(text_surface, text_rect)
+        surface = pygame.Surface((self.rect.width + 2, self.rect.height + 2), pygame.SRCALPHA)
+        local_rect = pygame.Rect(0, 0, self.rect.width, self.rect.height)
+        shadow_rect = local_rect.move(2, 2)
+        pygame.draw.rect(surface, PALETTE["shadow"], shadow_rect, border_radius=10)
+        pygame.draw.rect(surface, bg_color, local_rect, border_radius=10)
+        pygame.draw.rect(surface, border_color, local_rect, 2, border_radius=10)
+        text_surface = get_font(self.font_size).render(self.text, True, text_color)
+        text_rect = text_surface.get_rect(center=local_rect.center)
+        surface.blit(text_surface, text_rect)
+        return surface
 
     def is_clicked(self, event):
         """Verifica se o botão foi clicado, retornando False se estiver desabilitado."""
@@ -53,6 +64,13 @@ class Slider:
         self.handle_rect = pygame.Rect(self.handle_pos - 10, y - 5, 20, h + 10)
         self.is_dragging = False
 
+    def set_value(self, value):
+        """Define o valor por código (por exemplo, ao retomar um checkpoint), movendo a alça para a posição correspondente."""
+        self.val = value
+        fraction = min(max((value - self.min_val) / (self.max_val - self.min_val), 0), 1)
+        self.handle_pos = self.rect.x + self.rect.width * fraction
+        self.handle_rect.centerx = self.handle_pos
+
     def draw(self, screen):
         """Desenha o slider na tela."""
         pygame.draw.rect(screen, PALETTE["shadow"], self.rect, border_radius=5)
@@ -0,0 +1,84 @@
+"""Reotimização incremental ("warm start"): adapta uma população já evoluída quando os pontos ou o tamanho mudam."""
+
+import numpy as np
+
+from ga_classes import ArrayPopulation, batch_costs, fitness_from_costs, population_arrays
+
+def insert_cities(routes, cities, matrix):
+    """Insere cada cidade nova em todas as rotas `(pop_size, n)` na posição de menor acréscimo de distância.
+
+    As cidades são inseridas uma a uma (inserção mais barata), vetorizado sobre a população inteira.
+    """
+    routes = np.asarray(routes)
+    rows = np.arange(len(routes))
+    for city in cities:
+        size = routes.shape[1]
+        following = np.roll(routes, -1, axis=1)
+        added = matrix[routes, city] + matrix[city, following] - matrix[routes, following]
+        position = added.argmin(axis=1)
+        # Cada linha ganha `city` logo depois de `position`; as colunas seguintes andam uma casa
+        columns = np.arange(size + 1)[None, :]
+        source = np.where(columns <= position[:, None], columns, columns - 1)
+        expanded = np.take_along_axis(routes, np.clip(source, 0, size - 1), axis=1)
+        expanded[rows, position + 1] = city
+        routes = expanded
+    return routes
+
+def remove_cities(routes, removed, num_points):
+    """Retira as cidades `removed` de todas as rotas e renumera as restantes para os índices da lista reduzida."""
+    routes = np.asarray(routes)
+    keep = np.ones(num_points, dtype=bool)
+    keep[list(removed)] = False
+    new_index = np.cumsum(keep) - 1
+    remaining = routes[keep[routes]].reshape(len(routes), -1)
+    return new_index[remaining].astype(routes.dtype)
+
+def perturbed_copies(routes, count, rng):
+    """Gera `count` cópias das rotas (em ordem, recomeçando se preciso), cada uma com um trecho aleatório invertido."""
+    routes = np.asarray(routes)
+    copies = routes[np.arange(count) % len(routes)].copy()
+    n = copies.shape[1]
+    if n < 3:
+        return copies
+    for copy in copies:
+        start, end = np.sort(rng.choice(n, 2, replace=False))
+        copy[start:end + 1] = copy[start:end + 1][::-1]
+    return copies
+
+def rebuild_population(population, routes, distance_matrix, costs=None):
+    """Cria uma população do mesmo tipo de `population` com as rotas dadas (e recalcula os custos se preciso)."""
+    if costs is None:
+        costs = batch_costs(np.asarray(routes), distance_matrix)
+    if isinstance(population, ArrayPopulation):
+        return ArrayPopulation.from_routes(routes, distance_matrix, costs=costs, rng=population.rng)
+    return type(population).from_routes(routes, distance_matrix, costs=costs)
+
+def resize_population(population, size, distance_matrix, rng=None):
+    """Muda o tamanho da população mantendo os mais aptos e completando com cópias perturbadas deles."""
+    rng = np.random.default_rng() if rng is None else rng
+    routes, lengths, capacity, priority = population_arrays(population)
+    order = np.argsort(-fitness_from_costs(lengths, capacity, priority), kind='stable')
+    kept = order[:size]
+    routes, costs = routes[kept], (lengths[kept], capacity[kept], priority[kept])
+    if size <= len(kept):
+        return rebuild_population(population, routes, distance_matrix, costs)
+    copies = perturbed_copies(routes, size - len(routes), rng)
+    copy_costs = batch_costs(copies, distance_matrix)
+    costs = tuple(np.concatenate([kept_component, copy_component]) for kept_component, copy_component in zip(costs, copy_costs))
+    return rebuild_population(population, np.concatenate([routes, copies]), distance_matrix, costs)
+
+def add_points(population, distance_matrix, num_new):
+    """Adapta a população a `num_new` pontos acrescentados ao fim da lista, por inserção mais barata.
+
+    `distance_matrix` já deve incluir os pontos novos (índices `n - num_new` a `n - 1`).
+    """
+    routes = population_arrays(population)[0]
+    first_new = len(distance_matrix) - num_new
+    routes = insert_cities(routes, range(first_new, len(distance_matrix)), distance_matrix.matrix)
+    return rebuild_population(population, routes, distance_matrix)
+
+def remove_points(population, distance_matrix, removed):
+    """Adapta a população à remoção dos pontos `removed` (índices antigos); `distance_matrix` é a da lista reduzida."""
+    routes = population_arrays(population)[0]
+    routes = remove_cities(routes, removed, routes.shape[1])
+    return rebuild_population(population, routes, distance_matrix)